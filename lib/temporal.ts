@@ -630,6 +630,7 @@ export interface AllFeedsIngestionProgress extends WorkflowProgress {
   currentBatch: number;
   totalBatches: number;
   entriesCreated: number;
+  entriesSkipped: number;
   contentsFetched: number;
   entriesDistilled: number;
 }
@@ -58,6 +58,7 @@ from buun_curator.activities.graph_rag_session import (
     add_to_graph_rag_session,
     build_graph_rag_graph,
     close_graph_rag_session,
+    get_graph_rag_session_state,
     reset_graph_rag_session,
     search_graph_rag_session,
 )
@@ -75,6 +76,7 @@ from buun_curator.activities.search import (
     init_search_index,
     remove_documents_from_index,
     update_entry_index,
+    wait_for_search_task,
 )
 from buun_curator.activities.translate import (
     get_entries_for_translation,
@@ -96,6 +98,7 @@ __all__ = [
     "add_to_graph_rag_session",
     "build_graph_rag_graph",
     "close_graph_rag_session",
+    "get_graph_rag_session_state",
     "reset_graph_rag_session",
     "search_graph_rag_session",
     # Context extraction
@@ -152,6 +155,7 @@ __all__ = [
     "init_search_index",
     "remove_documents_from_index",
     "update_entry_index",
+    "wait_for_search_task",
     # Evaluation
     "evaluate_ragas",
     "EvaluateRagasInput",
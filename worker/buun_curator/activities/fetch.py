@@ -247,45 +247,38 @@ async def fetch_contents(input: FetchContentsInput) -> FetchContentsOutput:
     # Upload thumbnails to MinIO if enabled
     # REST API supports parallel requests for better performance
     if results:
+        # Upload all thumbnails first over one shared S3 client
+        thumbnail_urls: dict[str, str] = {}
+        if thumbnail_service:
+            screenshots = [
+                (entry_id, content["screenshot"])
+                for entry_id, content in results.items()
+                if entry_id and content.get("screenshot")
+            ]
+            if screenshots:
+                activity.heartbeat(f"Uploading {len(screenshots)} thumbnails")
+                thumbnail_urls = await thumbnail_service.upload_thumbnails_batch(
+                    screenshots, max_concurrency=fetch_concurrency
+                )
+        thumbnail_count = len(thumbnail_urls)
+
         activity.heartbeat(f"Saving {len(results)} contents to DB")
-        thumbnail_count = 0
         total_saves = len(results)
 
         async with APIClient(config.api_url, config.api_token) as api:
 
             async def save_single_entry(entry_id: str, content: dict) -> tuple[str, bool]:
                 """Save a single entry and return success status."""
-                nonlocal thumbnail_count
-
                 # Skip entries with empty ID (defensive check)
                 if not entry_id:
                     logger.warning("Skipping entry with empty ID")
                     return (entry_id, False)
 
-                # Upload screenshot to S3 if available
-                uploaded_thumbnail_url: str = ""
-                screenshot = content.get("screenshot")
-                logger.debug(
-                    f"Entry {entry_id}: "
-                    f"thumbnail_service={thumbnail_service is not None}, "
-                    f"screenshot="
-                    f"{screenshot is not None and len(screenshot) if screenshot else 0} bytes"
-                )
-                if thumbnail_service and screenshot:
-                    try:
-                        uploaded_thumbnail_url = await thumbnail_service.upload_thumbnail(
-                            entry_id, screenshot
-                        )
-                        thumbnail_count += 1
-                        logger.debug(f"Thumbnail uploaded for {entry_id}: {uploaded_thumbnail_url}")
-                    except Exception as e:
-                        logger.warning(f"Failed to upload thumbnail: {e}", entry_id=entry_id)
-
                 await api.update_entry(
                     entry_id,
                     full_content=content["full_content"],
                     raw_html=content["raw_html"],
-                    thumbnail_url=uploaded_thumbnail_url,
+                    thumbnail_url=thumbnail_urls.get(entry_id, ""),
                 )
                 return (entry_id, True)
 
@@ -399,6 +392,8 @@ async def fetch_single_content(input: FetchSingleContentInput) -> FetchSingleCon
         logger.warning("No content extracted", source=source)
         return FetchSingleContentOutput(
             status="no_content",
+            status_code=content.status_code,
+            retry_after_seconds=content.retry_after,
         )
 
     content_length = len(content.full_content)
@@ -416,6 +411,8 @@ async def fetch_single_content(input: FetchSingleContentInput) -> FetchSingleCon
             return FetchSingleContentOutput(
                 status="success",
                 content_length=content_length,
+                status_code=content.status_code,
+                retry_after_seconds=content.retry_after,
             )
         except Exception as e:
             error_msg = str(e)
@@ -424,6 +421,8 @@ async def fetch_single_content(input: FetchSingleContentInput) -> FetchSingleCon
                 status="failed",
                 content_length=content_length,
                 error=error_msg,
+                status_code=content.status_code,
+                retry_after_seconds=content.retry_after,
             )
 
     # Preview mode: return content in output
@@ -431,6 +430,8 @@ async def fetch_single_content(input: FetchSingleContentInput) -> FetchSingleCon
         full_content=content.full_content,
         status="success",
         content_length=content_length,
+        status_code=content.status_code,
+        retry_after_seconds=content.retry_after,
     )
 
 
@@ -16,6 +16,8 @@ from buun_curator.models import (
     BuildGraphRAGGraphOutput,
     CloseGraphRAGSessionInput,
     CloseGraphRAGSessionOutput,
+    GetGraphRAGSessionStateInput,
+    GetGraphRAGSessionStateOutput,
     ResetGraphRAGSessionInput,
     ResetGraphRAGSessionOutput,
     SearchGraphRAGSessionInput,
@@ -132,6 +134,13 @@ async def build_graph_rag_graph(
         # Graphiti builds graph incrementally, so this is a no-op
         await session.build_graph()
 
+        # Record the content the graph was built from, so later runs can reuse it
+        if input.content_hash:
+            try:
+                await GraphitiSession.set_content_hash(input.entry_id, input.content_hash)
+            except Exception as e:
+                logger.warning(f"Failed to record content hash: {e}", entry_id=input.entry_id)
+
         logger.info("Successfully built Graphiti graph", graph_name=session.graph_name)
         return BuildGraphRAGGraphOutput(
             success=True,
@@ -196,6 +205,28 @@ async def search_graph_rag_session(
         )
 
 
+@activity.defn
+async def get_graph_rag_session_state(
+    input: GetGraphRAGSessionStateInput,
+) -> GetGraphRAGSessionStateOutput:
+    """
+    Get the state of an entry's session.
+
+    Parameters
+    ----------
+    input : GetGraphRAGSessionStateInput
+        Entry ID.
+
+    Returns
+    -------
+    GetGraphRAGSessionStateOutput
+        Hash of the content the graph was built from (None if not built).
+    """
+    content_hash = await GraphitiSession.get_content_hash(input.entry_id)
+    logger.debug("Graphiti session state", entry_id=input.entry_id, content_hash=content_hash)
+    return GetGraphRAGSessionStateOutput(content_hash=content_hash)
+
+
 @activity.defn
 async def reset_graph_rag_session(
     input: ResetGraphRAGSessionInput,
@@ -25,6 +25,8 @@ from buun_curator.models import (
     RemoveDocumentsFromIndexOutput,
     UpdateEntryIndexInput,
     UpdateEntryIndexOutput,
+    WaitForSearchTaskInput,
+    WaitForSearchTaskOutput,
 )
 from buun_curator.services.api import APIClient
 from buun_curator.services.search import (
@@ -35,6 +37,7 @@ from buun_curator.services.search import (
     is_meilisearch_enabled,
     remove_entries,
     update_entry,
+    wait_for_task,
 )
 
 logger = get_logger(__name__)
@@ -195,10 +198,10 @@ async def clear_search_index(
         return ClearSearchIndexOutput(success=False, error="Meilisearch not configured")
 
     try:
-        success = await asyncio.to_thread(delete_all_documents)
+        success, task_uid = await asyncio.to_thread(delete_all_documents)
         if success:
-            logger.info("Cleared all documents from search index")
-            return ClearSearchIndexOutput(success=True)
+            logger.info("Enqueued clearing of search index", task_uid=task_uid)
+            return ClearSearchIndexOutput(success=True, task_uid=task_uid)
         else:
             return ClearSearchIndexOutput(success=False, error="Failed to clear index")
     except Exception as e:
@@ -207,6 +210,29 @@ async def clear_search_index(
         return ClearSearchIndexOutput(success=False, error=error_msg)
 
 
+@activity.defn
+async def wait_for_search_task(input: WaitForSearchTaskInput) -> WaitForSearchTaskOutput:
+    """
+    Wait for an enqueued Meilisearch task (e.g. the clear_search_index deletion).
+
+    Parameters
+    ----------
+    input : WaitForSearchTaskInput
+        Input containing the task UID and how long to wait.
+
+    Returns
+    -------
+    WaitForSearchTaskOutput
+        Output containing whether the task succeeded and optional error.
+    """
+    success, error = await asyncio.to_thread(
+        wait_for_task, input.task_uid, timeout=input.timeout_seconds
+    )
+    if success:
+        logger.info("Meilisearch task succeeded", task_uid=input.task_uid)
+    return WaitForSearchTaskOutput(success=success, error=error)
+
+
 @activity.defn
 async def get_orphaned_document_ids(
     input: GetOrphanedDocumentIdsInput,
@@ -139,10 +139,17 @@ DEFAULT_S3_REGION = "us-east-1"
 
 # Concurrency
 DEFAULT_FEED_INGESTION_CONCURRENCY = 5
+DEFAULT_FEED_INGESTION_COARSE_PROGRESS = False
+DEFAULT_CONTEXT_EXTRACTION_CONCURRENCY = 5
+DEFAULT_DOMAIN_FETCH_CONCURRENCY = 10
+DEFAULT_DOMAIN_FETCH_MAX_TRACKED_ENTRIES = 500
 DEFAULT_FETCH_CONCURRENCY = 3
 DEFAULT_MAX_CONCURRENT_ACTIVITIES = 0
 DEFAULT_MAX_CONCURRENT_WORKFLOW_TASKS = 0
 DEFAULT_MAX_CONCURRENT_LOCAL_ACTIVITIES = 0
+DEFAULT_MAX_CONCURRENT_HEAVY_ACTIVITIES = 0
+DEFAULT_TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION = True
+DEFAULT_WORKER_ROLE = "both"
 
 # Rate limiting
 DEFAULT_DOMAIN_FETCH_DELAY = 2.0
@@ -163,6 +170,7 @@ DEFAULT_SEARCH_PRUNE_BATCH_SIZE = 1000
 DEFAULT_GRAPH_REBUILD_BATCH_SIZE = 50
 DEFAULT_GLOBAL_GRAPH_UPDATE_BATCH_SIZE = 50
 DEFAULT_EMBEDDING_BACKFILL_BATCH_SIZE = 100
+DEFAULT_EMBEDDING_BACKFILL_CONCURRENCY = 2
 
 # AI Evaluation
 DEFAULT_AI_EVALUATION_ENABLED = False
@@ -215,6 +223,10 @@ class Config:
     temporal_host: str
     temporal_namespace: str
     task_queue: str
+    heavy_task_queue: str  # Task queue for long-running LLM/graph/embedding activities
+    temporal_disable_eager_activity_execution: bool  # Always dispatch activities via the queue
+    worker_role: str  # "both", "workflow" (workflows only) or "activity" (activities only)
+    worker_cpu_affinity: str  # "" (unpinned), "numa" (NUMA node 0 CPUs) or a cpulist "0-7"
 
     # Feature flags
     enable_content_fetch: bool
@@ -235,14 +247,19 @@ class Config:
 
     # Workflow concurrency
     feed_ingestion_concurrency: int  # Max concurrent child workflows for feed ingestion
+    feed_ingestion_coarse_progress: bool  # Skip per-child progress notifications
+    context_extraction_concurrency: int  # Max concurrent child workflows for context collection
+    domain_fetch_concurrency: int  # Max concurrent domain fetch child workflows per schedule
 
     # Activity concurrency
     fetch_concurrency: int  # Max concurrent HTTP fetch requests per activity
 
     # Worker concurrency limits (Temporal worker configuration)
-    max_concurrent_activities: int  # Max concurrent activity tasks (0 = unlimited)
-    max_concurrent_workflow_tasks: int  # Max concurrent workflow tasks (0 = unlimited)
-    max_concurrent_local_activities: int  # Max concurrent local activities (0 = unlimited)
+    # (all three 0 = resource-based tuner)
+    max_concurrent_activities: int  # Max concurrent activity tasks (0 = auto)
+    max_concurrent_workflow_tasks: int  # Max concurrent workflow tasks (0 = SDK default)
+    max_concurrent_local_activities: int  # Max concurrent local activities (0 = SDK default)
+    max_concurrent_heavy_activities: int  # Max concurrent heavy queue activities (0 = auto)
 
     # Rate limiting
     domain_fetch_delay: float  # Delay between requests to same domain (seconds)
@@ -283,6 +300,8 @@ class Config:
         """Load configuration from environment variables."""
         # LLM model with fallback chain
         llm_model = get_env("LLM_MODEL", DEFAULT_LLM_MODEL)
+        # Heavy task queue defaults to "<task_queue>-heavy"
+        task_queue = get_env("TEMPORAL_TASK_QUEUE", DEFAULT_TASK_QUEUE)
 
         return cls(
             # API (token is required)
@@ -304,7 +323,14 @@ class Config:
             # Temporal
             temporal_host=get_env("TEMPORAL_HOST", DEFAULT_TEMPORAL_HOST),
             temporal_namespace=get_env("TEMPORAL_NAMESPACE", DEFAULT_TEMPORAL_NAMESPACE),
-            task_queue=get_env("TEMPORAL_TASK_QUEUE", DEFAULT_TASK_QUEUE),
+            task_queue=task_queue,
+            heavy_task_queue=get_env("TEMPORAL_HEAVY_TASK_QUEUE", f"{task_queue}-heavy"),
+            temporal_disable_eager_activity_execution=get_env_bool(
+                "TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION",
+                DEFAULT_TEMPORAL_DISABLE_EAGER_ACTIVITY_EXECUTION,
+            ),
+            worker_role=get_env("WORKER_ROLE", DEFAULT_WORKER_ROLE).lower(),
+            worker_cpu_affinity=get_env("WORKER_CPU_AFFINITY", "").strip().lower(),
             # Feature flags
             enable_content_fetch=get_env_bool("ENABLE_CONTENT_FETCH", DEFAULT_ENABLE_CONTENT_FETCH),
             enable_summarization=get_env_bool("ENABLE_SUMMARIZATION", DEFAULT_ENABLE_SUMMARIZATION),
@@ -323,6 +349,15 @@ class Config:
             feed_ingestion_concurrency=get_env_int(
                 "FEED_INGESTION_CONCURRENCY", DEFAULT_FEED_INGESTION_CONCURRENCY
             ),
+            feed_ingestion_coarse_progress=get_env_bool(
+                "FEED_INGESTION_COARSE_PROGRESS", DEFAULT_FEED_INGESTION_COARSE_PROGRESS
+            ),
+            context_extraction_concurrency=get_env_int(
+                "CONTEXT_EXTRACTION_CONCURRENCY", DEFAULT_CONTEXT_EXTRACTION_CONCURRENCY
+            ),
+            domain_fetch_concurrency=get_env_int(
+                "DOMAIN_FETCH_CONCURRENCY", DEFAULT_DOMAIN_FETCH_CONCURRENCY
+            ),
             fetch_concurrency=get_env_int("FETCH_CONCURRENCY", DEFAULT_FETCH_CONCURRENCY),
             max_concurrent_activities=get_env_int(
                 "MAX_CONCURRENT_ACTIVITIES", DEFAULT_MAX_CONCURRENT_ACTIVITIES
@@ -333,6 +368,9 @@ class Config:
             max_concurrent_local_activities=get_env_int(
                 "MAX_CONCURRENT_LOCAL_ACTIVITIES", DEFAULT_MAX_CONCURRENT_LOCAL_ACTIVITIES
             ),
+            max_concurrent_heavy_activities=get_env_int(
+                "MAX_CONCURRENT_HEAVY_ACTIVITIES", DEFAULT_MAX_CONCURRENT_HEAVY_ACTIVITIES
+            ),
             # Rate limiting
             domain_fetch_delay=get_env_float("DOMAIN_FETCH_DELAY", DEFAULT_DOMAIN_FETCH_DELAY),
             # GraphRAG
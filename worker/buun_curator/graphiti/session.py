@@ -29,6 +29,11 @@ logger = logging.getLogger(__name__)
 # Track if Graphiti indices have been built per database
 _graphiti_initialized: set[str] = set()
 
+# Label of the node recording which content the session graph was built from.
+# Graphiti only queries its own labels (Entity, Episodic, ...), so this node is
+# invisible to search; reset() deletes it with the rest of the graph.
+_STATE_LABEL = "DeepResearchState"
+
 
 class GraphitiSession(GraphRAGSession):
     """
@@ -320,6 +325,85 @@ class GraphitiSession(GraphRAGSession):
             logger.warning(f"Failed to reset GraphitiSession for {entry_id}: {e}")
             return False
 
+    @classmethod
+    def _state_driver(cls, graph_name: str) -> Any:
+        """
+        Create a FalkorDriver for reading or writing session state.
+
+        Parameters
+        ----------
+        graph_name : str
+            The FalkorDB graph name.
+
+        Returns
+        -------
+        FalkorDriver
+            Driver bound to the graph (caller must close it).
+        """
+        from graphiti_core.driver.falkordb_driver import FalkorDriver
+
+        return FalkorDriver(
+            host=os.getenv("FALKORDB_HOST", "localhost"),
+            port=int(os.getenv("FALKORDB_PORT", "6379")),
+            username=os.getenv("FALKORDB_USERNAME") or None,
+            password=os.getenv("FALKORDB_PASSWORD") or None,
+            database=graph_name,
+        )
+
+    @classmethod
+    async def get_content_hash(cls, entry_id: str) -> str | None:
+        """
+        Get the hash of the content the entry's graph was built from.
+
+        Parameters
+        ----------
+        entry_id : str
+            The entry ID of the session.
+
+        Returns
+        -------
+        str | None
+            Content hash recorded by set_content_hash(), or None if the graph
+            was never built, has been reset, or could not be read.
+        """
+        graph_name = f"buun_curator_graphiti_{entry_id}"
+        try:
+            driver = cls._state_driver(graph_name)
+            try:
+                result = await driver.execute_query(
+                    f"MATCH (s:{_STATE_LABEL}) RETURN s.content_hash AS content_hash LIMIT 1"
+                )
+            finally:
+                await driver.close()
+        except Exception as e:
+            logger.warning(f"Could not read session state for {graph_name}: {e}")
+            return None
+
+        rows = result[0] if result else []
+        return rows[0].get("content_hash") if rows else None
+
+    @classmethod
+    async def set_content_hash(cls, entry_id: str, content_hash: str) -> None:
+        """
+        Record the hash of the content the entry's graph was built from.
+
+        Parameters
+        ----------
+        entry_id : str
+            The entry ID of the session.
+        content_hash : str
+            Hash of the entry content added to the graph.
+        """
+        graph_name = f"buun_curator_graphiti_{entry_id}"
+        driver = cls._state_driver(graph_name)
+        try:
+            await driver.execute_query(
+                f"MERGE (s:{_STATE_LABEL}) SET s.content_hash = $content_hash",
+                content_hash=content_hash,
+            )
+        finally:
+            await driver.close()
+
     async def add_content(
         self,
         content: str,
@@ -3,14 +3,22 @@ HTTP health check server for the Temporal worker.
 
 Provides a /health endpoint for Kubernetes liveness probes.
 The health check verifies that the worker can still communicate
-with the Temporal server by attempting a simple namespace describe call.
+with the Temporal server, using recent task activity or a gRPC health check.
 """
 
 import asyncio
 import logging
+import threading
+import time
 from collections.abc import Awaitable, Callable
+from typing import Any
 
 from aiohttp import web
+from temporalio.worker import (
+    ActivityInboundInterceptor,
+    ExecuteActivityInput,
+    Interceptor,
+)
 
 logger = logging.getLogger("buun_curator.health")
 
@@ -40,6 +48,8 @@ class HealthServer:
         self.app.router.add_get("/ready", self._handle_ready)
         self._runner: web.AppRunner | None = None
         self._site: web.TCPSite | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
 
     async def _handle_health(self, _request: web.Request) -> web.Response:
         """
@@ -82,3 +92,98 @@ class HealthServer:
         if self._runner:
             await self._runner.cleanup()
             logger.info("Health server stopped")
+
+    def start_in_thread(self) -> None:
+        """
+        Start the health server on a dedicated thread with its own event loop.
+
+        Probes are then served even while the worker's event loop is busy.
+        Blocks until the server is listening and re-raises startup errors.
+        """
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        startup_error: list[BaseException] = []
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.start())
+            except BaseException as e:
+                startup_error.append(e)
+                ready.set()
+                loop.close()
+                return
+            ready.set()
+            loop.run_forever()
+            loop.run_until_complete(self.stop())
+            loop.close()
+
+        self._loop = loop
+        self._thread = threading.Thread(target=run, name="health-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if startup_error:
+            raise startup_error[0]
+
+    def stop_thread(self, timeout: float = 5.0) -> None:
+        """
+        Stop a health server started with ``start_in_thread``.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for the server thread to exit.
+        """
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop = None
+        self._thread = None
+
+
+class TaskActivityTracker(Interceptor):
+    """
+    Worker interceptor that records when the worker last received a task.
+
+    An activity task can only arrive through a successful poll, so a recent
+    timestamp proves the worker's Temporal connection is live without an
+    extra health RPC.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no task seen yet."""
+        self.last_task_at = 0.0
+
+    def seen_within(self, seconds: float) -> bool:
+        """
+        Check whether a task was received within the given window.
+
+        Parameters
+        ----------
+        seconds : float
+            Window length in seconds.
+
+        Returns
+        -------
+        bool
+            True if a task started less than ``seconds`` ago.
+        """
+        return self.last_task_at > 0 and time.monotonic() - self.last_task_at < seconds
+
+    def intercept_activity(self, next: ActivityInboundInterceptor) -> ActivityInboundInterceptor:
+        """Wrap activity execution to record task arrival."""
+        return _TaskActivityInbound(next, self)
+
+
+class _TaskActivityInbound(ActivityInboundInterceptor):
+    """Activity inbound interceptor that updates a TaskActivityTracker."""
+
+    def __init__(self, next: ActivityInboundInterceptor, tracker: TaskActivityTracker) -> None:
+        super().__init__(next)
+        self._tracker = tracker
+
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:
+        """Record the task arrival and delegate."""
+        self._tracker.last_task_at = time.monotonic()
+        return await self.next.execute_activity(input)
@@ -7,9 +7,13 @@ Grafana Trace-to-Logs correlation.
 @module buun_curator/logging
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
-from typing import Any
+from typing import Any, TextIO
 
 import structlog
 from opentelemetry import trace
@@ -57,6 +61,56 @@ def add_trace_context(
     return event_dict
 
 
+# Temporal SDK appends " ({'attempt': ..., ...})" or " ({...})" to messages.
+# The greedy prefix anchors the group at the last context dict in the message.
+_TEMPORAL_CONTEXT_RE = re.compile(r".+( \(\{['\"]).*\)$", re.DOTALL)
+
+# Background listener that writes queued log records (see configure_logging)
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+class _DrainFlushStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that flushes only once the pending log queue is drained.
+
+    Under load, consecutive records share one write syscall via the stream
+    buffer; when the queue is idle every record is flushed immediately.
+    """
+
+    def __init__(self, stream: TextIO, pending: queue.SimpleQueue) -> None:
+        super().__init__(stream)
+        self._pending = pending
+
+    def flush(self) -> None:
+        """Flush the stream if no more records are waiting."""
+        if self._pending.empty():
+            super().flush()
+
+
+def strip_temporal_context(
+    _logger: WrappedLogger,
+    _method_name: str,
+    event_dict: EventDict,
+) -> EventDict:
+    """
+    Strip the trailing context dict from Temporal SDK log messages.
+
+    Only applies to ``temporalio.*`` loggers; the context is redundant with
+    the structured fields added via ``extra``.
+    """
+    logger_name = event_dict.get("logger")
+    if not isinstance(logger_name, str) or not logger_name.startswith("temporalio"):
+        return event_dict
+
+    event = event_dict.get("event")
+    # Cheap gates first; most messages never reach the regex
+    if isinstance(event, str) and event.endswith(")") and " ({" in event:
+        match = _TEMPORAL_CONTEXT_RE.match(event)
+        if match:
+            event_dict["event"] = event[: match.start(1)]
+    return event_dict
+
+
 def make_add_component_processor(
     component: str,
 ) -> structlog.types.Processor:
@@ -89,6 +143,7 @@ def configure_logging(
     json_logs: bool = True,
     log_level: str = "INFO",
     component: str | None = None,
+    stream: TextIO | None = None,
 ) -> None:
     """
     Configure structlog with OpenTelemetry trace context injection.
@@ -101,6 +156,8 @@ def configure_logging(
         Logging level (DEBUG, INFO, WARNING, ERROR).
     component : str | None
         Component name to include in all log entries (e.g., "worker", "agent").
+    stream : TextIO | None
+        Output stream for rendered logs (default: sys.stdout).
     """
     # Shared processors for both structlog and standard logging
     shared_processors: list[structlog.types.Processor] = [
@@ -108,6 +165,7 @@ def configure_logging(
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.PositionalArgumentsFormatter(),
+        strip_temporal_context,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.UnicodeDecoder(),
@@ -140,8 +198,12 @@ def configure_logging(
     )
 
     # Configure standard logging to use structlog formatter
-    # This ensures third-party libraries using standard logging also get structured output
-    handler = logging.StreamHandler(sys.stdout)
+    # This ensures third-party libraries using standard logging also get structured output.
+    # Records are rendered on the calling thread (contextvars/trace context are
+    # thread-local) and handed to a QueueListener, so stdout writes never block
+    # the event loop.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
     handler.setFormatter(
         structlog.stdlib.ProcessorFormatter(
             foreign_pre_chain=[
@@ -157,6 +219,14 @@ def configure_logging(
         )
     )
 
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    stream_handler = _DrainFlushStreamHandler(stream or sys.stdout, log_queue)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _queue_listener.start()
+
     root = logging.getLogger()
     root.handlers.clear()
     root.addHandler(handler)
@@ -167,6 +237,17 @@ def configure_logging(
     logging.getLogger("buun-curator").setLevel(getattr(logging, log_level))
 
 
+def _stop_queue_listener() -> None:
+    """Drain and stop the background log listener, then flush its output."""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for listener_handler in _queue_listener.handlers:
+            listener_handler.flush()
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """
     Get a structlog logger with the given name.
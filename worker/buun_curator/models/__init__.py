@@ -61,6 +61,8 @@ from buun_curator.models.activity_io import (
     GetEntryOutput,
     GetFeedOptionsInput,
     GetFeedOptionsOutput,
+    GetGraphRAGSessionStateInput,
+    GetGraphRAGSessionStateOutput,
     GetOrphanedDocumentIdsInput,
     GetOrphanedDocumentIdsOutput,
     GitHubCandidate,
@@ -105,6 +107,8 @@ from buun_curator.models.activity_io import (
     TranslateEntriesOutput,
     UpdateEntryIndexInput,
     UpdateEntryIndexOutput,
+    WaitForSearchTaskInput,
+    WaitForSearchTaskOutput,
     WebPageInfo,
 )
 from buun_curator.models.base import CamelCaseModel
@@ -199,6 +203,8 @@ __all__ = [
     "BuildGraphRAGGraphOutput",
     "CloseGraphRAGSessionInput",
     "CloseGraphRAGSessionOutput",
+    "GetGraphRAGSessionStateInput",
+    "GetGraphRAGSessionStateOutput",
     "ResetGraphRAGSessionInput",
     "ResetGraphRAGSessionOutput",
     "SearchGraphRAGSessionInput",
@@ -290,6 +296,8 @@ __all__ = [
     "TranslateEntriesOutput",
     "UpdateEntryIndexInput",
     "UpdateEntryIndexOutput",
+    "WaitForSearchTaskInput",
+    "WaitForSearchTaskOutput",
     # Workflow I/O models
     "AllFeedsIngestionInput",
     "AllFeedsIngestionResult",
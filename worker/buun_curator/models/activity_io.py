@@ -190,6 +190,9 @@ class FetchSingleContentOutput(BaseModel):
     status: str = "success"  # "success", "failed", "no_content"
     content_length: int = 0  # Length of full_content (for logging/stats)
     error: str | None = None
+    # Response signals from URL fetches (for adaptive per-domain delays)
+    status_code: int | None = None
+    retry_after_seconds: float | None = None
 
 
 # ============================================================================
@@ -620,6 +623,7 @@ class ClearSearchIndexOutput(BaseModel):
     """Output from clear_search_index activity."""
 
     success: bool = False
+    task_uid: int | None = None  # Meilisearch deletion task (enqueued, not awaited)
     error: str | None = None
 
 
@@ -664,6 +668,20 @@ class UpdateEntryIndexOutput(BaseModel):
     error: str | None = None
 
 
+class WaitForSearchTaskInput(BaseModel):
+    """Input for wait_for_search_task activity."""
+
+    task_uid: int
+    timeout_seconds: float = 300.0
+
+
+class WaitForSearchTaskOutput(BaseModel):
+    """Output from wait_for_search_task activity."""
+
+    success: bool = False
+    error: str | None = None
+
+
 # ============================================================================
 # Fetch Entry Links Activities
 # ============================================================================
@@ -741,6 +759,7 @@ class BuildGraphRAGGraphInput(BaseModel):
     """Input for build_graph_rag_graph activity."""
 
     entry_id: ULID
+    content_hash: str | None = None  # Recorded in the session after a successful build
 
 
 class BuildGraphRAGGraphOutput(BaseModel):
@@ -768,6 +787,18 @@ class SearchGraphRAGSessionOutput(BaseModel):
     error: str | None = None
 
 
+class GetGraphRAGSessionStateInput(BaseModel):
+    """Input for get_graph_rag_session_state activity."""
+
+    entry_id: ULID
+
+
+class GetGraphRAGSessionStateOutput(BaseModel):
+    """Output from get_graph_rag_session_state activity."""
+
+    content_hash: str | None = None  # Hash of the content the graph was built from
+
+
 class ResetGraphRAGSessionInput(BaseModel):
     """Input for reset_graph_rag_session activity."""
 
@@ -100,6 +100,8 @@ class FetchedContent:
     raw_html: str = ""  # Original HTML for extraction rule creation
     screenshot: bytes | None = None  # PNG screenshot (base64 decoded)
     title: str = ""  # HTML page title from metadata
+    status_code: int | None = None  # HTTP status of the fetched page
+    retry_after: float | None = None  # Seconds from the Retry-After header
 
 
 @dataclass
@@ -12,7 +12,9 @@ from pydantic import Field
 
 from buun_curator.config import (
     DEFAULT_DISTILLATION_BATCH_SIZE,
+    DEFAULT_DOMAIN_FETCH_MAX_TRACKED_ENTRIES,
     DEFAULT_EMBEDDING_BACKFILL_BATCH_SIZE,
+    DEFAULT_EMBEDDING_BACKFILL_CONCURRENCY,
     DEFAULT_GLOBAL_GRAPH_UPDATE_BATCH_SIZE,
     DEFAULT_GRAPH_REBUILD_BATCH_SIZE,
     DEFAULT_SEARCH_PRUNE_BATCH_SIZE,
@@ -101,6 +103,7 @@ class ScheduleFetchInput(CamelCaseModel):
     target_language: str = ""  # Target language for distillation
     parent_workflow_id: str = ""  # Parent workflow ID for SSE notifications
     distillation_batch_size: int = DEFAULT_DISTILLATION_BATCH_SIZE
+    sort_by_size: bool = False  # Fetch small pages first within each domain
 
 
 class ScheduleFetchOutput(CamelCaseModel):
@@ -127,6 +130,8 @@ class DomainFetchEntry(CamelCaseModel):
     url: str
     title: str = ""
     extraction_rules: list[dict] | None = None
+    # Expected page size, used to order entries when sort_by_size is set (0: unknown)
+    content_size_hint: int = 0
 
 
 class DomainFetchInput(CamelCaseModel):
@@ -140,6 +145,10 @@ class DomainFetchInput(CamelCaseModel):
     auto_distill: bool = True  # Whether to distill after fetch
     target_language: str = ""  # Target language for distillation
     parent_workflow_id: str = ""  # Parent workflow ID for SSE notifications
+    # Above this many entries, entry_progress only keeps the most recent ones
+    max_tracked_entries: int = DEFAULT_DOMAIN_FETCH_MAX_TRACKED_ENTRIES
+    # Fetch entries in ascending content_size_hint order (stable)
+    sort_by_size: bool = False
 
 
 class DomainFetchResult(CamelCaseModel):
@@ -157,7 +166,7 @@ class DomainFetchOutput(CamelCaseModel):
     """Output from DomainFetchWorkflow."""
 
     domain: str
-    results: list[dict] = Field(default_factory=list)  # List of DomainFetchResult as dicts
+    results: list[DomainFetchResult] = Field(default_factory=list)
     success_count: int = 0
     failed_count: int = 0
     fetched_entry_ids: list[str] = Field(default_factory=list)
@@ -399,6 +408,7 @@ class DomainFetchProgress(WorkflowProgress):
     current_entry_title: str = ""
 
     # Per-entry progress: entry_id (ULID) -> EntryProgressState
+    # (only the most recently started entries for very large domains)
     entry_progress: dict[ULID, EntryProgressState] = Field(default_factory=dict)
 
     # Summary counters
@@ -426,6 +436,7 @@ class AllFeedsIngestionProgress(WorkflowProgress):
 
     # Aggregate entry counters (from child workflows)
     entries_created: int = 0
+    entries_skipped: int = 0
     contents_fetched: int = 0
     entries_distilled: int = 0
 
@@ -647,6 +658,8 @@ class DeepResearchInput(CamelCaseModel):
     entry_id: ULID
     query: str
     search_mode: str = "hybrid"  # "graph", "summary", "hybrid", "chunks"
+    # Rebuild the graph even if it was already built from the same content
+    force_rebuild: bool = False
 
 
 class DeepResearchResult(CamelCaseModel):
@@ -780,6 +793,7 @@ class EmbeddingBackfillInput(CamelCaseModel):
     """
 
     batch_size: int = DEFAULT_EMBEDDING_BACKFILL_BATCH_SIZE
+    concurrency: int = DEFAULT_EMBEDDING_BACKFILL_CONCURRENCY  # Batches embedded at once
 
 
 class EmbeddingBackfillResult(CamelCaseModel):
@@ -39,6 +39,7 @@ import multiprocessing
 import os
 import signal
 import sys
+import threading
 from collections.abc import Callable
 from multiprocessing.context import SpawnProcess
 from pathlib import Path
@@ -93,7 +94,8 @@ class ChangeReload:
         self.reload_excludes = reload_excludes or [".*", ".py[cod]", "__pycache__", ".venv"]
         self.reload_delay = reload_delay
         self.process: SpawnProcess | None = None
-        self.should_exit = False
+        # Checked by the watcher between notifications, so shutdown needs no polling
+        self.should_exit = threading.Event()
 
     @property
     def pid(self) -> int:
@@ -102,7 +104,7 @@ class ChangeReload:
 
     def signal_handler(self, _sig: int, _frame: FrameType | None) -> None:
         """Handle shutdown signals."""
-        self.should_exit = True
+        self.should_exit.set()
 
     def run(self) -> None:
         """Run the reloader main loop."""
@@ -127,21 +129,19 @@ class ChangeReload:
         def watch_filter(_change_type: object, path: str) -> bool:
             return _should_watch_path(path, self.reload_includes, self.reload_excludes)
 
+        # watchfiles blocks on OS notifications (inotify/FSEvents/
+        # ReadDirectoryChangesW) and only yields when files change or
+        # should_exit is set, instead of waking up on every timeout
         for changes in watch(
             *self.reload_dirs,
             watch_filter=watch_filter,
             debounce=int(self.reload_delay * 1000),
-            stop_event=None,
-            yield_on_timeout=True,
+            stop_event=self.should_exit,
         ):
-            if self.should_exit:
-                break
+            for _change_type, path in changes:
+                logger.info(f"Detected change: {path}")
 
-            if changes:
-                for _change_type, path in changes:
-                    logger.info(f"Detected change: {path}")
-
-                self.restart()
+            self.restart()
 
     def restart(self) -> None:
         """Restart the worker subprocess."""
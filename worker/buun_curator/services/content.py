@@ -8,6 +8,10 @@ Migrated from agents/content_fetcher.py.
 import asyncio
 import re
 from base64 import b64decode
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
@@ -129,6 +133,103 @@ class ImagePreservingFilter(PruningContentFilter):
 
 logger = get_logger(__name__)
 
+# Browser shared by all ContentFetcher instances for the worker lifetime, so
+# each fetch opens a page instead of launching (and tearing down) a browser.
+_crawler: AsyncWebCrawler | None = None
+_crawler_lock = asyncio.Lock()
+# Number of fetches using each crawler. A crawler that is no longer shared is
+# closed by the last fetch using it, so one failure never closes the browser
+# under other concurrent fetches.
+_crawler_users: dict[AsyncWebCrawler, int] = {}
+
+
+async def _get_crawler() -> AsyncWebCrawler:
+    """
+    Get the shared crawler, starting its browser on first use.
+
+    Returns
+    -------
+    AsyncWebCrawler
+        Started crawler shared across fetches.
+    """
+    global _crawler
+    if _crawler is None:
+        async with _crawler_lock:
+            if _crawler is None:
+                crawler = AsyncWebCrawler()
+                await crawler.start()
+                _crawler = crawler
+    return _crawler
+
+
+@asynccontextmanager
+async def _use_crawler() -> AsyncIterator[AsyncWebCrawler]:
+    """
+    Use the shared crawler for one fetch.
+
+    Closes the crawler on exit if it was discarded or shut down meanwhile and
+    no other fetch is still using it.
+
+    Yields
+    ------
+    AsyncWebCrawler
+        Started crawler shared across fetches.
+    """
+    crawler = await _get_crawler()
+    _crawler_users[crawler] = _crawler_users.get(crawler, 0) + 1
+    try:
+        yield crawler
+    finally:
+        _crawler_users[crawler] -= 1
+        if _crawler_users[crawler] == 0:
+            del _crawler_users[crawler]
+            if crawler is not _crawler:
+                await _close_crawler(crawler)
+
+
+async def _close_crawler(crawler: AsyncWebCrawler) -> None:
+    """
+    Close a crawler that is no longer shared, logging failures.
+
+    Parameters
+    ----------
+    crawler : AsyncWebCrawler
+        The crawler to close.
+    """
+    try:
+        await crawler.close()
+    except Exception as e:
+        logger.warning(f"Failed to close crawler: {e}", error_type=type(e).__name__)
+
+
+def _discard_crawler(crawler: AsyncWebCrawler) -> None:
+    """
+    Stop sharing a crawler whose browser failed so the next fetch starts anew.
+
+    The crawler is closed by the last fetch still using it.
+
+    Parameters
+    ----------
+    crawler : AsyncWebCrawler
+        The crawler that failed (ignored if it was already replaced).
+    """
+    global _crawler
+    if _crawler is crawler:
+        _crawler = None
+
+
+async def close_shared_crawler() -> None:
+    """
+    Close the shared crawler and its browser.
+
+    Call once at worker shutdown. If fetches are still using the crawler, the
+    last of them closes it.
+    """
+    global _crawler
+    crawler, _crawler = _crawler, None
+    if crawler is not None and crawler not in _crawler_users:
+        await crawler.close()
+
 
 def html_to_markdown(html: str) -> str:
     """
@@ -191,6 +292,40 @@ def _normalize_text(text: str) -> str:
     return re.sub(r"[^\w\s]", "", text.lower()).strip()
 
 
+def _parse_retry_after(headers: dict[str, str] | None) -> float | None:
+    """
+    Parse the Retry-After response header into seconds.
+
+    Parameters
+    ----------
+    headers : dict[str, str] | None
+        Response headers (header names in any case).
+
+    Returns
+    -------
+    float | None
+        Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not headers:
+        return None
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    # HTTP-date form (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
 def _post_process_content(content: str, title: str | None = None) -> str:
     """
     Post-process extracted content.
@@ -505,89 +640,116 @@ class ContentFetcher:
                 screenshot_wait_for=1.0,  # Wait 1 second for screenshot
             )
 
-            async with AsyncWebCrawler() as crawler:
-                result: Any = await asyncio.wait_for(
-                    crawler.arun(url=url, config=run_config),
-                    timeout=self.timeout,
-                )
-
-                # CrawlResultContainer is iterable, get first result
-                crawl_result: Any = result[0] if result else None
-
-                if crawl_result and crawl_result.success:
-                    raw_markdown = crawl_result.markdown.raw_markdown or ""
-                    filtered_markdown = crawl_result.markdown.fit_markdown or ""
-                    raw_html = crawl_result.html or ""
-
-                    # Extract HTML title from metadata
-                    html_title = ""
-                    if crawl_result.metadata and isinstance(crawl_result.metadata, dict):
-                        html_title = crawl_result.metadata.get("title", "") or ""
-
-                    # Decode screenshot if available
-                    screenshot_bytes: bytes | None = None
-                    if self.capture_screenshot and crawl_result.screenshot:
-                        try:
-                            screenshot_bytes = b64decode(crawl_result.screenshot)
-                            logger.debug(
-                                "Captured screenshot", url=url, bytes=len(screenshot_bytes)
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to decode screenshot: {e}",
-                                url=url,
-                                error_type=type(e).__name__,
-                            )
-
-                    # Post-process and select best content
-                    processed_raw = _post_process_content(raw_markdown, title)
-                    processed_filtered = _post_process_content(filtered_markdown, title)
-
-                    # Log both versions for debugging
-                    logger.debug(
-                        f"Content extraction for {url}: "
-                        f"raw={len(processed_raw)} chars, "
-                        f"filtered={len(processed_filtered)} chars"
+            async with _use_crawler() as crawler:
+                try:
+                    result: Any = await asyncio.wait_for(
+                        crawler.arun(url=url, config=run_config),
+                        timeout=self.timeout,
                     )
+                except TimeoutError:
+                    raise
+                except Exception:
+                    # Crawl failures are reported in the result; an exception
+                    # usually means the browser itself broke
+                    _discard_crawler(crawler)
+                    raise
+
+            # CrawlResultContainer is iterable, get first result
+            crawl_result: Any = result[0] if result else None
+
+            # Response signals used by DomainFetchWorkflow to adapt its delay
+            status_code: int | None = crawl_result.status_code if crawl_result else None
+            retry_after = (
+                _parse_retry_after(crawl_result.response_headers) if crawl_result else None
+            )
 
-                    # Use filtered content with fallback to raw if too short
-                    # or if filtered is suspiciously short compared to raw
-                    # (indicates over-aggressive filtering)
-                    use_filtered = (
-                        len(processed_filtered) >= MIN_CONTENT_LENGTH
-                        and len(processed_filtered) >= len(processed_raw) * 0.1
-                    )
-                    if use_filtered:
-                        full_content = processed_filtered
-                    else:
-                        full_content = processed_raw
-                        if processed_filtered and len(processed_raw) > len(processed_filtered):
-                            logger.debug(
-                                f"Using raw content (filtered too short): "
-                                f"raw={len(processed_raw)}, filtered={len(processed_filtered)}"
-                            )
-
-                    if full_content:
-                        logger.info(
-                            "Fetched content",
+            if crawl_result and crawl_result.success:
+                raw_markdown = crawl_result.markdown.raw_markdown or ""
+                filtered_markdown = crawl_result.markdown.fit_markdown or ""
+                raw_html = crawl_result.html or ""
+
+                # Extract HTML title from metadata
+                html_title = ""
+                if crawl_result.metadata and isinstance(crawl_result.metadata, dict):
+                    html_title = crawl_result.metadata.get("title", "") or ""
+
+                # Decode screenshot if available
+                screenshot_bytes: bytes | None = None
+                if self.capture_screenshot and crawl_result.screenshot:
+                    try:
+                        screenshot_bytes = b64decode(crawl_result.screenshot)
+                        logger.debug("Captured screenshot", url=url, bytes=len(screenshot_bytes))
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to decode screenshot: {e}",
                             url=url,
-                            content_chars=len(full_content),
-                            html_chars=len(raw_html),
-                            screenshot_bytes=len(screenshot_bytes) if screenshot_bytes else 0,
+                            error_type=type(e).__name__,
                         )
-                        return FetchedContent(
-                            full_content=full_content,
-                            raw_html=raw_html,
-                            screenshot=screenshot_bytes,
-                            title=html_title,
+
+                # Post-process and select best content
+                processed_raw = _post_process_content(raw_markdown, title)
+                processed_filtered = _post_process_content(filtered_markdown, title)
+
+                # Log both versions for debugging
+                logger.debug(
+                    f"Content extraction for {url}: "
+                    f"raw={len(processed_raw)} chars, "
+                    f"filtered={len(processed_filtered)} chars"
+                )
+
+                # Use filtered content with fallback to raw if too short
+                # or if filtered is suspiciously short compared to raw
+                # (indicates over-aggressive filtering)
+                use_filtered = (
+                    len(processed_filtered) >= MIN_CONTENT_LENGTH
+                    and len(processed_filtered) >= len(processed_raw) * 0.1
+                )
+                if use_filtered:
+                    full_content = processed_filtered
+                else:
+                    full_content = processed_raw
+                    if processed_filtered and len(processed_raw) > len(processed_filtered):
+                        logger.debug(
+                            f"Using raw content (filtered too short): "
+                            f"raw={len(processed_raw)}, filtered={len(processed_filtered)}"
                         )
-                    else:
-                        logger.warning("No content extracted", url=url)
-                        return FetchedContent(full_content="", raw_html=raw_html, title=html_title)
+
+                if full_content:
+                    logger.info(
+                        "Fetched content",
+                        url=url,
+                        content_chars=len(full_content),
+                        html_chars=len(raw_html),
+                        screenshot_bytes=len(screenshot_bytes) if screenshot_bytes else 0,
+                    )
+                    return FetchedContent(
+                        full_content=full_content,
+                        raw_html=raw_html,
+                        screenshot=screenshot_bytes,
+                        title=html_title,
+                        status_code=status_code,
+                        retry_after=retry_after,
+                    )
                 else:
-                    error_msg = crawl_result.error_message if crawl_result else "No result"
-                    logger.warning(f"Failed to fetch content: {error_msg}", url=url)
-                    return FetchedContent(full_content="", raw_html="")
+                    logger.warning("No content extracted", url=url)
+                    return FetchedContent(
+                        full_content="",
+                        raw_html=raw_html,
+                        title=html_title,
+                        status_code=status_code,
+                        retry_after=retry_after,
+                    )
+            else:
+                error_msg = crawl_result.error_message if crawl_result else "No result"
+                logger.warning(
+                    f"Failed to fetch content: {error_msg}", url=url, status_code=status_code
+                )
+                return FetchedContent(
+                    full_content="",
+                    raw_html="",
+                    status_code=status_code,
+                    retry_after=retry_after,
+                )
 
         except TimeoutError:
             logger.warning("Timeout fetching content", url=url, error_type="TimeoutError")
@@ -1,33 +1,77 @@
 """
 Meilisearch service for indexing and searching entries.
+
+Uses the synchronous meilisearch client. All functions here block on HTTP,
+so async callers (Temporal activities) must run them via asyncio.to_thread
+to keep the worker event loop free.
 """
 
+import functools
+import json
 import os
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 import meilisearch
+from meilisearch.errors import MeilisearchApiError
 
 from buun_curator.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class _MeilisearchSettings:
+    """Meilisearch connection settings read from the environment."""
+
+    host: str | None
+    api_key: str | None
+    index_name: str
+
+
+# Settings snapshot (lazy loaded, the worker does not change env after startup)
+_settings: _MeilisearchSettings | None = None
+
+
+def _get_settings() -> _MeilisearchSettings:
+    """Get the Meilisearch settings snapshot, reading the environment once."""
+    global _settings
+    if _settings is None:
+        _settings = _MeilisearchSettings(
+            host=os.getenv("MEILISEARCH_HOST"),
+            api_key=os.getenv("MEILISEARCH_API_KEY"),
+            index_name=os.getenv("MEILISEARCH_INDEX", "buun-curator"),
+        )
+    return _settings
+
+
+def reload_settings() -> None:
+    """Re-read Meilisearch settings from the environment and drop the cached client."""
+    global _settings
+    _settings = None
+    get_meilisearch_client.cache_clear()
+
+
 def is_meilisearch_enabled() -> bool:
     """Check if Meilisearch is configured."""
-    host = os.getenv("MEILISEARCH_HOST")
-    api_key = os.getenv("MEILISEARCH_API_KEY")
-    return bool(host and api_key)
+    settings = _get_settings()
+    return bool(settings.host and settings.api_key)
 
 
+@functools.lru_cache(maxsize=1)
 def get_meilisearch_client() -> meilisearch.Client | None:
     """
-    Create a Meilisearch client instance.
+    Get the shared Meilisearch client instance.
+
+    The client is created once and reused across calls.
 
     Returns None if Meilisearch is not configured.
     """
-    host = os.getenv("MEILISEARCH_HOST")
-    api_key = os.getenv("MEILISEARCH_API_KEY")
+    settings = _get_settings()
+    host = settings.host
+    api_key = settings.api_key
 
     if not host or not api_key:
         return None
@@ -41,7 +85,7 @@ def get_meilisearch_client() -> meilisearch.Client | None:
 
 def get_index_name() -> str:
     """Get the Meilisearch index name from environment."""
-    return os.getenv("MEILISEARCH_INDEX", "buun-curator")
+    return _get_settings().index_name
 
 
 def datetime_to_timestamp(dt: datetime | str | None) -> int | None:
@@ -49,7 +93,8 @@ def datetime_to_timestamp(dt: datetime | str | None) -> int | None:
     if dt is None:
         return None
     if isinstance(dt, str):
-        dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+        # fromisoformat accepts a trailing "Z" natively on Python 3.11+
+        dt = datetime.fromisoformat(dt)
     return int(dt.timestamp())
 
 
@@ -90,14 +135,20 @@ def entry_to_document(entry: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def index_entries(entries: list[dict[str, Any]]) -> bool:
+def index_entries(entries: list[dict[str, Any]], batch_size: int = 10000) -> bool:
     """
     Index entries in Meilisearch.
 
+    Entries are converted and submitted in batches of ``batch_size`` without
+    waiting on each task, so Meilisearch can coalesce them with its
+    auto-batching.
+
     Parameters
     ----------
     entries : list
         List of entry dicts to index.
+    batch_size : int, optional
+        Maximum number of documents per add_documents call (default: 10000).
 
     Returns
     -------
@@ -114,8 +165,14 @@ def index_entries(entries: list[dict[str, Any]]) -> bool:
 
     try:
         index = client.index(get_index_name())
-        documents = [entry_to_document(entry) for entry in entries]
-        index.add_documents(documents, primary_key="id")
+        task_uids: list[int] = []
+        for i in range(0, len(entries), batch_size):
+            # Convert one batch at a time so only a single batch of documents
+            # (and its JSON payload) is held in memory alongside the entries
+            documents = [entry_to_document(entry) for entry in entries[i : i + batch_size]]
+            task = index.add_documents(documents, primary_key="id")
+            task_uids.append(task.task_uid)
+        logger.debug("Enqueued Meilisearch indexing tasks", task_uids=task_uids)
         return True
     except Exception as e:
         logger.error(
@@ -162,14 +219,24 @@ def update_entry(entry: dict[str, Any]) -> bool:
         return False
 
 
-def remove_entries(entry_ids: list[str]) -> bool:
+def remove_entries(
+    entry_ids: list[str],
+    batch_size: int = 10000,
+    wait: bool = False,
+) -> bool:
     """
     Remove entries from Meilisearch index.
 
+    Deletions are submitted in batches without waiting on each task.
+
     Parameters
     ----------
     entry_ids : list
         List of entry IDs to remove.
+    batch_size : int, optional
+        Maximum number of IDs per delete_documents call (default: 10000).
+    wait : bool, optional
+        Wait for the final deletion task to complete (default: False).
 
     Returns
     -------
@@ -185,7 +252,14 @@ def remove_entries(entry_ids: list[str]) -> bool:
 
     try:
         index = client.index(get_index_name())
-        index.delete_documents(entry_ids)
+        last_task_uid: int | None = None
+        for i in range(0, len(entry_ids), batch_size):
+            task = index.delete_documents(entry_ids[i : i + batch_size])
+            last_task_uid = task.task_uid
+        if wait and last_task_uid is not None:
+            # Meilisearch processes tasks in order, so the last one finishing
+            # implies all earlier deletions have been applied
+            _wait_for_task(client, last_task_uid)
         return True
     except Exception as e:
         logger.error(
@@ -197,12 +271,95 @@ def remove_entries(entry_ids: list[str]) -> bool:
         return False
 
 
+# Desired index settings, keyed by Meilisearch settings API field name
+_INDEX_SETTINGS: dict[str, Any] = {
+    # Searchable attributes (order matters for relevance)
+    "searchableAttributes": [
+        "title",
+        "annotation",
+        "summary",
+        "filteredContent",
+        "feedContent",
+        "author",
+    ],
+    # Filterable attributes
+    # Note: isRead/isStarred are not indexed - managed in DB only
+    # id is used for keyset pagination in get_all_document_ids
+    "filterableAttributes": [
+        "id",
+        "feedId",
+        "publishedAt",
+        "createdAt",
+    ],
+    "sortableAttributes": ["id", "publishedAt", "createdAt"],
+    "rankingRules": [
+        "words",
+        "typo",
+        "proximity",
+        "attribute",
+        "sort",
+        "exactness",
+    ],
+    # Typo tolerance tuned for better CJK support
+    "typoTolerance": {
+        "enabled": True,
+        "minWordSizeForTypos": {
+            "oneTypo": 4,
+            "twoTypos": 8,
+        },
+    },
+}
+
+# Settings whose order is irrelevant to Meilisearch
+_UNORDERED_SETTINGS = {"filterableAttributes", "sortableAttributes"}
+
+# Index names whose settings were verified by this process
+_verified_indexes: set[str] = set()
+
+
+def _setting_matches(key: str, current: Any, desired: Any) -> bool:
+    """
+    Check whether a current index setting already matches the desired value.
+
+    Dict settings match when every desired key matches (extra keys returned by
+    Meilisearch, such as defaults, are ignored).
+
+    Parameters
+    ----------
+    key : str
+        Settings API field name.
+    current : Any
+        Current value returned by get_settings.
+    desired : Any
+        Desired value.
+
+    Returns
+    -------
+    bool
+        True if no update is needed.
+    """
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(
+            _setting_matches(k, current.get(k), v) for k, v in desired.items()
+        )
+    if (
+        key in _UNORDERED_SETTINGS
+        and isinstance(current, list)
+        and all(isinstance(v, str) for v in current)
+    ):
+        return set(current) == set(desired)
+    return current == desired
+
+
 def initialize_index() -> bool:
     """
     Initialize Meilisearch index with proper settings.
 
     Creates the index if it doesn't exist and configures
     searchable attributes, filterable attributes, and ranking rules.
+    Current settings are fetched first and only differing settings are
+    updated, since each update enqueues a task that blocks document indexing.
+    Once verified, later calls in the same process return immediately.
 
     Returns
     -------
@@ -216,6 +373,9 @@ def initialize_index() -> bool:
 
     try:
         index_name = get_index_name()
+        if index_name in _verified_indexes:
+            logger.info("Meilisearch index settings already verified", index_name=index_name)
+            return True
 
         # Create index if it doesn't exist
         try:
@@ -228,55 +388,29 @@ def initialize_index() -> bool:
 
         index = client.index(index_name)
 
-        # Configure searchable attributes (order matters for relevance)
-        index.update_searchable_attributes(
-            [
-                "title",
-                "annotation",
-                "summary",
-                "filteredContent",
-                "feedContent",
-                "author",
-            ]
-        )
-
-        # Configure filterable attributes
-        # Note: isRead/isStarred are not indexed - managed in DB only
-        index.update_filterable_attributes(
-            [
-                "feedId",
-                "publishedAt",
-                "createdAt",
-            ]
-        )
-
-        # Configure sortable attributes
-        index.update_sortable_attributes(["publishedAt", "createdAt"])
-
-        # Configure ranking rules
-        index.update_ranking_rules(
-            [
-                "words",
-                "typo",
-                "proximity",
-                "attribute",
-                "sort",
-                "exactness",
-            ]
-        )
-
-        # Configure typo tolerance for better CJK support
-        index.update_typo_tolerance(
-            {
-                "enabled": True,
-                "minWordSizeForTypos": {
-                    "oneTypo": 4,
-                    "twoTypos": 8,
-                },
-            }
-        )
-
-        logger.info("Meilisearch index settings configured")
+        try:
+            current_settings = index.get_settings()
+        except Exception as e:
+            # Newly created index may not be available yet; update everything
+            logger.debug("Could not fetch index settings", error=str(e))
+            current_settings = {}
+
+        updaters = {
+            "searchableAttributes": index.update_searchable_attributes,
+            "filterableAttributes": index.update_filterable_attributes,
+            "sortableAttributes": index.update_sortable_attributes,
+            "rankingRules": index.update_ranking_rules,
+            "typoTolerance": index.update_typo_tolerance,
+        }
+        updated: list[str] = []
+        for key, desired in _INDEX_SETTINGS.items():
+            if _setting_matches(key, current_settings.get(key), desired):
+                continue
+            updaters[key](desired)
+            updated.append(key)
+
+        _verified_indexes.add(index_name)
+        logger.info("Meilisearch index settings configured", updated=updated)
         return True
 
     except Exception as e:
@@ -306,35 +440,227 @@ def get_index_stats() -> dict[str, Any] | None:
         return None
 
 
-def delete_all_documents() -> bool:
+def _wait_for_task(
+    client: meilisearch.Client,
+    task_uid: int,
+    timeout: float = 60.0,
+    initial_interval: float = 0.5,
+    max_interval: float = 5.0,
+) -> None:
+    """
+    Wait for a Meilisearch task to finish, polling with exponential backoff.
+
+    Parameters
+    ----------
+    client : meilisearch.Client
+        Meilisearch client.
+    task_uid : int
+        UID of the task to wait for.
+    timeout : float, optional
+        Maximum time to wait in seconds (default: 60.0).
+    initial_interval : float, optional
+        First polling interval in seconds (default: 0.5).
+    max_interval : float, optional
+        Upper bound for the polling interval in seconds (default: 5.0).
+
+    Raises
+    ------
+    RuntimeError
+        If the task failed or was canceled.
+    TimeoutError
+        If the task did not finish within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    while True:
+        task = client.get_task(task_uid)
+        if task.status == "succeeded":
+            return
+        if task.status in ("failed", "canceled"):
+            raise RuntimeError(f"Meilisearch task {task_uid} {task.status}: {task.error}")
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Meilisearch task {task_uid} did not finish in {timeout}s")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, max_interval)
+
+
+def wait_for_task(task_uid: int, timeout: float = 60.0) -> tuple[bool, str | None]:
+    """
+    Wait for a previously enqueued Meilisearch task and report its outcome.
+
+    Parameters
+    ----------
+    task_uid : int
+        UID of the task to wait for.
+    timeout : float, optional
+        Maximum time to wait in seconds (default: 60.0).
+
+    Returns
+    -------
+    tuple[bool, str | None]
+        True if the task succeeded, otherwise False and the error message.
+    """
+    client = get_meilisearch_client()
+    if client is None:
+        return False, "Meilisearch not configured"
+
+    try:
+        _wait_for_task(client, task_uid, timeout=timeout)
+        return True, None
+    except Exception as e:
+        logger.error(f"Meilisearch task {task_uid} did not succeed: {e}")
+        return False, str(e)
+
+
+def delete_all_documents(wait: bool = False) -> tuple[bool, int | None]:
     """
     Delete all documents from the Meilisearch index.
 
+    By default the deletion task is only enqueued. Meilisearch processes tasks
+    for an index in order, so documents added afterwards are not affected.
+
+    Parameters
+    ----------
+    wait : bool, optional
+        Wait for the deletion task to complete (default: False).
+
     Returns
     -------
-    bool
-        True if deletion was successful or skipped, False on error.
+    tuple[bool, int | None]
+        Success flag (True if deletion was enqueued/completed or skipped,
+        False on error) and the deletion task UID, if one was created.
     """
     client = get_meilisearch_client()
     if client is None:
-        return True
+        return True, None
 
     try:
         index = client.index(get_index_name())
         task = index.delete_all_documents()
-        # Wait for task to complete
-        client.wait_for_task(task.task_uid, timeout_in_ms=60000)
-        logger.info("Deleted all documents from Meilisearch index")
-        return True
+        if wait:
+            _wait_for_task(client, task.task_uid)
+            logger.info("Deleted all documents from Meilisearch index", task_uid=task.task_uid)
+        else:
+            logger.info(
+                "Enqueued deletion of all documents from Meilisearch index",
+                task_uid=task.task_uid,
+            )
+        return True, task.task_uid
     except Exception as e:
         logger.error(f"Failed to delete all documents: {e}")
-        return False
+        return False, None
+
+
+def _document_id(doc: Any) -> str | None:
+    """Return a document's id; documents can be dict-like or have attributes."""
+    doc_id = doc.get("id") if isinstance(doc, dict) else getattr(doc, "id", None)
+    return str(doc_id) if doc_id else None
+
+
+def _get_document_ids_keyset(index: Any, batch_size: int) -> list[str]:
+    """
+    Page through document IDs with an ``id > last_id`` filter sorted by id.
+
+    Parameters
+    ----------
+    index : Any
+        Meilisearch index.
+    batch_size : int
+        Number of documents to fetch per request.
+
+    Returns
+    -------
+    list[str]
+        Document IDs in ascending order.
+
+    Raises
+    ------
+    MeilisearchApiError
+        If the server rejects string comparison filters or sorting on the
+        documents route.
+    """
+    all_ids: list[str] = []
+    last_id = ""
+
+    while True:
+        # Fetch only the id field to minimize data transfer
+        result = index.get_documents(
+            {
+                "limit": batch_size,
+                "filter": f"id > {json.dumps(last_id)}",
+                "sort": ["id:asc"],
+                "fields": ["id"],
+            }
+        )
+        documents = result.results
+        if not documents:
+            break
+
+        previous_id = last_id
+        for doc in documents:
+            doc_id = _document_id(doc)
+            if doc_id:
+                last_id = doc_id
+                all_ids.append(doc_id)
+
+        if len(documents) < batch_size:
+            break
+        if last_id == previous_id:
+            # No usable id on a full page: the filter would repeat the same page
+            logger.warning("Keyset pagination made no progress", last_id=last_id)
+            break
+
+    return all_ids
+
+
+def _get_document_ids_offset(index: Any, batch_size: int) -> list[str]:
+    """
+    Page through document IDs with offset pagination.
+
+    Parameters
+    ----------
+    index : Any
+        Meilisearch index.
+    batch_size : int
+        Number of documents to fetch per request.
+
+    Returns
+    -------
+    list[str]
+        Document IDs in index order.
+    """
+    all_ids: list[str] = []
+    offset = 0
+
+    while True:
+        result = index.get_documents({"offset": offset, "limit": batch_size, "fields": ["id"]})
+        documents = result.results
+        if not documents:
+            break
+
+        all_ids.extend(doc_id for doc in documents if (doc_id := _document_id(doc)))
+
+        if len(documents) < batch_size:
+            break
+        offset += len(documents)
+
+    return all_ids
 
 
 def get_all_document_ids(batch_size: int = 1000) -> list[str]:
     """
     Get all document IDs from the Meilisearch index.
 
+    Uses keyset pagination on ``id`` (filter ``id > last_id``, sorted
+    ascending) so each page costs the same regardless of its position
+    in the index. This needs Meilisearch >= 1.16 (string comparison filters
+    and sorting on the documents route) and ``id`` to be filterable and
+    sortable (configured by `initialize_index`). If the server rejects the
+    request, e.g. an older version or settings still being applied, falls
+    back to offset pagination.
+
     Parameters
     ----------
     batch_size : int
@@ -351,27 +677,14 @@ def get_all_document_ids(batch_size: int = 1000) -> list[str]:
 
     try:
         index = client.index(get_index_name())
-        all_ids: list[str] = []
-        offset = 0
-
-        while True:
-            # Fetch only the id field to minimize data transfer
-            result = index.get_documents({"offset": offset, "limit": batch_size, "fields": ["id"]})
-            documents = result.results
-
-            if not documents:
-                break
-
-            # Document objects from Meilisearch can be dict-like or have attributes
-            for doc in documents:
-                doc_id = doc.get("id") if isinstance(doc, dict) else getattr(doc, "id", None)
-                if doc_id:
-                    all_ids.append(str(doc_id))
-            offset += len(documents)
-
-            # Check if we've fetched all documents
-            if len(documents) < batch_size:
-                break
+        try:
+            all_ids = _get_document_ids_keyset(index, batch_size)
+        except MeilisearchApiError as e:
+            logger.warning(
+                "Keyset pagination rejected, falling back to offset pagination",
+                error=str(e),
+            )
+            all_ids = _get_document_ids_offset(index, batch_size)
 
         logger.info("Found documents in Meilisearch index", count=len(all_ids))
         return all_ids
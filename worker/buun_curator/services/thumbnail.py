@@ -4,12 +4,13 @@ Thumbnail Service for Buun Curator.
 Handles screenshot processing and upload to S3/MinIO.
 """
 
+import asyncio
 import io
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import threading
+from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING
 
-from aiobotocore.session import get_session
+from aiobotocore.session import AioSession, get_session
 from PIL import Image
 
 from buun_curator.config import Config, get_config
@@ -20,10 +21,57 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Decode, resample and encode all run in Pillow's C code. Pillow wheels bundle
+# libjpeg-turbo, and an API-compatible SIMD build (Pillow-SIMD) is used
+# transparently when installed in place of pillow, so no backend switch lives here.
+
 # Thumbnail settings
 THUMBNAIL_WIDTH = 640
 THUMBNAIL_HEIGHT = 400
 THUMBNAIL_QUALITY = 85
+# Thumbnails are re-uploaded under the same key when an entry is refetched,
+# so allow CDN/browser caching for a day rather than marking them immutable
+THUMBNAIL_CACHE_CONTROL = "public, max-age=86400"
+
+# Per-thread JPEG output buffer reused across _process_screenshot calls
+_thread_local = threading.local()
+
+
+def _get_output_buffer() -> io.BytesIO:
+    """
+    Get the calling thread's reusable output buffer, emptied.
+
+    Returns
+    -------
+    io.BytesIO
+        Empty buffer owned by the current thread.
+    """
+    buffer: io.BytesIO | None = getattr(_thread_local, "output_buffer", None)
+    if buffer is None:
+        buffer = io.BytesIO()
+        _thread_local.output_buffer = buffer
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+
+# S3 clients shared by all ThumbnailService instances for the worker lifetime,
+# keyed by connection settings. One aiobotocore session serves them all so
+# botocore's loaders and the HTTPS connection pools are set up only once.
+_session: AioSession | None = None
+_clients: dict[tuple[str, str | None, str | None, str | None], "S3Client"] = {}
+_clients_exit_stack = AsyncExitStack()
+_clients_lock = asyncio.Lock()
+
+
+async def close_shared_clients() -> None:
+    """
+    Close all shared S3 clients.
+
+    Call once at worker shutdown.
+    """
+    _clients.clear()
+    await _clients_exit_stack.aclose()
 
 
 class ThumbnailService:
@@ -31,6 +79,8 @@ class ThumbnailService:
     Service for processing and uploading thumbnails to S3 or S3-compatible storage.
 
     Supports AWS S3, MinIO, and other S3-compatible storage services.
+    S3 clients are shared across instances and kept open until
+    `close_shared_clients()` is called at worker shutdown.
     """
 
     def __init__(self, config: Config | None = None):
@@ -44,17 +94,16 @@ class ThumbnailService:
         """
         self.config = config or get_config()
 
-    @asynccontextmanager
-    async def _get_client(self) -> AsyncIterator["S3Client"]:
+    async def _get_client(self) -> "S3Client":
         """
-        Get an async S3 client context.
+        Get the shared async S3 client, creating it on first use.
 
-        Yields
-        ------
+        Returns
+        -------
         S3Client
             The aiobotocore S3 client.
         """
-        session = get_session()
+        global _session
 
         # Use endpoint_url only for S3-compatible services (MinIO, etc.)
         # For AWS S3, leave endpoint_url as None
@@ -64,18 +113,31 @@ class ThumbnailService:
         access_key = self.config.s3_access_key if self.config.s3_access_key else None
         secret_key = self.config.s3_secret_key if self.config.s3_secret_key else None
 
-        async with session.create_client(
-            "s3",
-            region_name=self.config.s3_region,
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-        ) as client:
-            yield client
+        key = (self.config.s3_region, endpoint_url, access_key, secret_key)
+        client = _clients.get(key)
+        if client is not None:
+            return client
+
+        async with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                if _session is None:
+                    _session = get_session()
+                client = await _clients_exit_stack.enter_async_context(
+                    _session.create_client(
+                        "s3",
+                        region_name=self.config.s3_region,
+                        endpoint_url=endpoint_url,
+                        aws_access_key_id=access_key,
+                        aws_secret_access_key=secret_key,
+                    )
+                )
+                _clients[key] = client
+        return client
 
     def _process_screenshot(self, screenshot_data: bytes) -> bytes:
         """
-        Process screenshot: resize and optimize as JPEG.
+        Process screenshot: crop, resize and encode as JPEG.
 
         Parameters
         ----------
@@ -90,6 +152,9 @@ class ThumbnailService:
         # Open the image
         img = Image.open(io.BytesIO(screenshot_data))
 
+        # Let libjpeg downscale during decode for JPEG input (no-op for PNG)
+        img.draft("RGB", (THUMBNAIL_WIDTH * 2, THUMBNAIL_HEIGHT * 2))
+
         # Convert to RGB if necessary (PNG might be RGBA)
         if img.mode in ("RGBA", "P"):
             img = img.convert("RGB")
@@ -113,15 +178,21 @@ class ThumbnailService:
 
         img = img.crop(crop_box)
 
-        # Resize to thumbnail size
-        img = img.resize((THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT), Image.Resampling.LANCZOS)
+        # Resize to thumbnail size. reducing_gap first shrinks large images with a
+        # cheap integer reduce (as Image.thumbnail does), then BILINEAR is
+        # sufficient for the final step at this size.
+        img = img.resize(
+            (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT),
+            Image.Resampling.BILINEAR,
+            reducing_gap=3.0,
+        )
 
-        # Save as JPEG
-        output = io.BytesIO()
-        img.save(output, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
-        output.seek(0)
+        # Save as JPEG (optimize=True is skipped: an extra Huffman pass costs far
+        # more CPU than the few percent of size it saves)
+        output = _get_output_buffer()
+        img.save(output, format="JPEG", quality=THUMBNAIL_QUALITY)
 
-        return output.read()
+        return output.getvalue()
 
     def _get_public_url(self, object_key: str) -> str:
         """
@@ -167,8 +238,9 @@ class ThumbnailService:
         str
             Public URL to the uploaded thumbnail.
         """
-        # Process the screenshot
-        thumbnail_data = self._process_screenshot(screenshot_data)
+        # Process the screenshot off the event loop (PIL releases the GIL while
+        # decoding, resizing and encoding)
+        thumbnail_data = await asyncio.to_thread(self._process_screenshot, screenshot_data)
 
         # Generate object key with optional prefix
         # relative_key: path without prefix (for public URL)
@@ -178,13 +250,15 @@ class ThumbnailService:
         object_key = f"{prefix}/{relative_key}" if prefix else relative_key
 
         # Upload to S3
-        async with self._get_client() as client:
-            await client.put_object(
-                Bucket=self.config.s3_bucket,
-                Key=object_key,
-                Body=thumbnail_data,
-                ContentType="image/jpeg",
-            )
+        client = await self._get_client()
+        await client.put_object(
+            Bucket=self.config.s3_bucket,
+            Key=object_key,
+            Body=thumbnail_data,
+            ContentType="image/jpeg",
+            CacheControl=THUMBNAIL_CACHE_CONTROL,
+            ContentDisposition="inline",
+        )
 
         # Build public URL (use relative_key since S3_PUBLIC_URL already includes prefix)
         public_url = self._get_public_url(relative_key)
@@ -198,14 +272,51 @@ class ThumbnailService:
 
         return public_url
 
+    async def upload_thumbnails_batch(
+        self,
+        items: list[tuple[str, bytes]],
+        max_concurrency: int = 16,
+    ) -> dict[str, str]:
+        """
+        Process and upload multiple thumbnails concurrently.
+
+        All uploads share the service's S3 client, and at most
+        ``max_concurrency`` thumbnails are processed or uploaded at once.
+        Failed uploads are logged and omitted from the result.
+
+        Parameters
+        ----------
+        items : list[tuple[str, bytes]]
+            Pairs of entry ID and raw PNG screenshot data.
+        max_concurrency : int, optional
+            Maximum number of concurrent uploads (default: 16).
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping of entry ID to public thumbnail URL for successful uploads.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def upload_one(entry_id: str, screenshot_data: bytes) -> tuple[str, str | None]:
+            async with semaphore:
+                try:
+                    return entry_id, await self.upload_thumbnail(entry_id, screenshot_data)
+                except Exception as e:
+                    logger.warning(f"Failed to upload thumbnail: {e}", entry_id=entry_id)
+                    return entry_id, None
+
+        results = await asyncio.gather(*(upload_one(*item) for item in items))
+        return {entry_id: url for entry_id, url in results if url is not None}
+
     async def ensure_bucket_exists(self) -> None:
         """
         Ensure the S3 bucket exists, create if not.
         """
-        async with self._get_client() as client:
-            try:
-                await client.head_bucket(Bucket=self.config.s3_bucket)
-                logger.debug("Bucket exists", bucket=self.config.s3_bucket)
-            except client.exceptions.ClientError:
-                await client.create_bucket(Bucket=self.config.s3_bucket)
-                logger.info("Created bucket", bucket=self.config.s3_bucket)
+        client = await self._get_client()
+        try:
+            await client.head_bucket(Bucket=self.config.s3_bucket)
+            logger.debug("Bucket exists", bucket=self.config.s3_bucket)
+        except client.exceptions.ClientError:
+            await client.create_bucket(Bucket=self.config.s3_bucket)
+            logger.info("Created bucket", bucket=self.config.s3_bucket)
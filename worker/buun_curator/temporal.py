@@ -8,9 +8,49 @@ from collections.abc import Sequence
 
 from temporalio.client import Client, Interceptor
 from temporalio.contrib.pydantic import pydantic_data_converter
+from temporalio.service import ConnectConfig, KeepAliveConfig, ServiceClient
 
 from buun_curator.config import get_config
 
+# HTTP/2 keepalive pings so idle connections are detected and re-established
+KEEP_ALIVE_CONFIG = KeepAliveConfig(interval_millis=30000, timeout_millis=15000)
+
+# Shared connection for all clients in this process (lazy loaded)
+_service_client: ServiceClient | None = None
+
+
+async def _get_shared_service_client() -> ServiceClient:
+    """
+    Get the process-wide Temporal connection, connecting on first use.
+
+    Returns
+    -------
+    ServiceClient
+        Connected Temporal service client.
+    """
+    global _service_client
+    if _service_client is None:
+        _service_client = await _connect_service_client()
+    return _service_client
+
+
+async def _connect_service_client() -> ServiceClient:
+    """
+    Open a new Temporal connection with the configured host and keepalive.
+
+    Returns
+    -------
+    ServiceClient
+        Connected Temporal service client.
+    """
+    config = get_config()
+    return await ServiceClient.connect(
+        ConnectConfig(
+            target_host=config.temporal_host,
+            keep_alive_config=KEEP_ALIVE_CONFIG,
+        )
+    )
+
 
 async def get_temporal_client(
     interceptors: Sequence[Interceptor] | None = None,
@@ -18,6 +58,9 @@ async def get_temporal_client(
     """
     Create a Temporal client with Pydantic v2 data converter.
 
+    Clients share one connection per process, so repeated calls (e.g., with
+    different interceptors) don't repeat the connection handshake.
+
     Parameters
     ----------
     interceptors : Sequence[Interceptor] | None, optional
@@ -29,9 +72,24 @@ async def get_temporal_client(
         Configured Temporal client.
     """
     config = get_config()
-    return await Client.connect(
-        config.temporal_host,
+    return Client(
+        await _get_shared_service_client(),
         namespace=config.temporal_namespace,
         data_converter=pydantic_data_converter,
         interceptors=interceptors or [],
     )
+
+
+async def get_temporal_service_client() -> ServiceClient:
+    """
+    Create a dedicated Temporal service connection.
+
+    Used for health probes so they do not share the HTTP/2 connection
+    carrying the worker's long polls.
+
+    Returns
+    -------
+    ServiceClient
+        Connected Temporal service client.
+    """
+    return await _connect_service_client()
@@ -13,10 +13,19 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExport
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from temporalio.contrib.opentelemetry import TracingInterceptor
 
 logger = logging.getLogger(__name__)
 
+# Batch span processor defaults, larger and more frequent than the SDK defaults
+# (2048 queue / 512 batch / 5s delay) so bursts of workflow spans are not
+# dropped. Each can be overridden with the standard OTEL_BSP_* variables.
+DEFAULT_BSP_MAX_QUEUE_SIZE = "8192"
+DEFAULT_BSP_MAX_EXPORT_BATCH_SIZE = "2048"
+DEFAULT_BSP_SCHEDULE_DELAY_MS = "1000"
+DEFAULT_BSP_EXPORT_TIMEOUT_MS = "5000"
+
 
 def is_tracing_enabled() -> bool:
     """Check if tracing is enabled via environment variable."""
@@ -53,8 +62,13 @@ def init_tracing() -> TracingInterceptor | None:
         }
     )
 
+    # Sample root traces by ratio (default: keep all); child spans follow their
+    # parent's decision so traces are never partially recorded
+    sample_ratio = float(os.getenv("OTEL_TRACES_SAMPLER_ARG", "1.0"))
+    sampler = ParentBased(TraceIdRatioBased(sample_ratio))
+
     # Set global TracerProvider (can only be done once)
-    provider = TracerProvider(resource=resource)
+    provider = TracerProvider(resource=resource, sampler=sampler)
     trace.set_tracer_provider(provider)
 
     # Create OTLP exporter with batch processor
@@ -62,7 +76,21 @@ def init_tracing() -> TracingInterceptor | None:
         endpoint=endpoint,
         insecure=os.getenv("OTEL_EXPORTER_OTLP_INSECURE", "true").lower() == "true",
     )
-    provider.add_span_processor(BatchSpanProcessor(exporter))
+    max_queue_size = int(os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", DEFAULT_BSP_MAX_QUEUE_SIZE))
+    max_export_batch_size = int(
+        os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", DEFAULT_BSP_MAX_EXPORT_BATCH_SIZE)
+    )
+    schedule_delay_ms = float(os.getenv("OTEL_BSP_SCHEDULE_DELAY", DEFAULT_BSP_SCHEDULE_DELAY_MS))
+    export_timeout_ms = float(os.getenv("OTEL_BSP_EXPORT_TIMEOUT", DEFAULT_BSP_EXPORT_TIMEOUT_MS))
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=max_queue_size,
+            schedule_delay_millis=schedule_delay_ms,
+            max_export_batch_size=max_export_batch_size,
+            export_timeout_millis=export_timeout_ms,
+        )
+    )
 
     logger.info("Tracing initialized successfully")
     return TracingInterceptor()
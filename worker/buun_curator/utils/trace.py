@@ -2,16 +2,19 @@
 Trace ID utilities for Langfuse integration.
 """
 
+import functools
 import hashlib
 
 
+@functools.lru_cache(maxsize=4096)
 def generate_entry_trace_id(entry_id: str, batch_trace_id: str | None = None) -> str:
     """
     Generate a deterministic trace_id for an entry.
 
-    Uses SHA256 hash to create a 32-char hex trace_id from entry_id.
+    Uses a 16-byte BLAKE2b hash to create a 32-char hex trace_id from entry_id.
     If batch_trace_id is provided, it's included in the hash for uniqueness
-    across different batch runs.
+    across different batch runs. Results are cached since the same entry is
+    traced several times within a batch.
 
     Parameters
     ----------
@@ -26,4 +29,4 @@ def generate_entry_trace_id(entry_id: str, batch_trace_id: str | None = None) ->
         32-character lowercase hex trace_id compatible with Langfuse SDK v3.
     """
     hash_input = f"{entry_id}:{batch_trace_id or ''}"
-    return hashlib.sha256(hash_input.encode()).hexdigest()[:32]
+    return hashlib.blake2b(hash_input.encode(), digest_size=16).hexdigest()
@@ -4,11 +4,61 @@ URL normalization utilities.
 Provides URL normalization for deduplication purposes.
 """
 
-from urllib.parse import urlparse
+import functools
+import re
+from urllib.parse import urlparse, urlsplit
 
 from url_normalize import url_normalize
 
+# Default ports removed from netloc, keyed by scheme
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
 
+# URLs containing any of these need the full url-normalize treatment
+# (percent-encoding fixup, quoting of unsafe characters, dot-segment removal,
+# ;params stripping).
+# Non-ASCII URLs (IDN hosts, unicode paths) are checked separately.
+_NEEDS_FULL_NORMALIZE = re.compile(r"[%;\s\"<>\\^`{|}]|/\.")
+
+
+def _normalize_simple(url: str) -> str | None:
+    """
+    Normalize a plain http(s) URL with a single urlsplit pass.
+
+    Parameters
+    ----------
+    url : str
+        The URL to normalize.
+
+    Returns
+    -------
+    str | None
+        Normalized URL, or None if the URL needs full normalization.
+    """
+    if not url.isascii() or _NEEDS_FULL_NORMALIZE.search(url):
+        return None
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    netloc = parts.netloc
+    # Userinfo keeps its case and IPv6 hosts have their own port syntax
+    if default_port is None or not netloc or "@" in netloc or "[" in netloc:
+        return None
+
+    host, sep, port = netloc.lower().partition(":")
+    # url-normalize strips a trailing dot from the host, collapses empty path
+    # segments and rewrites non-canonical ports (empty, leading zeros)
+    if not host or host.endswith(".") or "//" in parts.path:
+        return None
+    if sep and (not port.isdigit() or port.startswith("0")):
+        return None
+
+    netloc = host if not sep or f":{port}" == default_port else f"{host}:{port}"
+    path = parts.path.rstrip("/") or "/"
+    return f"{scheme}://{netloc}{path}"
+
+
+@functools.lru_cache(maxsize=16384)
 def normalize_url_for_dedup(url: str) -> str:
     """
     Normalize URL for deduplication.
@@ -20,6 +70,9 @@ def normalize_url_for_dedup(url: str) -> str:
     - Remove fragment (#section)
     - Remove trailing slash (except for root path)
 
+    Plain http(s) URLs are handled with a single urlsplit pass; URLs that need
+    IDN, percent-encoding or dot-segment handling fall back to url-normalize.
+
     Parameters
     ----------
     url : str
@@ -39,6 +92,10 @@ def normalize_url_for_dedup(url: str) -> str:
     >>> normalize_url_for_dedup("HTTP://EXAMPLE.COM/Path#sec")
     'http://example.com/Path'
     """
+    simple = _normalize_simple(url)
+    if simple is not None:
+        return simple
+
     # Use url-normalize for standard normalization (lowercase, port removal)
     # filter_params=True with empty allowlist removes all query params
     normalized = url_normalize(url, filter_params=True, param_allowlist=[])
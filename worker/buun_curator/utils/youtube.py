@@ -4,17 +4,25 @@ YouTube URL detection utilities.
 
 import re
 
-# YouTube URL patterns
-_YOUTUBE_PATTERNS = [
-    # Standard watch URL: youtube.com/watch?v=VIDEO_ID
-    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})"),
-    # Short URL: youtu.be/VIDEO_ID
-    re.compile(r"(?:https?://)?youtu\.be/([a-zA-Z0-9_-]{11})"),
-    # Embed URL: youtube.com/embed/VIDEO_ID
-    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})"),
-    # Shorts URL: youtube.com/shorts/VIDEO_ID
-    re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})"),
-]
+# YouTube URL pattern, combined into one alternation so a URL is scanned once:
+# - Standard watch URL: youtube.com/watch?v=VIDEO_ID
+# - Short URL: youtu.be/VIDEO_ID
+# - Embed URL: youtube.com/embed/VIDEO_ID
+# - Shorts URL: youtube.com/shorts/VIDEO_ID
+_YOUTUBE_PATTERN = re.compile(
+    r"(?:https?://)?"
+    r"(?:(?:www\.)?youtube\.com/(?:watch\?v=|embed/|shorts/)|youtu\.be/)"
+    r"([a-zA-Z0-9_-]{11})"
+)
+
+# Literal markers, one of which every match of _YOUTUBE_PATTERN contains.
+# Checked with plain substring scans before running the regex.
+_YOUTUBE_MARKERS = (
+    "youtube.com/watch?v=",
+    "youtu.be/",
+    "youtube.com/embed/",
+    "youtube.com/shorts/",
+)
 
 
 def extract_youtube_video_id(url: str) -> str | None:
@@ -31,11 +39,10 @@ def extract_youtube_video_id(url: str) -> str | None:
     str | None
         The YouTube video ID if found, None otherwise.
     """
-    for pattern in _YOUTUBE_PATTERNS:
-        match = pattern.search(url)
-        if match:
-            return match.group(1)
-    return None
+    if not any(marker in url for marker in _YOUTUBE_MARKERS):
+        return None
+    match = _YOUTUBE_PATTERN.search(url)
+    return match.group(1) if match else None
 
 
 def is_youtube_url(url: str) -> bool:
@@ -6,12 +6,17 @@ Supports hot reload via --reload flag for development.
 """
 
 import asyncio
+import functools
 import logging
 import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
-import temporalio.api.workflowservice.v1
-from temporalio.worker import Worker
+from temporalio.worker import ResourceBasedSlotConfig, Worker, WorkerTuner
 from temporalio.worker.workflow_sandbox import (
     SandboxedWorkflowRunner,
     SandboxRestrictions,
@@ -48,6 +53,7 @@ from buun_curator.activities import (
     get_entry,
     get_entry_ids_for_indexing,
     get_feed_options,
+    get_graph_rag_session_state,
     get_orphaned_document_ids,
     index_entries_batch,
     init_search_index,
@@ -70,12 +76,15 @@ from buun_curator.activities import (
     search_github_repository,
     search_graph_rag_session,
     update_entry_index,
+    wait_for_search_task,
 )
-from buun_curator.config import get_config
-from buun_curator.health import HealthServer
+from buun_curator.config import Config, get_config
+from buun_curator.health import HealthServer, TaskActivityTracker
 from buun_curator.logging import configure_logging as configure_structlog
 from buun_curator.logging import get_logger
-from buun_curator.temporal import get_temporal_client
+from buun_curator.services.content import close_shared_crawler
+from buun_curator.services.thumbnail import close_shared_clients
+from buun_curator.temporal import get_temporal_client, get_temporal_service_client
 from buun_curator.tracing import init_tracing, shutdown_tracing
 from buun_curator.workflows import (
     AllFeedsIngestionWorkflow,
@@ -102,6 +111,186 @@ from buun_curator.workflows import (
     UpdateEntryIndexWorkflow,
 )
 
+# Worker registrations, built once at import time
+_WORKFLOWS: tuple[type, ...] = (
+    AllFeedsIngestionWorkflow,
+    ContentDistillationWorkflow,
+    ContextCollectionWorkflow,
+    DeepResearchWorkflow,
+    DeleteEnrichmentWorkflow,
+    DomainFetchWorkflow,
+    EmbeddingBackfillWorkflow,
+    EntriesCleanupWorkflow,
+    EvaluationWorkflow,
+    ExtractEntryContextWorkflow,
+    FetchEntryLinksWorkflow,
+    GlobalGraphUpdateWorkflow,
+    GraphRebuildWorkflow,
+    PreviewFetchWorkflow,
+    ReprocessEntriesWorkflow,
+    ScheduleFetchWorkflow,
+    SearchPruneWorkflow,
+    SearchReindexWorkflow,
+    SingleFeedIngestionWorkflow,
+    SummarizationEvaluationWorkflow,
+    TranslationWorkflow,
+    UpdateEntryIndexWorkflow,
+)
+
+# Activities served on the main task queue
+_ACTIVITIES: tuple[Callable[..., Any], ...] = (
+    # Cleanup
+    cleanup_old_entries,
+    # Crawl
+    crawl_feeds,
+    crawl_single_feed,
+    get_feed_options,
+    list_feeds,
+    # Fetch
+    fetch_and_save_entry_links,
+    fetch_contents,
+    fetch_single_content,
+    # API
+    get_app_settings,
+    get_entry,
+    get_entries,
+    list_unsummarized_entry_ids,
+    save_entry_context,
+    # Notify (local activity for SSE)
+    notify_progress,
+    # Content distillation
+    get_entries_for_distillation,
+    save_distilled_entries,
+    # Embedding
+    get_entries_for_embedding,
+    # Translate
+    get_entries_for_translation,
+    save_translations,
+    # DeepL Translate
+    deepl_translate_entries,
+    # MS Translate
+    ms_translate_entries,
+    # Search index
+    clear_search_index,
+    get_entry_ids_for_indexing,
+    get_orphaned_document_ids,
+    index_entries_batch,
+    init_search_index,
+    remove_documents_from_index,
+    update_entry_index,
+    wait_for_search_task,
+    # Context extraction
+    extract_entry_context,
+    # GitHub enrichment
+    search_github_repository,
+    search_github_candidates,
+    fetch_github_readme,
+    rerank_github_results,
+    save_github_enrichment,
+    delete_enrichment,
+    # Web page enrichment
+    save_web_page_enrichment,
+    # Entry links
+    save_entry_links,
+    # Global graph
+    add_to_global_graph,
+    get_entries_for_graph_update,
+    mark_entries_graph_added,
+    reset_global_graph,
+    # GraphRAG session (Graphiti)
+    close_graph_rag_session,
+    get_graph_rag_session_state,
+    reset_graph_rag_session,
+    search_graph_rag_session,
+)
+
+# Long-running LLM/graph/embedding activities served on the heavy task queue
+_HEAVY_ACTIVITIES: tuple[Callable[..., Any], ...] = (
+    # Content distillation
+    distill_entry_content,
+    # Embedding
+    compute_embeddings,
+    # Global graph
+    add_to_global_graph_bulk,
+    fetch_and_add_to_graph_bulk,
+    # GraphRAG session (Graphiti)
+    add_to_graph_rag_session,
+    build_graph_rag_graph,
+    # Evaluation
+    evaluate_ragas,
+    evaluate_summarization,
+)
+
+# Sub-second calls that workflows run as local activities (no task queue
+# round trip); they execute on the worker running the workflow, so workflow-only
+# workers must register them too
+_LOCAL_ACTIVITIES: tuple[Callable[..., Any], ...] = (
+    delete_enrichment,
+    get_app_settings,
+    get_entries_for_embedding,
+    get_entry,
+    get_feed_options,
+    notify_progress,
+)
+
+# Valid WORKER_ROLE values
+WORKER_ROLES = ("both", "workflow", "activity")
+
+
+def registrations_for_role(
+    role: str,
+) -> tuple[tuple[type, ...], tuple[Callable[..., Any], ...], tuple[Callable[..., Any], ...]]:
+    """
+    Select the workflows and activities a worker registers for its role.
+
+    Parameters
+    ----------
+    role : str
+        "both" registers everything, "workflow" only workflows and
+        "activity" only activities (main and heavy queues). Workflow workers
+        also register the local activities their workflows call.
+
+    Returns
+    -------
+    tuple
+        (workflows, activities, heavy_activities) to register.
+
+    Raises
+    ------
+    ValueError
+        If the role is not one of WORKER_ROLES.
+    """
+    if role not in WORKER_ROLES:
+        raise ValueError(f"Invalid WORKER_ROLE '{role}' (expected one of {WORKER_ROLES})")
+    workflows = _WORKFLOWS if role != "activity" else ()
+    if role == "workflow":
+        return workflows, _LOCAL_ACTIVITIES, ()
+    return workflows, _ACTIVITIES, _HEAVY_ACTIVITIES
+
+
+# Loggers controlled by LIGHTRAG_LOG_LEVEL
+_LIGHTRAG_LOGGERS = ("lightrag", "buun_curator.lightrag")
+
+
+@functools.cache
+def _level(env_name: str, default: str) -> int:
+    """
+    Resolve a numeric log level from an environment variable (cached per process).
+
+    Parameters
+    ----------
+    env_name : str
+        Environment variable holding the level name (e.g., "DEBUG").
+    default : str
+        Level name used when the variable is not set.
+
+    Returns
+    -------
+    int
+        Numeric logging level.
+    """
+    return getattr(logging, os.getenv(env_name, default).upper())
+
 
 def configure_logging() -> None:
     """Configure logging for the worker."""
@@ -110,24 +299,28 @@ def configure_logging() -> None:
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     environment = os.getenv("ENVIRONMENT", "development")
 
+    # Production JSON logs go through a block-buffered stdout so bursts of
+    # records share write syscalls (LOG_BUFFER_BYTES, default: 64 KiB)
+    json_logs = environment != "development"
+    stream = None
+    if json_logs:
+        buffer_bytes = int(os.getenv("LOG_BUFFER_BYTES", str(64 * 1024)))
+        stream = open(  # noqa: SIM115 - kept open for the process lifetime
+            sys.stdout.fileno(), "w", buffering=buffer_bytes, encoding="utf-8", closefd=False
+        )
+
     # Use structlog for structured logging with trace context
     configure_structlog(
-        json_logs=environment != "development",
+        json_logs=json_logs,
         log_level=log_level,
         component="worker",
+        stream=stream,
     )
 
-    # Add filter to root handler to strip context dicts from Temporal SDK log messages
-    # (Filters on loggers don't apply to child loggers, so we add to handler instead)
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers:
-        handler.addFilter(WorkflowLogFilter())
-
     # Temporal SDK logging - set via TEMPORAL_LOG_LEVEL env var (default: WARNING)
     # temporalio.workflow is set to LOG_LEVEL to see workflow.logger output
-    temporal_log_level = os.getenv("TEMPORAL_LOG_LEVEL", "WARNING").upper()
-    logging.getLogger("temporalio").setLevel(getattr(logging, temporal_log_level))
-    logging.getLogger("temporalio.workflow").setLevel(getattr(logging, log_level))
+    logging.getLogger("temporalio").setLevel(_level("TEMPORAL_LOG_LEVEL", "WARNING"))
+    logging.getLogger("temporalio.workflow").setLevel(_level("LOG_LEVEL", "INFO"))
 
     # Suppress noisy HTTP client logs (httpx/httpcore trace logs)
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -135,43 +328,181 @@ def configure_logging() -> None:
 
     # Graphiti logging - set to DEBUG to see LLM communication details
     # Set via GRAPHITI_LOG_LEVEL env var (default: WARNING)
-    graphiti_log_level = os.getenv("GRAPHITI_LOG_LEVEL", "WARNING").upper()
-    logging.getLogger("graphiti_core").setLevel(getattr(logging, graphiti_log_level))
-    logging.getLogger("buun_curator.graphiti").setLevel(getattr(logging, graphiti_log_level))
+    graphiti_log_level = _level("GRAPHITI_LOG_LEVEL", "WARNING")
+    logging.getLogger("graphiti_core").setLevel(graphiti_log_level)
+    logging.getLogger("buun_curator.graphiti").setLevel(graphiti_log_level)
 
     # LightRAG logging - set to DEBUG to see LLM communication details
     # Set via LIGHTRAG_LOG_LEVEL env var (default: WARNING)
-    lightrag_log_level = os.getenv("LIGHTRAG_LOG_LEVEL", "WARNING").upper()
-    for logger_name in [
-        "lightrag",
-        "buun_curator.lightrag",
-    ]:
-        logging.getLogger(logger_name).setLevel(getattr(logging, lightrag_log_level))
-
-
-class WorkflowLogFilter(logging.Filter):
-    """Filter to remove Temporal context dict from workflow log messages."""
-
-    def filter(self, record: logging.LogRecord) -> bool:
-        """Remove trailing context dict from workflow log messages."""
-        msg = record.getMessage()
-        # Temporal SDK appends " ({'attempt': ..., ...})" or " ({...})" to messages
-        if msg.endswith(")"):
-            # Try both patterns: " ({'" (dict with string keys) and " ({" (any dict)
-            for pattern in (" ({'", ' ({"'):
-                if pattern in msg:
-                    idx = msg.rfind(pattern)
-                    if idx > 0:
-                        record.msg = msg[:idx]
-                        record.args = ()
-                        break
-        return True
+    lightrag_log_level = _level("LIGHTRAG_LOG_LEVEL", "WARNING")
+    for logger_name in _LIGHTRAG_LOGGERS:
+        logging.getLogger(logger_name).setLevel(lightrag_log_level)
+
+
+# Resource-based tuner targets (fraction of host CPU / memory)
+TUNER_TARGET_CPU_USAGE = 0.8
+TUNER_TARGET_MEMORY_USAGE = 0.8
+
+# Threads for blocking calls made by activities (asyncio.to_thread etc.)
+# when MAX_CONCURRENT_ACTIVITIES is not set
+DEFAULT_BLOCKING_THREADS = 32
+
+
+def default_activity_slots(cpu_count: int) -> int:
+    """
+    Return the default activity slot count for the I/O-bound worker.
+
+    Parameters
+    ----------
+    cpu_count : int
+        Number of CPUs available to the process.
+
+    Returns
+    -------
+    int
+        Maximum concurrent activities.
+    """
+    return min(200, max(32, cpu_count * 16))
+
+
+def default_heavy_activity_slots(cpu_count: int) -> int:
+    """
+    Return the default activity slot count for the heavy worker.
+
+    Parameters
+    ----------
+    cpu_count : int
+        Number of CPUs available to the process.
+
+    Returns
+    -------
+    int
+        Maximum concurrent heavy activities.
+    """
+    return max(4, cpu_count)
+
+
+def build_worker_tuning(config: Config, cpu_count: int) -> dict[str, Any]:
+    """
+    Build the concurrency keyword arguments for the main Worker.
+
+    If any ``MAX_CONCURRENT_*`` limit is configured, fixed slot counts are used
+    (unset activity limit falls back to ``default_activity_slots``). Otherwise a
+    resource-based tuner sizes slots dynamically against CPU/memory targets.
+
+    Parameters
+    ----------
+    config : Config
+        Worker configuration.
+    cpu_count : int
+        Number of CPUs available to the process.
+
+    Returns
+    -------
+    dict[str, Any]
+        Either ``tuner`` or ``max_concurrent_*`` keyword arguments for Worker.
+    """
+    activity_slots = default_activity_slots(cpu_count)
+    if (
+        config.max_concurrent_activities
+        or config.max_concurrent_workflow_tasks
+        or config.max_concurrent_local_activities
+    ):
+        # Tuner and max_concurrent_* are mutually exclusive
+        return {
+            "max_concurrent_activities": config.max_concurrent_activities or activity_slots,
+            "max_concurrent_workflow_tasks": config.max_concurrent_workflow_tasks or None,
+            "max_concurrent_local_activities": config.max_concurrent_local_activities or None,
+        }
+
+    return {
+        "tuner": WorkerTuner.create_resource_based(
+            target_memory_usage=TUNER_TARGET_MEMORY_USAGE,
+            target_cpu_usage=TUNER_TARGET_CPU_USAGE,
+            activity_config=ResourceBasedSlotConfig(maximum_slots=activity_slots),
+        )
+    }
+
+
+# CPUs of the first NUMA node, used for WORKER_CPU_AFFINITY=numa
+NUMA_NODE0_CPULIST = Path("/sys/devices/system/node/node0/cpulist")
+
+
+def parse_cpulist(cpulist: str) -> set[int]:
+    """
+    Parse a Linux cpulist string such as ``"0-3,8,10-11"``.
+
+    Parameters
+    ----------
+    cpulist : str
+        Comma-separated CPU numbers and inclusive ranges.
+
+    Returns
+    -------
+    set[int]
+        CPU numbers in the list.
+
+    Raises
+    ------
+    ValueError
+        If the string is not a valid cpulist.
+    """
+    cpus: set[int] = set()
+    for part in cpulist.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def apply_cpu_affinity(spec: str) -> set[int] | None:
+    """
+    Pin the worker process to a CPU set.
+
+    Must run before the Temporal client starts its runtime threads, since
+    threads inherit the affinity of the thread that creates them.
+
+    Parameters
+    ----------
+    spec : str
+        ``"numa"`` to use the CPUs of NUMA node 0, a cpulist such as
+        ``"0-7"``, or empty to leave the process unpinned.
+
+    Returns
+    -------
+    set[int] | None
+        The CPUs the process is pinned to, or None if affinity was not changed.
+    """
+    if not spec or not hasattr(os, "sched_setaffinity"):
+        return None
+
+    if spec == "numa":
+        try:
+            cpus = parse_cpulist(NUMA_NODE0_CPULIST.read_text())
+        except OSError:
+            return None
+    else:
+        cpus = parse_cpulist(spec)
+
+    # Never pin to CPUs outside the cgroup/cpuset the process may run on
+    cpus &= os.sched_getaffinity(0)
+    if not cpus:
+        return None
+    os.sched_setaffinity(0, cpus)
+    return cpus
 
 
 async def run_worker() -> None:
     """Run the Temporal worker."""
     config = get_config()
     logger = get_logger("buun-curator")
+    workflows, activities, heavy_activities = registrations_for_role(config.worker_role)
+    pinned_cpus = apply_cpu_affinity(config.worker_cpu_affinity)
+    if pinned_cpus:
+        logger.info(f"Pinned worker to {len(pinned_cpus)} CPUs: {sorted(pinned_cpus)}")
+    elif config.worker_cpu_affinity:
+        logger.warning(f"CPU affinity '{config.worker_cpu_affinity}' not applied")
 
     # Initialize tracing (returns interceptor if enabled, None otherwise)
     tracing_interceptor = init_tracing()
@@ -182,76 +513,116 @@ async def run_worker() -> None:
     # Pass tracing interceptor to Client.connect() per Temporal docs
     interceptors = [tracing_interceptor] if tracing_interceptor else []
     client = await get_temporal_client(interceptors=interceptors)
+    # Separate connection for health probes so they don't queue behind worker polls
+    health_service_client = await get_temporal_service_client()
 
     # Create health check function that verifies Temporal connectivity
     # Track consecutive failures to avoid flapping on transient errors
-    health_check_failures = 0
+    # Single-slot list instead of a nonlocal int: the check runs on the health
+    # server's thread, and item assignment is a single atomic store
+    health_check_failures = [0]
     max_consecutive_failures = 2  # Allow 1 transient failure
+    # A task received recently proves polling works, so skip the health RPC
+    task_tracker = TaskActivityTracker()
+    recent_task_window = 30.0
 
     async def temporal_health_check() -> bool:
-        nonlocal health_check_failures
+        if task_tracker.seen_within(recent_task_window):
+            health_check_failures[0] = 0
+            return True
         try:
-            # Describe namespace to verify gRPC connectivity
-            # Use a short timeout to avoid blocking
-            await asyncio.wait_for(
-                client.service_client.workflow_service.describe_namespace(
-                    temporalio.api.workflowservice.v1.DescribeNamespaceRequest(
-                        namespace=client.namespace
-                    )
-                ),
+            # gRPC Health/Check verifies connectivity without the server-side cost
+            # of DescribeNamespace. Use a short timeout to avoid blocking
+            serving = await asyncio.wait_for(
+                health_service_client.check_health(timeout=timedelta(seconds=1)),
                 timeout=5.0,
             )
-            health_check_failures = 0  # Reset on success
+            if not serving:
+                raise RuntimeError("Temporal WorkflowService is not serving")
+            health_check_failures[0] = 0  # Reset on success
             return True
         except asyncio.CancelledError:
             # Don't count cancellation as failure (happens during shutdown)
             logger.warning("Temporal health check was cancelled")
             return True
         except TimeoutError:
-            health_check_failures += 1
+            health_check_failures[0] += 1
             logger.warning(
                 f"Temporal health check timed out "
-                f"(failure {health_check_failures}/{max_consecutive_failures})"
+                f"(failure {health_check_failures[0]}/{max_consecutive_failures})"
             )
-            return health_check_failures < max_consecutive_failures
+            return health_check_failures[0] < max_consecutive_failures
         except Exception as e:
-            health_check_failures += 1
+            health_check_failures[0] += 1
             # Log as warning for transient errors, error for persistent ones
-            if health_check_failures < max_consecutive_failures:
+            if health_check_failures[0] < max_consecutive_failures:
                 logger.warning(
                     f"Temporal health check failed (transient): {e} "
-                    f"(failure {health_check_failures}/{max_consecutive_failures})"
+                    f"(failure {health_check_failures[0]}/{max_consecutive_failures})"
                 )
                 return True  # Allow transient failure
             else:
                 logger.error(
                     f"Temporal health check failed (persistent): {e} "
-                    f"(failure {health_check_failures}/{max_consecutive_failures})"
+                    f"(failure {health_check_failures[0]}/{max_consecutive_failures})"
                 )
                 return False
 
     # Start health server
     health_port = int(os.getenv("HEALTH_PORT", "8080"))
     health_server = HealthServer(port=health_port, health_check=temporal_health_check)
-    await health_server.start()
+    # Serve probes on a separate thread/loop so a busy worker loop can't delay them
+    health_server.start_in_thread()
 
+    logger.info(f"Worker role: {config.worker_role}")
     logger.info(f"Starting worker on task queue: {config.task_queue}")
+    if heavy_activities:
+        logger.info(f"Starting heavy worker on task queue: {config.heavy_task_queue}")
+
+    # Resolve and log concurrency settings
+    cpu_count = len(pinned_cpus) if pinned_cpus else os.cpu_count() or 1
+    worker_tuning = build_worker_tuning(config, cpu_count)
+    if "tuner" in worker_tuning:
+        logger.info(
+            f"Using resource-based tuner (target CPU: {TUNER_TARGET_CPU_USAGE}, "
+            f"target memory: {TUNER_TARGET_MEMORY_USAGE}, "
+            f"max activities: {default_activity_slots(cpu_count)})"
+        )
+    else:
+        logger.info(f"Max concurrent activities: {worker_tuning['max_concurrent_activities']}")
+        if config.max_concurrent_workflow_tasks:
+            logger.info(f"Max concurrent workflow tasks: {config.max_concurrent_workflow_tasks}")
+        if config.max_concurrent_local_activities:
+            logger.info(
+                f"Max concurrent local activities: {config.max_concurrent_local_activities}"
+            )
+    heavy_activity_slots = config.max_concurrent_heavy_activities
+    if not heavy_activity_slots:
+        heavy_activity_slots = default_heavy_activity_slots(cpu_count)
+    if heavy_activities:
+        logger.info(f"Max concurrent heavy activities: {heavy_activity_slots}")
+    logger.info(
+        f"Disable eager activity execution: {config.temporal_disable_eager_activity_execution}"
+    )
 
-    # Log concurrency settings
-    if config.max_concurrent_activities:
-        logger.info(f"Max concurrent activities: {config.max_concurrent_activities}")
-    if config.max_concurrent_workflow_tasks:
-        logger.info(f"Max concurrent workflow tasks: {config.max_concurrent_workflow_tasks}")
-    if config.max_concurrent_local_activities:
-        logger.info(f"Max concurrent local activities: {config.max_concurrent_local_activities}")
-
-    # Configure sandbox to passthrough Pydantic's lazy-loaded modules
+    # Configure sandbox to passthrough Pydantic's lazy-loaded modules and the
+    # deterministic project modules workflows import (models, activity
+    # definitions, config, utils), so they are imported once in the host
+    # process instead of re-imported per workflow run. Stdlib modules are
+    # already passed through by the SDK defaults. idna is passed through so
+    # its large UTS46 table, loaded lazily by url-normalize only for non-ASCII
+    # hosts, is also imported once per process.
     sandbox_runner = SandboxedWorkflowRunner(
         restrictions=SandboxRestrictions.default.with_passthrough_modules(
             "annotated_types",
+            "idna",
             "pydantic_core",
             "pydantic_core._pydantic_core",
             "pydantic_core.core_schema",
+            "buun_curator.activities",
+            "buun_curator.config",
+            "buun_curator.models",
+            "buun_curator.utils",
         )
     )
 
@@ -259,121 +630,48 @@ async def run_worker() -> None:
         client,
         task_queue=config.task_queue,
         workflow_runner=sandbox_runner,
-        interceptors=interceptors,
-        workflows=[
-            AllFeedsIngestionWorkflow,
-            ContentDistillationWorkflow,
-            ContextCollectionWorkflow,
-            DeepResearchWorkflow,
-            DeleteEnrichmentWorkflow,
-            DomainFetchWorkflow,
-            EmbeddingBackfillWorkflow,
-            EntriesCleanupWorkflow,
-            EvaluationWorkflow,
-            ExtractEntryContextWorkflow,
-            FetchEntryLinksWorkflow,
-            GlobalGraphUpdateWorkflow,
-            GraphRebuildWorkflow,
-            PreviewFetchWorkflow,
-            ReprocessEntriesWorkflow,
-            ScheduleFetchWorkflow,
-            SearchPruneWorkflow,
-            SearchReindexWorkflow,
-            SingleFeedIngestionWorkflow,
-            SummarizationEvaluationWorkflow,
-            TranslationWorkflow,
-            UpdateEntryIndexWorkflow,
-        ],
-        activities=[
-            # Cleanup
-            cleanup_old_entries,
-            # Crawl
-            crawl_feeds,
-            crawl_single_feed,
-            get_feed_options,
-            list_feeds,
-            # Fetch
-            fetch_and_save_entry_links,
-            fetch_contents,
-            fetch_single_content,
-            # API
-            get_app_settings,
-            get_entry,
-            get_entries,
-            list_unsummarized_entry_ids,
-            save_entry_context,
-            # Notify (local activity for SSE)
-            notify_progress,
-            # Content distillation
-            get_entries_for_distillation,
-            distill_entry_content,
-            save_distilled_entries,
-            # Embedding
-            compute_embeddings,
-            get_entries_for_embedding,
-            # Translate
-            get_entries_for_translation,
-            save_translations,
-            # DeepL Translate
-            deepl_translate_entries,
-            # MS Translate
-            ms_translate_entries,
-            # Search index
-            clear_search_index,
-            get_entry_ids_for_indexing,
-            get_orphaned_document_ids,
-            index_entries_batch,
-            init_search_index,
-            remove_documents_from_index,
-            update_entry_index,
-            # Context extraction
-            extract_entry_context,
-            # GitHub enrichment
-            search_github_repository,
-            search_github_candidates,
-            fetch_github_readme,
-            rerank_github_results,
-            save_github_enrichment,
-            delete_enrichment,
-            # Web page enrichment
-            save_web_page_enrichment,
-            # Entry links
-            save_entry_links,
-            # Global graph
-            add_to_global_graph,
-            add_to_global_graph_bulk,
-            fetch_and_add_to_graph_bulk,
-            get_entries_for_graph_update,
-            mark_entries_graph_added,
-            reset_global_graph,
-            # GraphRAG session (Graphiti)
-            add_to_graph_rag_session,
-            build_graph_rag_graph,
-            close_graph_rag_session,
-            reset_graph_rag_session,
-            search_graph_rag_session,
-            # Evaluation
-            evaluate_ragas,
-            evaluate_summarization,
-        ],
-        # Concurrency limits (None = use Temporal defaults)
-        max_concurrent_activities=(
-            config.max_concurrent_activities if config.max_concurrent_activities else None
-        ),
-        max_concurrent_workflow_tasks=(
-            config.max_concurrent_workflow_tasks if config.max_concurrent_workflow_tasks else None
-        ),
-        max_concurrent_local_activities=(
-            config.max_concurrent_local_activities
-            if config.max_concurrent_local_activities
-            else None
-        ),
+        interceptors=[*interceptors, task_tracker],
+        workflows=workflows,
+        activities=activities,
+        # Let activities go through the task queue instead of being pinned to this
+        # worker, so they are balanced across workers and respect the limits below
+        disable_eager_activity_execution=config.temporal_disable_eager_activity_execution,
+        # Concurrency limits (fixed slots or resource-based tuner)
+        **worker_tuning,
+    )
+
+    workers = [worker]
+
+    # Long-running LLM/graph/embedding activities get their own queue and
+    # concurrency budget so they cannot starve the fast activities above
+    if heavy_activities:
+        workers.append(
+            Worker(
+                client,
+                task_queue=config.heavy_task_queue,
+                interceptors=[*interceptors, task_tracker],
+                activities=heavy_activities,
+                max_concurrent_activities=heavy_activity_slots,
+            )
+        )
+
+    # All activities are async; blocking calls they offload via
+    # asyncio.to_thread / run_in_executor(None, ...) share one long-lived
+    # pool sized to the activity limit instead of the loop's implicit default
+    blocking_executor = ThreadPoolExecutor(
+        max_workers=config.max_concurrent_activities or DEFAULT_BLOCKING_THREADS,
+        thread_name_prefix="act",
     )
+    asyncio.get_running_loop().set_default_executor(blocking_executor)
 
     logger.info("Worker started, waiting for tasks...")
     try:
-        await worker.run()
+        await asyncio.gather(*(w.run() for w in workers))
     finally:
+        blocking_executor.shutdown(wait=False, cancel_futures=True)
+        health_server.stop_thread()
+        await close_shared_clients()
+        await close_shared_crawler()
         shutdown_tracing()
 
 
@@ -1,31 +1,64 @@
 """
 Temporal Workflows for Buun Curator.
+
+Workflow classes are imported lazily on first attribute access (PEP 562), so
+importing one workflow does not pull in every workflow's dependencies.
 """
 
-from buun_curator.workflows.all_feeds_ingestion import AllFeedsIngestionWorkflow
-from buun_curator.workflows.content_distillation import ContentDistillationWorkflow
-from buun_curator.workflows.context_collection import ContextCollectionWorkflow
-from buun_curator.workflows.deep_research import DeepResearchWorkflow
-from buun_curator.workflows.delete_enrichment import DeleteEnrichmentWorkflow
-from buun_curator.workflows.domain_fetch import DomainFetchWorkflow
-from buun_curator.workflows.embedding_backfill import EmbeddingBackfillWorkflow
-from buun_curator.workflows.entries_cleanup import EntriesCleanupWorkflow
-from buun_curator.workflows.evaluation import (
-    EvaluationWorkflow,
-    SummarizationEvaluationWorkflow,
-)
-from buun_curator.workflows.extract_entry_context import ExtractEntryContextWorkflow
-from buun_curator.workflows.fetch_entry_links import FetchEntryLinksWorkflow
-from buun_curator.workflows.global_graph_update import GlobalGraphUpdateWorkflow
-from buun_curator.workflows.graph_rebuild import GraphRebuildWorkflow
-from buun_curator.workflows.preview_fetch import PreviewFetchWorkflow
-from buun_curator.workflows.reprocess_entries import ReprocessEntriesWorkflow
-from buun_curator.workflows.schedule_fetch import ScheduleFetchWorkflow
-from buun_curator.workflows.search_prune import SearchPruneWorkflow
-from buun_curator.workflows.search_reindex import SearchReindexWorkflow
-from buun_curator.workflows.single_feed_ingestion import SingleFeedIngestionWorkflow
-from buun_curator.workflows.translation import TranslationWorkflow
-from buun_curator.workflows.update_entry_index import UpdateEntryIndexWorkflow
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from buun_curator.workflows.all_feeds_ingestion import AllFeedsIngestionWorkflow
+    from buun_curator.workflows.content_distillation import ContentDistillationWorkflow
+    from buun_curator.workflows.context_collection import ContextCollectionWorkflow
+    from buun_curator.workflows.deep_research import DeepResearchWorkflow
+    from buun_curator.workflows.delete_enrichment import DeleteEnrichmentWorkflow
+    from buun_curator.workflows.domain_fetch import DomainFetchWorkflow
+    from buun_curator.workflows.embedding_backfill import EmbeddingBackfillWorkflow
+    from buun_curator.workflows.entries_cleanup import EntriesCleanupWorkflow
+    from buun_curator.workflows.evaluation import (
+        EvaluationWorkflow,
+        SummarizationEvaluationWorkflow,
+    )
+    from buun_curator.workflows.extract_entry_context import ExtractEntryContextWorkflow
+    from buun_curator.workflows.fetch_entry_links import FetchEntryLinksWorkflow
+    from buun_curator.workflows.global_graph_update import GlobalGraphUpdateWorkflow
+    from buun_curator.workflows.graph_rebuild import GraphRebuildWorkflow
+    from buun_curator.workflows.preview_fetch import PreviewFetchWorkflow
+    from buun_curator.workflows.reprocess_entries import ReprocessEntriesWorkflow
+    from buun_curator.workflows.schedule_fetch import ScheduleFetchWorkflow
+    from buun_curator.workflows.search_prune import SearchPruneWorkflow
+    from buun_curator.workflows.search_reindex import SearchReindexWorkflow
+    from buun_curator.workflows.single_feed_ingestion import SingleFeedIngestionWorkflow
+    from buun_curator.workflows.translation import TranslationWorkflow
+    from buun_curator.workflows.update_entry_index import UpdateEntryIndexWorkflow
+
+# Public name -> defining module
+_LAZY: dict[str, str] = {
+    "AllFeedsIngestionWorkflow": "buun_curator.workflows.all_feeds_ingestion",
+    "ContentDistillationWorkflow": "buun_curator.workflows.content_distillation",
+    "ContextCollectionWorkflow": "buun_curator.workflows.context_collection",
+    "DeepResearchWorkflow": "buun_curator.workflows.deep_research",
+    "DeleteEnrichmentWorkflow": "buun_curator.workflows.delete_enrichment",
+    "DomainFetchWorkflow": "buun_curator.workflows.domain_fetch",
+    "EmbeddingBackfillWorkflow": "buun_curator.workflows.embedding_backfill",
+    "EntriesCleanupWorkflow": "buun_curator.workflows.entries_cleanup",
+    "EvaluationWorkflow": "buun_curator.workflows.evaluation",
+    "SummarizationEvaluationWorkflow": "buun_curator.workflows.evaluation",
+    "ExtractEntryContextWorkflow": "buun_curator.workflows.extract_entry_context",
+    "FetchEntryLinksWorkflow": "buun_curator.workflows.fetch_entry_links",
+    "GlobalGraphUpdateWorkflow": "buun_curator.workflows.global_graph_update",
+    "GraphRebuildWorkflow": "buun_curator.workflows.graph_rebuild",
+    "PreviewFetchWorkflow": "buun_curator.workflows.preview_fetch",
+    "ReprocessEntriesWorkflow": "buun_curator.workflows.reprocess_entries",
+    "ScheduleFetchWorkflow": "buun_curator.workflows.schedule_fetch",
+    "SearchPruneWorkflow": "buun_curator.workflows.search_prune",
+    "SearchReindexWorkflow": "buun_curator.workflows.search_reindex",
+    "SingleFeedIngestionWorkflow": "buun_curator.workflows.single_feed_ingestion",
+    "TranslationWorkflow": "buun_curator.workflows.translation",
+    "UpdateEntryIndexWorkflow": "buun_curator.workflows.update_entry_index",
+}
 
 __all__ = [
     "AllFeedsIngestionWorkflow",
@@ -51,3 +84,35 @@ __all__ = [
     "TranslationWorkflow",
     "UpdateEntryIndexWorkflow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a workflow class on first access and cache it in the module.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name.
+
+    Returns
+    -------
+    Any
+        The workflow class.
+
+    Raises
+    ------
+    AttributeError
+        If the name is not a known workflow.
+    """
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded workflow names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,7 @@ Each feed is processed by a SingleFeedIngestionWorkflow child workflow.
 import asyncio
 import hashlib
 import math
+from collections import deque
 from datetime import timedelta
 
 from temporalio import workflow
@@ -32,6 +33,9 @@ with workflow.unsafe.imports_passed_through():
     from buun_curator.workflows.progress_mixin import ProgressNotificationMixin
     from buun_curator.workflows.single_feed_ingestion import SingleFeedIngestionWorkflow
 
+# Handle of a single-feed child workflow started by AllFeedsIngestionWorkflow
+_FeedHandle = workflow.ChildWorkflowHandle[SingleFeedIngestionWorkflow, SingleFeedIngestionResult]
+
 
 @workflow.defn
 class AllFeedsIngestionWorkflow(ProgressNotificationMixin):
@@ -113,7 +117,7 @@ class AllFeedsIngestionWorkflow(ProgressNotificationMixin):
 
         # 1. Get app settings and workflow config from environment
         # All config values are read at runtime from environment variables
-        settings_result: GetAppSettingsOutput = await workflow.execute_activity(
+        settings_result: GetAppSettingsOutput = await workflow.execute_local_activity(
             get_app_settings,
             GetAppSettingsInput(),
             start_to_close_timeout=timedelta(minutes=1),
@@ -130,6 +134,7 @@ class AllFeedsIngestionWorkflow(ProgressNotificationMixin):
         # Get distillation batch size from config
         config = get_config()
         distillation_batch_size = config.distillation_batch_size
+        coarse_progress = config.feed_ingestion_coarse_progress
 
         workflow.logger.info(
             "Options loaded",
@@ -141,6 +146,7 @@ class AllFeedsIngestionWorkflow(ProgressNotificationMixin):
                 "domain_fetch_delay": domain_fetch_delay,
                 "target_language": target_language,
                 "distillation_batch_size": distillation_batch_size,
+                "coarse_progress": coarse_progress,
             },
         )
 
@@ -180,151 +186,149 @@ class AllFeedsIngestionWorkflow(ProgressNotificationMixin):
         self._progress.updated_at = workflow_now_iso()
         await self._notify_update()
 
-        # 3. Process feeds in batches with concurrency limit
-        # Note: Temporal workflows require deterministic execution, so we use
-        # batch processing instead of asyncio.Semaphore
-        results: list[SingleFeedIngestionResult] = []
-
-        for batch_start in range(0, total_feeds, max_concurrent):
-            batch_end = min(batch_start + max_concurrent, total_feeds)
-            batch_feeds = feeds[batch_start:batch_end]
-            batch_names = [f["name"] for f in batch_feeds]
-            batch_num = batch_start // max_concurrent + 1
+        # 3. Process feeds with a rolling concurrency window: keep up to
+        # max_concurrent child workflows running and start the next pending
+        # feed as soon as any of them completes, so one slow feed does not
+        # hold back the rest. workflow.wait (not asyncio.wait) returns
+        # completions in a deterministic order, which replay requires.
+        # Child results are folded into the progress counters as they arrive
+        # rather than kept in a list for the lifetime of the workflow
+        pending_feeds = deque(enumerate(feeds))
+
+        # Child workflow IDs are computed up front so the scheduling loop does
+        # no hashing. The short hash keeps IDs unique across concurrent parent
+        # workflows (git-style short hash)
+        parent_workflow_id = wf_info.workflow_id
+        hash_prefix = f"{parent_workflow_id}:{wf_info.run_id}:"
+        child_wf_ids = [
+            f"single-feed-{feed['id']}-"
+            + hashlib.blake2b((hash_prefix + feed["id"]).encode(), digest_size=4).hexdigest()
+            for feed in feeds
+        ]
+        # Child handles are asyncio Tasks themselves, so they are waited on
+        # directly (no wrapper task per child); the dict keeps start order
+        # for the progress message
+        in_flight: dict[_FeedHandle, str] = {}
+
+        async def start_child(index: int, feed: dict) -> _FeedHandle:
+            feed_id = feed["id"]
+            feed_name = feed["name"]
+            child_wf_id = child_wf_ids[index]
+            workflow.logger.info(
+                "Starting child workflow",
+                extra={"feed_name": feed_name, "child_workflow_id": child_wf_id},
+            )
+            # Use per-feed fetchContent option, falling back to workflow setting
+            feed_fetch_content = feed.get("fetch_content", enable_content_fetch)
+            return await workflow.start_child_workflow(
+                SingleFeedIngestionWorkflow.run,
+                SingleFeedIngestionInput(
+                    feed_id=feed_id,
+                    feed_name=feed_name,
+                    feed_url=feed["url"],
+                    etag=feed.get("etag", ""),
+                    last_modified=feed.get("last_modified", ""),
+                    fetch_limit=feed.get("fetch_limit", 20),
+                    extraction_rules=feed.get("extraction_rules"),
+                    auto_distill=auto_distill,
+                    enable_content_fetch=feed_fetch_content,
+                    enable_thumbnail=enable_thumbnail,
+                    target_language=target_language,
+                    domain_fetch_delay=domain_fetch_delay,
+                    parent_workflow_id=parent_workflow_id,
+                    distillation_batch_size=distillation_batch_size,
+                ),
+                id=child_wf_id,
+            )
 
-            # Update progress for this batch
-            self._progress.current_batch = batch_num
+        async def start_feeds(count: int) -> None:
+            # Issue all start commands together so they complete in one
+            # workflow task instead of one round trip per child
+            batch = [pending_feeds.popleft() for _ in range(min(count, len(pending_feeds)))]
+            if not batch:
+                return
+            handles = await asyncio.gather(*(start_child(i, feed) for i, feed in batch))
+            for (_, feed), handle in zip(batch, handles, strict=True):
+                in_flight[handle] = feed["name"]
+
+            # Batch numbers are kept for the progress UI: feed N belongs to
+            # window N // max_concurrent
+            self._progress.current_batch = batch[-1][0] // max_concurrent + 1
+
+        def update_window_message() -> None:
+            names = list(in_flight.values())
             self._progress.message = (
-                f"Batch {batch_num}/{total_batches}: {', '.join(batch_names[:3])}"
-                + ("..." if len(batch_names) > 3 else "")
+                f"Batch {self._progress.current_batch}/{total_batches}: "
+                f"{', '.join(names[:3])}" + ("..." if len(names) > 3 else "")
             )
-            self._progress.updated_at = workflow_now_iso()
-            await self._notify_update()
 
-            workflow.logger.info(
-                "Processing batch",
-                extra={
-                    "batch_num": batch_num,
-                    "total_batches": total_batches,
-                    "feeds": batch_names,
-                },
-            )
+        # Fill the window
+        await start_feeds(max_concurrent)
+        update_window_message()
+        self._progress.updated_at = workflow_now_iso()
+        await self._notify_update()
 
-            # Start all child workflows in this batch concurrently
-            child_handles = []
-            for i, feed in enumerate(batch_feeds):
-                feed_id = feed["id"]
-                feed_name = feed["name"]
-
-                # Use unique child workflow ID with hash to avoid conflicts
-                # between concurrent parent workflows (git-style short hash)
-                hash_input = f"{wf_info.workflow_id}:{wf_info.run_id}:{feed_id}"
-                unique_suffix = hashlib.sha1(hash_input.encode()).hexdigest()[:7]
-                child_wf_id = f"single-feed-{feed_id}-{unique_suffix}"
-                workflow.logger.info(
-                    "Starting child workflow",
-                    extra={"feed_name": feed_name, "child_workflow_id": child_wf_id},
-                )
-                # Use per-feed fetchContent option, falling back to workflow setting
-                feed_fetch_content = feed.get("fetch_content", enable_content_fetch)
-                handle = await workflow.start_child_workflow(
-                    SingleFeedIngestionWorkflow.run,
-                    SingleFeedIngestionInput(
-                        feed_id=feed_id,
-                        feed_name=feed_name,
-                        feed_url=feed["url"],
-                        etag=feed.get("etag", ""),
-                        last_modified=feed.get("last_modified", ""),
-                        fetch_limit=feed.get("fetch_limit", 20),
-                        extraction_rules=feed.get("extraction_rules"),
-                        auto_distill=auto_distill,
-                        enable_content_fetch=feed_fetch_content,
-                        enable_thumbnail=enable_thumbnail,
-                        target_language=target_language,
-                        domain_fetch_delay=domain_fetch_delay,
-                        parent_workflow_id=wf_info.workflow_id,
-                        distillation_batch_size=distillation_batch_size,
-                    ),
-                    id=child_wf_id,
-                )
-                child_handles.append((feed_name, handle))
-
-                # Yield control periodically to avoid deadlock detection
-                if (i + 1) % 5 == 0:
-                    await workflow.sleep(timedelta(seconds=0))
-
-            # Wait for all child workflows in this batch to complete (parallel)
-            # Create tasks for asyncio.wait compatibility
-            async def await_handle(
-                h: workflow.ChildWorkflowHandle,  # type: ignore[type-arg]
-            ) -> SingleFeedIngestionResult:
-                return await h
-
-            pending_tasks: dict[asyncio.Task[SingleFeedIngestionResult], str] = {}
-            for feed_name, handle in child_handles:
-                task = asyncio.create_task(await_handle(handle))
-                pending_tasks[task] = feed_name
-
-            # Process results as they complete
-            while pending_tasks:
-                done, _ = await asyncio.wait(
-                    pending_tasks.keys(),
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                for task in done:
-                    feed_name = pending_tasks.pop(task)
-                    try:
-                        result = task.result()
-                        workflow.logger.info(
-                            "Child workflow completed",
-                            extra={"feed_name": feed_name, "status": result.status},
-                        )
-                        results.append(result)
-
-                        # Update progress counters
-                        self._progress.feeds_completed += 1
-                        if result.status == "completed":
-                            self._progress.feeds_processed += 1
-                            self._progress.entries_created += result.entries_created
-                            self._progress.contents_fetched += result.contents_fetched
-                            self._progress.entries_distilled += result.entries_distilled
-                        elif result.status == "skipped":
-                            self._progress.feeds_skipped += 1
-                        else:
-                            self._progress.feeds_failed += 1
-
-                        self._progress.updated_at = workflow_now_iso()
-                        await self._notify_update()
-
-                    except Exception as e:
-                        workflow.logger.error(
-                            f"Child workflow failed: {e}",
-                            extra={"feed_name": feed_name},
-                        )
-                        # Create error result
-                        results.append(
-                            SingleFeedIngestionResult(
-                                feed_id="",
-                                feed_name=feed_name,
-                                status="error",
-                                error=str(e),
-                            )
-                        )
-                        self._progress.feeds_completed += 1
+        # Process results as they complete, refilling the window
+        while in_flight:
+            # With coarse progress nothing needs to happen per completion once
+            # every feed has started, so the last window is drained in one wait
+            return_when = (
+                asyncio.ALL_COMPLETED
+                if coarse_progress and not pending_feeds
+                else asyncio.FIRST_COMPLETED
+            )
+            done, _ = await workflow.wait(list(in_flight), return_when=return_when)
+            for handle in done:
+                feed_name = in_flight.pop(handle)
+                try:
+                    result = handle.result()
+                    workflow.logger.info(
+                        "Child workflow completed",
+                        extra={"feed_name": feed_name, "status": result.status},
+                    )
+
+                    # Update progress counters
+                    self._progress.feeds_completed += 1
+                    if result.status == "completed":
+                        self._progress.feeds_processed += 1
+                        self._progress.entries_created += result.entries_created
+                        self._progress.entries_skipped += result.entries_skipped
+                        self._progress.contents_fetched += result.contents_fetched
+                        self._progress.entries_distilled += result.entries_distilled
+                    elif result.status == "skipped":
+                        self._progress.feeds_skipped += 1
+                    else:
                         self._progress.feeds_failed += 1
-                        self._progress.updated_at = workflow_now_iso()
-                        await self._notify_update()
 
-        # 4. Aggregate results (already tracked in progress, just for return value)
+                except Exception as e:
+                    workflow.logger.error(
+                        f"Child workflow failed: {e}",
+                        extra={"feed_name": feed_name},
+                    )
+                    self._progress.feeds_completed += 1
+                    self._progress.feeds_failed += 1
+
+            # Refill the window with as many feeds as just finished
+            await start_feeds(len(done))
+
+            # One progress update per wakeup, however many children finished;
+            # notifications are coalesced (or skipped with coarse progress),
+            # the final one below is always sent
+            if pending_feeds or in_flight:
+                update_window_message()
+            self._progress.updated_at = workflow_now_iso()
+            if not coarse_progress:
+                await self._maybe_notify()
+
+        # 4. Aggregate results (tracked in progress as children completed)
         feeds_processed = self._progress.feeds_processed
         feeds_skipped = self._progress.feeds_skipped
         feeds_failed = self._progress.feeds_failed
         entries_created = self._progress.entries_created
+        entries_skipped = self._progress.entries_skipped
         contents_fetched = self._progress.contents_fetched
         entries_distilled = self._progress.entries_distilled
 
-        # Count skipped entries from results
-        entries_skipped = sum(r.entries_skipped for r in results if r.status == "completed")
-
         workflow.logger.info(
             "AllFeedsIngestionWorkflow end",
             extra={
@@ -5,14 +5,13 @@ Standalone workflow for distilling entry content (filtering + summarization).
 Can be called independently or as part of feed ingestion.
 """
 
+import hashlib
 from datetime import timedelta
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 
 with workflow.unsafe.imports_passed_through():
-    import hashlib
-
     from buun_curator.activities import (
         compute_embeddings,
         distill_entry_content,
@@ -65,14 +64,14 @@ class ContentDistillationWorkflow(ProgressNotificationMixin):
         """Return current workflow progress for Temporal Query."""
         return self._progress
 
-    def _update_entry_status(self, entry_id: str, status: str, error: str = "") -> None:
-        """Update status for a specific entry."""
+    def _update_all_entry_statuses(self, status: str, error: str = "") -> None:
+        """Set the status of every tracked entry, reading the clock once."""
         now = workflow_now_iso()
-        if entry_id in self._progress.entry_progress:
-            self._progress.entry_progress[entry_id].status = status
-            self._progress.entry_progress[entry_id].changed_at = now
+        for state in self._progress.entry_progress.values():
+            state.status = status
+            state.changed_at = now
             if error:
-                self._progress.entry_progress[entry_id].error = error
+                state.error = error
         self._progress.updated_at = now
 
     @workflow.run
@@ -129,9 +128,7 @@ class ContentDistillationWorkflow(ProgressNotificationMixin):
             self._progress.status = "error"
             self._progress.error = error_msg
             self._progress.message = f"Distillation failed: {error_msg}"
-            for entry_id in self._progress.entry_progress:
-                self._update_entry_status(entry_id, "error", error=error_msg)
-            self._progress.updated_at = workflow_now_iso()
+            self._update_all_entry_statuses("error", error=error_msg)
             await self._notify_update()
             raise
 
@@ -151,7 +148,7 @@ class ContentDistillationWorkflow(ProgressNotificationMixin):
         wf_info = workflow.info()
 
         # 0. Get app settings (target language)
-        settings_result: GetAppSettingsOutput = await workflow.execute_activity(
+        settings_result: GetAppSettingsOutput = await workflow.execute_local_activity(
             get_app_settings,
             GetAppSettingsInput(),
             start_to_close_timeout=timedelta(minutes=1),
@@ -204,8 +201,7 @@ class ContentDistillationWorkflow(ProgressNotificationMixin):
         # 2. Distill entries
         self._progress.current_step = "distill"
         self._progress.message = f"Distilling {len(entries)} entries..."
-        for entry_id in self._progress.entry_progress:
-            self._update_entry_status(entry_id, "distilling")
+        self._update_all_entry_statuses("distilling")
         await self._notify_update()
 
         distill_result: DistillEntryContentOutput = await workflow.execute_activity(
@@ -215,6 +211,7 @@ class ContentDistillationWorkflow(ProgressNotificationMixin):
                 batch_size=batch_size,
                 target_language=target_language,
             ),
+            task_queue=get_config().heavy_task_queue,
             start_to_close_timeout=timedelta(minutes=30),
             heartbeat_timeout=timedelta(minutes=5),
             retry_policy=RetryPolicy(
@@ -234,13 +231,17 @@ class ContentDistillationWorkflow(ProgressNotificationMixin):
             )
             entries_distilled = save_result.saved_count
 
-            # Mark distilled entries as completed
-            distilled_ids = {r.get("entry_id") for r in results}
-            for entry_id in self._progress.entry_progress:
-                if entry_id in distilled_ids:
-                    self._update_entry_status(entry_id, "completed")
-                else:
-                    self._update_entry_status(entry_id, "error")
+            # Mark distilled entries as completed (the rest as error)
+            if len(results) == len(entries):
+                # Common case: every entry was distilled
+                self._update_all_entry_statuses("completed")
+            else:
+                distilled_ids = {r.get("entry_id") for r in results}
+                now = workflow_now_iso()
+                for entry_id, state in self._progress.entry_progress.items():
+                    state.status = "completed" if entry_id in distilled_ids else "error"
+                    state.changed_at = now
+                self._progress.updated_at = now
             self._progress.entries_distilled = entries_distilled
             await self._notify_update()
 
@@ -258,6 +259,7 @@ class ContentDistillationWorkflow(ProgressNotificationMixin):
                 embedding_result: ComputeEmbeddingsOutput = await workflow.execute_activity(
                     compute_embeddings,
                     ComputeEmbeddingsInput(entry_ids=distilled_entry_ids),
+                    task_queue=get_config().heavy_task_queue,
                     start_to_close_timeout=timedelta(minutes=10),
                     heartbeat_timeout=timedelta(minutes=2),
                     retry_policy=RetryPolicy(
@@ -316,9 +318,11 @@ class ContentDistillationWorkflow(ProgressNotificationMixin):
                     )
 
                     if eval_items:
-                        # Generate deterministic workflow ID using SHA1 hash
+                        # Generate deterministic workflow ID using a short BLAKE2b hash
                         hash_input = f"{wf_info.workflow_id}:{wf_info.run_id}:{batch_trace_id}"
-                        unique_suffix = hashlib.sha1(hash_input.encode()).hexdigest()[:8]
+                        unique_suffix = hashlib.blake2b(
+                            hash_input.encode(), digest_size=4
+                        ).hexdigest()
                         eval_workflow_id = f"summarize-eval-{unique_suffix}"
                         try:
                             await workflow.start_child_workflow(
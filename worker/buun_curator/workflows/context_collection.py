@@ -6,20 +6,19 @@ Orchestrates ExtractEntryContextWorkflow for multiple entries and creates
 an execution plan based on the extracted contexts.
 """
 
+import asyncio
 import hashlib
+import itertools
+import logging
 import re
+from collections import Counter
+from collections.abc import Callable
 from datetime import timedelta
+from typing import Any
 
 from temporalio import workflow
 
 with workflow.unsafe.imports_passed_through():
-    # Pre-import idna modules to avoid sandbox warnings
-    # (used by url-normalize for internationalized domain names)
-    import idna.core  # noqa: F401
-    import idna.intranges  # noqa: F401
-    import idna.package_data  # noqa: F401
-    import idna.uts46data  # noqa: F401
-
     from buun_curator.activities import (
         delete_enrichment,
         fetch_github_readme,
@@ -28,6 +27,7 @@ with workflow.unsafe.imports_passed_through():
         save_github_enrichment,
         search_github_candidates,
     )
+    from buun_curator.config import get_config
     from buun_curator.models import (
         ContextCollectionInput,
         ContextCollectionOutput,
@@ -43,73 +43,145 @@ with workflow.unsafe.imports_passed_through():
         SaveGitHubEnrichmentInput,
         SearchGitHubCandidatesInput,
     )
-    from buun_curator.models.context import EntryContext, ExtractedLink
+    from buun_curator.models.context import (
+        EntityRole,
+        EntityType,
+        EntryContext,
+        ExtractedLink,
+        Relationship,
+        RelationType,
+        SubjectDomain,
+    )
     from buun_curator.utils.date import workflow_now_iso
     from buun_curator.utils.url import normalize_url_for_dedup
     from buun_curator.workflows.extract_entry_context import (
         ExtractEntryContextWorkflow,
     )
-    from buun_curator.workflows.progress_mixin import ProgressNotificationMixin
+    from buun_curator.workflows.progress_mixin import (
+        NOTIFY_COALESCE_EVERY,
+        ProgressNotificationMixin,
+    )
 
-# Well-known software that doesn't need GitHub enrichment
-SKIP_SOFTWARE = {
-    "python",
-    "javascript",
-    "typescript",
-    "java",
-    "rust",
-    "go",
-    "ruby",
-    "php",
-    "c",
-    "c++",
-    "c#",
-    "swift",
-    "kotlin",
-    "scala",
-    "perl",
-    "r",
-    "sql",
-    "html",
-    "css",
-    "shell",
-    "bash",
-    "powershell",
-    "vs code",
-    "visual studio code",
-    "vscode",
-    "pycharm",
-    "intellij",
-    "eclipse",
-    "xcode",
-    "vim",
-    "neovim",
-    "emacs",
-    "sublime text",
-    "git",
-    "github",
-    "gitlab",
-    "docker",
-    "kubernetes",
-    "linux",
-    "windows",
-    "macos",
-    "android",
-    "ios",
-    "chrome",
-    "firefox",
-    "safari",
-    "edge",
-    "node.js",
-    "nodejs",
-    "npm",
-    "yarn",
-    "pip",
-    "conda",
-    "wasm",
-    "webassembly",
+# Max candidates searched on GitHub at once (keeps bursts within the
+# GitHub search API rate limit)
+GITHUB_ENRICHMENT_CONCURRENCY = 5
+
+# Max entry key points sent to the GitHub re-ranking LLM
+RERANK_MAX_KEY_POINTS = 10
+
+# GitHubRepoInfo fields sent to the re-ranking LLM
+RERANK_REPO_FIELDS = {
+    "owner",
+    "repo",
+    "full_name",
+    "description",
+    "url",
+    "stars",
+    "forks",
+    "language",
+    "topics",
+    "license",
+    "homepage",
 }
 
+# GitHub repository URL; captures owner and repo name (without .git suffix)
+_GITHUB_RE = re.compile(r"https?://github\.com/([^/?#]+)/([^/?#]+?)(?:\.git)?(?:[/?#]|$)")
+
+# Characters ignored when matching entity names to repo names
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+# Parts of entity names ignored when deduplicating candidates
+_HANDLE_PREFIX_RE = re.compile(r"^[@#]+")
+_TRAILING_PUNCT_RE = re.compile(r"[.,;:!?]+$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Well-known software that doesn't need GitHub enrichment
+SKIP_SOFTWARE = frozenset(
+    {
+        "python",
+        "javascript",
+        "typescript",
+        "java",
+        "rust",
+        "go",
+        "ruby",
+        "php",
+        "c",
+        "c++",
+        "c#",
+        "swift",
+        "kotlin",
+        "scala",
+        "perl",
+        "r",
+        "sql",
+        "html",
+        "css",
+        "shell",
+        "bash",
+        "powershell",
+        "vs code",
+        "visual studio code",
+        "vscode",
+        "pycharm",
+        "intellij",
+        "eclipse",
+        "xcode",
+        "vim",
+        "neovim",
+        "emacs",
+        "sublime text",
+        "git",
+        "github",
+        "gitlab",
+        "docker",
+        "kubernetes",
+        "linux",
+        "windows",
+        "macos",
+        "android",
+        "ios",
+        "chrome",
+        "firefox",
+        "safari",
+        "edge",
+        "node.js",
+        "nodejs",
+        "npm",
+        "yarn",
+        "pip",
+        "conda",
+        "wasm",
+        "webassembly",
+    }
+)
+# SKIP_SOFTWARE with punctuation and spaces removed ("node.js"/"nodejs",
+# "vs code"/"vscode" share a key)
+_SKIP_SOFTWARE_KEYS = frozenset(_NON_ALNUM_RE.sub("", name) for name in SKIP_SOFTWARE)
+
+
+def _canonicalize_entity_name(name: str) -> str:
+    """
+    Return a canonical key for deduplicating entity names.
+
+    Lowercases, drops leading @/# and trailing sentence punctuation, and
+    collapses whitespace, so "PyTorch", "pytorch." and "@pytorch" share one
+    key. Suffixes such as "++" or "#" are kept ("Notepad++" != "Notepad").
+
+    Parameters
+    ----------
+    name : str
+        Entity name as extracted.
+
+    Returns
+    -------
+    str
+        Canonical form of the name.
+    """
+    name = _HANDLE_PREFIX_RE.sub("", name.strip().lower())
+    name = _TRAILING_PUNCT_RE.sub("", name)
+    return _WHITESPACE_RE.sub(" ", name).strip()
+
 
 def _extract_github_urls(links: list[ExtractedLink]) -> dict[str, str]:
     """
@@ -119,29 +191,25 @@ def _extract_github_urls(links: list[ExtractedLink]) -> dict[str, str]:
     """
     github_urls: dict[str, str] = {}
     for link in links:
-        match = re.match(r"https?://github\.com/([^/]+)/([^/]+)", link.url)
+        match = _GITHUB_RE.match(link.url)
         if match:
-            repo_name = match.group(2).lower()
-            # Remove .git suffix if present
-            if repo_name.endswith(".git"):
-                repo_name = repo_name[:-4]
-            github_urls[repo_name] = link.url
+            github_urls[match.group(2).lower()] = link.url
     return github_urls
 
 
-def _find_creator(
-    entity_name: str,
-    relationships: list,
-) -> str | None:
+def _index_creators(relationships: list[Relationship]) -> dict[str, str]:
     """
-    Find the creator of an entity from relationships.
+    Map entity names to their creator from createdBy relationships.
 
-    Looks for createdBy relationships where entity is the source.
+    Built once per context so each entity lookup is a dict access. The first
+    createdBy relationship for an entity wins.
     """
+    creators: dict[str, str] = {}
     for rel in relationships:
-        if rel.source == entity_name and str(rel.relation) == "createdBy":
-            return rel.target
-    return None
+        # relation is stored as its value (use_enum_values); str enums compare equal
+        if rel.relation == RelationType.CREATED_BY:
+            creators.setdefault(rel.source, rel.target)
+    return creators
 
 
 def _create_enrichment_candidates(context: EntryContext) -> list[EnrichmentCandidate]:
@@ -163,42 +231,51 @@ def _create_enrichment_candidates(context: EntryContext) -> list[EnrichmentCandi
     candidates: list[EnrichmentCandidate] = []
 
     # Only process software-related domains
-    if str(context.domain) not in ("software", "technology"):
+    if context.domain not in (SubjectDomain.SOFTWARE, SubjectDomain.TECHNOLOGY):
         return candidates
 
     # Extract GitHub URLs from extracted links
     github_urls = _extract_github_urls(context.extracted_links)
+    # Repo names with punctuation stripped, for exact-match lookup
+    normalized_github_urls = {
+        _NON_ALNUM_RE.sub("", repo_name): url for repo_name, url in github_urls.items()
+    }
+    creators = _index_creators(context.relationships)
 
     for entity in context.entities:
         # Only consider Software entities
-        if str(entity.type) != "Software":
+        entity_type = str(entity.type)
+        if entity_type != EntityType.SOFTWARE:
             continue
 
         # Skip well-known software
-        if entity.name.lower() in SKIP_SOFTWARE:
+        entity_name_lower = entity.name.lower()
+        entity_key = _NON_ALNUM_RE.sub("", entity_name_lower)
+        if entity_key in _SKIP_SOFTWARE_KEYS:
             continue
 
         # Prioritize subject and compared roles
-        role = str(entity.role) if entity.role else None
-        if role not in ("subject", "compared", None):
+        if entity.role not in (EntityRole.SUBJECT, EntityRole.COMPARED, None):
             # Skip entities that are only mentioned
             continue
+        role = str(entity.role) if entity.role else None
 
         # Find creator from relationships
-        owner_hint = _find_creator(entity.name, context.relationships)
+        owner_hint = creators.get(entity.name)
 
         # Check if there's a GitHub URL for this entity
-        github_url_hint = None
-        entity_name_lower = entity.name.lower()
-        for repo_name, url in github_urls.items():
-            if entity_name_lower in repo_name or repo_name in entity_name_lower:
-                github_url_hint = url
-                break
+        github_url_hint = normalized_github_urls.get(entity_key) if entity_key else None
+        if github_url_hint is None:
+            # Fall back to substring match (e.g. "react" -> "react-native")
+            for repo_name, url in github_urls.items():
+                if entity_name_lower in repo_name or repo_name in entity_name_lower:
+                    github_url_hint = url
+                    break
 
         candidates.append(
             EnrichmentCandidate(
                 name=entity.name,
-                entity_type=str(entity.type),
+                entity_type=entity_type,
                 role=role,
                 owner_hint=owner_hint,
                 github_url_hint=github_url_hint,
@@ -228,52 +305,42 @@ def _analyze_contexts(contexts: list[EntryContext]) -> list[str]:
         plan.append("No contexts extracted - nothing to process")
         return plan
 
-    # Analyze domains
-    domains = {}
-    for ctx in contexts:
-        domain = str(ctx.domain)
-        domains[domain] = domains.get(domain, 0) + 1
-
-    plan.append(f"Extracted {len(contexts)} entry contexts")
-    plan.append(f"Domain distribution: {domains}")
-
-    # Analyze entities
-    all_entities = []
-    entity_types = {}
+    # Aggregate domains, entities and relationships in a single pass
+    domains: Counter[str] = Counter()
+    entity_types: Counter[str] = Counter()
+    relation_types: Counter[str] = Counter()
+    entity_names: Counter[str] = Counter()
+    total_entities = 0
+    total_relationships = 0
+    entities_without_description = 0
     for ctx in contexts:
+        domains[str(ctx.domain)] += 1
         for entity in ctx.entities:
-            all_entities.append(entity)
-            entity_type = str(entity.type)
-            entity_types[entity_type] = entity_types.get(entity_type, 0) + 1
+            total_entities += 1
+            entity_types[str(entity.type)] += 1
+            entity_names[entity.name] += 1
+            if not entity.description:
+                entities_without_description += 1
+        for rel in ctx.relationships:
+            total_relationships += 1
+            relation_types[str(rel.relation)] += 1
 
-    plan.append(f"Total entities extracted: {len(all_entities)}")
-    plan.append(f"Entity type distribution: {entity_types}")
+    plan.append(f"Extracted {len(contexts)} entry contexts")
+    plan.append(f"Domain distribution: {dict(domains)}")
 
-    # Analyze relationships
-    all_relationships = []
-    relation_types = {}
-    for ctx in contexts:
-        for rel in ctx.relationships:
-            all_relationships.append(rel)
-            rel_type = str(rel.relation)
-            relation_types[rel_type] = relation_types.get(rel_type, 0) + 1
+    plan.append(f"Total entities extracted: {total_entities}")
+    plan.append(f"Entity type distribution: {dict(entity_types)}")
 
-    plan.append(f"Total relationships extracted: {len(all_relationships)}")
+    plan.append(f"Total relationships extracted: {total_relationships}")
     if relation_types:
-        plan.append(f"Relationship type distribution: {relation_types}")
+        plan.append(f"Relationship type distribution: {dict(relation_types)}")
 
     # Identify common entities across entries
-    entity_names = {}
-    for ctx in contexts:
-        for entity in ctx.entities:
-            entity_names[entity.name] = entity_names.get(entity.name, 0) + 1
-
-    common_entities = [(name, count) for name, count in entity_names.items() if count > 1]
+    common_entities = [(name, count) for name, count in entity_names.most_common(10) if count > 1]
     if common_entities:
-        common_entities.sort(key=lambda x: x[1], reverse=True)
         plan.append(
             f"Common entities across entries: "
-            f"{[f'{name} ({count})' for name, count in common_entities[:10]]}"
+            f"{[f'{name} ({count})' for name, count in common_entities]}"
         )
 
     # Suggested next steps
@@ -282,11 +349,10 @@ def _analyze_contexts(contexts: list[EntryContext]) -> list[str]:
     if len(contexts) > 1 and common_entities:
         plan.append("SUGGEST: Build knowledge graph connections for common entities")
 
-    if all_relationships:
+    if total_relationships:
         plan.append("SUGGEST: Index relationships for graph-based retrieval")
 
     # Check for entities that might need enrichment
-    entities_without_description = sum(1 for e in all_entities if not e.description)
     if entities_without_description > 0:
         plan.append(f"SUGGEST: Enrich {entities_without_description} entities without descriptions")
 
@@ -314,10 +380,10 @@ def _collect_enrichment_candidates(
 
     for ctx in contexts:
         for candidate in _create_enrichment_candidates(ctx):
-            # Deduplicate by name (case-insensitive)
-            name_lower = candidate.name.lower()
-            if name_lower not in seen_names:
-                seen_names.add(name_lower)
+            # Deduplicate by canonical name, keeping the first spelling seen
+            canonical_name = _canonicalize_entity_name(candidate.name)
+            if canonical_name not in seen_names:
+                seen_names.add(canonical_name)
                 candidates.append(candidate)
 
     return candidates
@@ -342,6 +408,9 @@ def _collect_entry_links(
     list[EntryLinkInfo]
         Deduplicated list of entry links with normalized URLs.
     """
+    if not any(ctx.extracted_links for ctx in contexts):
+        return []
+
     # Map: normalized_url -> (original_url, title)
     # We keep original URL for display, normalized for dedup
     url_map: dict[str, tuple[str, str]] = {}
@@ -351,16 +420,15 @@ def _collect_entry_links(
         normalized = normalize_url_for_dedup(url)
         link_title = title or ""
 
-        if normalized in url_map:
-            existing_url, existing_title = url_map[normalized]
-            # Keep shorter title if both exist
-            if link_title and existing_title:
-                if len(link_title) < len(existing_title):
-                    url_map[normalized] = (existing_url, link_title)
-            elif link_title and not existing_title:
-                url_map[normalized] = (existing_url, link_title)
-        else:
+        existing = url_map.get(normalized)
+        if existing is None:
             url_map[normalized] = (url, link_title)
+            return
+
+        existing_url, existing_title = existing
+        # Prefer any title over none, and the shorter one if both exist
+        if link_title and (not existing_title or len(link_title) < len(existing_title)):
+            url_map[normalized] = (existing_url, link_title)
 
     # Collect from extracted_links in contexts
     for ctx in contexts:
@@ -374,6 +442,43 @@ def _collect_entry_links(
     ]
 
 
+async def _execute_per_entry(
+    activity_fn: Callable[..., Any],
+    inputs: list[Any],
+    concurrency: int,
+) -> list[Any]:
+    """
+    Execute one activity per input with a bounded number running at once.
+
+    Parameters
+    ----------
+    activity_fn : Callable[..., Any]
+        Activity to execute.
+    inputs : list[Any]
+        Activity inputs, one per entry.
+    concurrency : int
+        Maximum number of activities scheduled at once.
+
+    Returns
+    -------
+    list[Any]
+        Activity results in input order; failures are returned as exceptions.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def execute(activity_input: Any) -> Any:
+        async with semaphore:
+            return await workflow.execute_activity(
+                activity_fn,
+                activity_input,
+                start_to_close_timeout=timedelta(seconds=30),
+            )
+
+    return await asyncio.gather(
+        *(execute(activity_input) for activity_input in inputs), return_exceptions=True
+    )
+
+
 @workflow.defn
 class ContextCollectionWorkflow(ProgressNotificationMixin):
     """
@@ -421,33 +526,47 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
             Tuple of (contexts, successful_count, failed_count).
         """
         wf_info = workflow.info()
-        contexts: list[EntryContext] = []
-        successful = 0
-        failed = 0
-
-        for entry_id in entry_ids:
+        hash_prefix = f"{wf_info.workflow_id}:{wf_info.run_id}:"
+        log_info = workflow.logger.isEnabledFor(logging.INFO)
+        # Bound the number of ExtractEntryContextWorkflow children running at once
+        semaphore = asyncio.Semaphore(max(1, get_config().context_extraction_concurrency))
+        # Notify about every 5% of completed entries; errors are sent immediately
+        notify_every = max(NOTIFY_COALESCE_EVERY, len(entry_ids) // 20)
+
+        async def extract(entry_id: str) -> EntryContext | None:
             # Generate unique child workflow ID
-            hash_input = f"{wf_info.workflow_id}:{wf_info.run_id}:{entry_id}"
-            unique_suffix = hashlib.sha1(hash_input.encode()).hexdigest()[:7]
+            unique_suffix = hashlib.blake2b(
+                (hash_prefix + entry_id).encode(), digest_size=4
+            ).hexdigest()
             child_wf_id = f"extract-context-{unique_suffix}"
 
-            workflow.logger.info("Extracting context for entry", extra={"entry_id": entry_id})
-            self._update_entry_status(entry_id, "extracting")
-            await self._notify_update()
-
-            try:
-                context = await workflow.execute_child_workflow(
-                    ExtractEntryContextWorkflow.run,
-                    ExtractEntryContextInput(entry_id=entry_id),
-                    id=child_wf_id,
-                    execution_timeout=timedelta(minutes=5),
-                )
+            async with semaphore:
+                if log_info:
+                    workflow.logger.info(
+                        "Extracting context for entry", extra={"entry_id": entry_id}
+                    )
+                self._update_entry_status(entry_id, "extracting")
+
+                try:
+                    context = await workflow.execute_child_workflow(
+                        ExtractEntryContextWorkflow.run,
+                        ExtractEntryContextInput(entry_id=entry_id),
+                        id=child_wf_id,
+                        execution_timeout=timedelta(minutes=5),
+                    )
+                except Exception as e:
+                    self._progress.failed_extractions += 1
+                    self._update_entry_status(entry_id, "error", str(e))
+                    workflow.logger.error(
+                        f"Failed to extract context: {e}", extra={"entry_id": entry_id}
+                    )
+                    await self._maybe_notify(force=True)
+                    return None
 
-                if context is not None:
-                    contexts.append(context)
-                    successful += 1
-                    self._progress.successful_extractions = successful
-                    self._update_entry_status(entry_id, "completed")
+            if context is not None:
+                self._progress.successful_extractions += 1
+                self._update_entry_status(entry_id, "completed")
+                if log_info:
                     workflow.logger.info(
                         "Context extracted",
                         extra={
@@ -457,22 +576,21 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
                             "relationships": len(context.relationships),
                         },
                     )
-                else:
-                    failed += 1
-                    self._progress.failed_extractions = failed
-                    self._update_entry_status(entry_id, "error", "No context returned")
-                    workflow.logger.warning("No context returned", extra={"entry_id": entry_id})
-
-            except Exception as e:
-                failed += 1
-                self._progress.failed_extractions = failed
-                self._update_entry_status(entry_id, "error", str(e))
-                workflow.logger.error(
-                    f"Failed to extract context: {e}", extra={"entry_id": entry_id}
-                )
+            else:
+                self._progress.failed_extractions += 1
+                self._update_entry_status(entry_id, "error", "No context returned")
+                workflow.logger.warning("No context returned", extra={"entry_id": entry_id})
 
-            await self._notify_update()
+            await self._maybe_notify(force=context is None, every=notify_every)
+            return context
 
+        # Children run concurrently; results keep the order of entry_ids
+        results = await asyncio.gather(*(extract(entry_id) for entry_id in entry_ids))
+        await self._notify_update()
+
+        contexts = [context for context in results if context is not None]
+        successful = len(contexts)
+        failed = len(entry_ids) - successful
         return contexts, successful, failed
 
     async def _execute_github_enrichment(
@@ -508,38 +626,46 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
         workflow.logger.info("Executing GitHub search", extra={"candidates": len(candidates)})
         plan.append("--- GitHub Enrichment Execution ---")
 
-        # Collect key_points from all contexts for LLM re-ranking
-        all_key_points: list[str] = []
-        for ctx in contexts:
-            all_key_points.extend(ctx.key_points)
-
-        enrichment_results: list[dict] = []
-
-        for candidate in candidates:
-            workflow.logger.info(
-                f"Searching GitHub for: {candidate.name} (owner_hint={candidate.owner_hint})"
+        # First key_points across all contexts, shared by every re-ranking call
+        key_points = list(
+            itertools.islice(
+                itertools.chain.from_iterable(ctx.key_points for ctx in contexts),
+                RERANK_MAX_KEY_POINTS,
             )
+        )
+
+        semaphore = asyncio.Semaphore(GITHUB_ENRICHMENT_CONCURRENCY)
 
-            try:
-                result = await self._search_and_rerank_candidate(candidate, all_key_points, plan)
-                enrichment_results.append(result)
-            except Exception as e:
-                enrichment_results.append(
-                    {
+        async def enrich(candidate: EnrichmentCandidate) -> tuple[dict, list[str]]:
+            # Plan lines are collected per candidate so the plan keeps candidate order
+            lines: list[str] = []
+            async with semaphore:
+                workflow.logger.info(
+                    f"Searching GitHub for: {candidate.name} (owner_hint={candidate.owner_hint})"
+                )
+                try:
+                    result = await self._search_and_rerank_candidate(candidate, key_points, lines)
+                except Exception as e:
+                    result = {
                         "name": candidate.name,
                         "found": False,
                         "error": str(e),
                     }
-                )
-                plan.append(f"  ERROR: {candidate.name} - {e}")
-                workflow.logger.error(f"Error searching for {candidate.name}: {e}")
+                    lines.append(f"  ERROR: {candidate.name} - {e}")
+                    workflow.logger.error(f"Error searching for {candidate.name}: {e}")
+            return result, lines
+
+        enrichment_results: list[dict] = []
+        for result, lines in await asyncio.gather(*(enrich(c) for c in candidates)):
+            enrichment_results.append(result)
+            plan.extend(lines)
 
         return enrichment_results
 
     async def _search_and_rerank_candidate(
         self,
         candidate: EnrichmentCandidate,
-        all_key_points: list[str],
+        key_points: list[str],
         plan: list[str],
     ) -> dict:
         """
@@ -549,8 +675,8 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
         ----------
         candidate : EnrichmentCandidate
             The candidate to search for.
-        all_key_points : list[str]
-            Key points from all contexts for re-ranking.
+        key_points : list[str]
+            Key points from the contexts for re-ranking.
         plan : list[str]
             Execution plan to append results to.
 
@@ -586,22 +712,7 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
 
         # Convert candidates to dicts for activity input
         candidates_dicts = [
-            {
-                "repo": {
-                    "owner": c.repo.owner,
-                    "repo": c.repo.repo,
-                    "full_name": c.repo.full_name,
-                    "description": c.repo.description,
-                    "url": c.repo.url,
-                    "stars": c.repo.stars,
-                    "forks": c.repo.forks,
-                    "language": c.repo.language,
-                    "topics": c.repo.topics,
-                    "license": c.repo.license,
-                    "homepage": c.repo.homepage,
-                },
-                "score": c.score,
-            }
+            c.model_dump(include={"repo": RERANK_REPO_FIELDS, "score": True})
             for c in search_result.candidates
         ]
 
@@ -610,7 +721,7 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
             RerankGitHubInput(
                 query=candidate.name,
                 candidates=candidates_dicts,
-                entry_key_points=all_key_points[:10],  # Limit to 10
+                entry_key_points=key_points,
                 owner_hint=candidate.owner_hint,
             ),
             start_to_close_timeout=timedelta(seconds=60),
@@ -708,19 +819,25 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
 
         # Clear web_page enrichments (not re-created by this workflow)
         workflow.logger.info(f"Clearing web_page enrichments for {len(entry_ids)} entries...")
-        for entry_id in entry_ids:
-            try:
-                await workflow.execute_activity(
-                    delete_enrichment,
-                    DeleteEnrichmentActivityInput(
-                        entry_id=entry_id,
-                        enrichment_type="web_page",
-                        source=None,  # Delete all web_page enrichments
-                    ),
-                    start_to_close_timeout=timedelta(seconds=30),
+        # Bounded like extraction so large collections do not flood the API
+        concurrency = get_config().context_extraction_concurrency
+        delete_results = await _execute_per_entry(
+            delete_enrichment,
+            [
+                DeleteEnrichmentActivityInput(
+                    entry_id=entry_id,
+                    enrichment_type="web_page",
+                    source=None,  # Delete all web_page enrichments
+                )
+                for entry_id in entry_ids
+            ],
+            concurrency,
+        )
+        for entry_id, delete_result in zip(entry_ids, delete_results, strict=True):
+            if isinstance(delete_result, BaseException):
+                workflow.logger.warning(
+                    f"Failed to clear web_page enrichments for {entry_id}: {delete_result}"
                 )
-            except Exception as e:
-                workflow.logger.warning(f"Failed to clear web_page enrichments for {entry_id}: {e}")
 
         # Save GitHub enrichments (also clears stale ones internally)
         if not enrichment_results:
@@ -731,26 +848,28 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
             f"Saving {len(found_results)} enrichments to {len(entry_ids)} entries..."
         )
 
-        for entry_id in entry_ids:
-            try:
-                save_result = await workflow.execute_activity(
-                    save_github_enrichment,
-                    SaveGitHubEnrichmentInput(
-                        entry_id=entry_id,
-                        enrichment_results=enrichment_results,
-                    ),
-                    start_to_close_timeout=timedelta(seconds=30),
+        save_results = await _execute_per_entry(
+            save_github_enrichment,
+            [
+                SaveGitHubEnrichmentInput(
+                    entry_id=entry_id,
+                    enrichment_results=enrichment_results,
+                )
+                for entry_id in entry_ids
+            ],
+            concurrency,
+        )
+        for entry_id, save_result in zip(entry_ids, save_results, strict=True):
+            if isinstance(save_result, BaseException):
+                workflow.logger.error(f"Error saving enrichments for {entry_id}: {save_result}")
+            elif save_result.success:
+                workflow.logger.info(
+                    f"Saved {save_result.saved_count} enrichments for entry {entry_id}"
+                )
+            else:
+                workflow.logger.warning(
+                    f"Failed to save enrichments for {entry_id}: {save_result.error}"
                 )
-                if save_result.success:
-                    workflow.logger.info(
-                        f"Saved {save_result.saved_count} enrichments for entry {entry_id}"
-                    )
-                else:
-                    workflow.logger.warning(
-                        f"Failed to save enrichments for {entry_id}: {save_result.error}"
-                    )
-            except Exception as e:
-                workflow.logger.error(f"Error saving enrichments for {entry_id}: {e}")
 
     async def _save_entry_links(
         self,
@@ -779,26 +898,18 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
         plan.append("--- Entry Links ---")
         plan.append(f"Collected {len(entry_links)} unique links")
 
-        for entry_id in entry_ids:
-            try:
-                save_result = await workflow.execute_activity(
-                    save_entry_links,
-                    SaveEntryLinksInput(
-                        entry_id=entry_id,
-                        links=entry_links,
-                    ),
-                    start_to_close_timeout=timedelta(seconds=30),
-                )
-                if save_result.success:
-                    workflow.logger.info(
-                        f"Saved {save_result.saved_count} links for entry {entry_id}"
-                    )
-                else:
-                    workflow.logger.warning(
-                        f"Failed to save links for {entry_id}: {save_result.error}"
-                    )
-            except Exception as e:
-                workflow.logger.error(f"Error saving links for {entry_id}: {e}")
+        save_results = await _execute_per_entry(
+            save_entry_links,
+            [SaveEntryLinksInput(entry_id=entry_id, links=entry_links) for entry_id in entry_ids],
+            get_config().context_extraction_concurrency,
+        )
+        for entry_id, save_result in zip(entry_ids, save_results, strict=True):
+            if isinstance(save_result, BaseException):
+                workflow.logger.error(f"Error saving links for {entry_id}: {save_result}")
+            elif save_result.success:
+                workflow.logger.info(f"Saved {save_result.saved_count} links for entry {entry_id}")
+            else:
+                workflow.logger.warning(f"Failed to save links for {entry_id}: {save_result.error}")
 
     @workflow.run
     async def run(self, input: ContextCollectionInput) -> ContextCollectionOutput:
@@ -912,10 +1023,11 @@ class ContextCollectionWorkflow(ProgressNotificationMixin):
         enrichment_results = await self._execute_github_enrichment(candidates, contexts, plan)
 
         # Step 5: Debug output the plan
-        workflow.logger.info("- - - - - EXECUTION PLAN - - - - -")
-        for i, step in enumerate(plan, 1):
-            workflow.logger.info(f"  [{i}] {step}")
-        workflow.logger.info("- - - - - - - - - - - - - - - - - - ")
+        if workflow.logger.isEnabledFor(logging.INFO):
+            workflow.logger.info("- - - - - EXECUTION PLAN - - - - -")
+            for i, step in enumerate(plan, 1):
+                workflow.logger.info(f"  [{i}] {step}")
+            workflow.logger.info("- - - - - - - - - - - - - - - - - - ")
 
         # Step 6: Save enrichments
         await self._save_enrichments(input.entry_ids, enrichment_results)
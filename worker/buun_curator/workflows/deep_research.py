@@ -5,6 +5,7 @@ Build a knowledge graph from entry content and search it with a query
 using Graphiti as the GraphRAG backend.
 """
 
+import hashlib
 from datetime import timedelta
 
 from temporalio import workflow
@@ -15,18 +16,24 @@ with workflow.unsafe.imports_passed_through():
         add_to_graph_rag_session,
         build_graph_rag_graph,
         get_entry,
+        get_graph_rag_session_state,
         reset_graph_rag_session,
         search_graph_rag_session,
     )
+    from buun_curator.config import get_config
     from buun_curator.models.activity_io import (
         AddToGraphRAGSessionInput,
         BuildGraphRAGGraphInput,
         GetEntryInput,
+        GetGraphRAGSessionStateInput,
         ResetGraphRAGSessionInput,
         SearchGraphRAGSessionInput,
     )
     from buun_curator.models.workflow_io import DeepResearchInput, DeepResearchResult
 
+# Entry fields used as research content, in priority order
+_CONTENT_KEYS = ("fullContent", "filteredContent", "feedContent")
+
 
 @workflow.defn
 class DeepResearchWorkflow:
@@ -43,6 +50,9 @@ class DeepResearchWorkflow:
         3. Build knowledge graph (no-op for Graphiti, built incrementally)
         4. Search the graph with the query
 
+        Steps 2-3 are skipped when the session graph was already built from
+        the same content (matched by content hash).
+
         Parameters
         ----------
         input : DeepResearchInput
@@ -71,7 +81,7 @@ class DeepResearchWorkflow:
         try:
             # Step 1: Fetch entry content from API
             workflow.logger.info("Fetching entry content...")
-            entry_result = await workflow.execute_activity(
+            entry_result = await workflow.execute_local_activity(
                 get_entry,
                 GetEntryInput(entry_id=input.entry_id),
                 start_to_close_timeout=timedelta(seconds=30),
@@ -90,11 +100,11 @@ class DeepResearchWorkflow:
                     error=f"Failed to fetch entry: {error_msg}",
                 )
 
-            # Extract content (priority: fullContent > filteredContent > feedContent)
-            content = entry.get("fullContent") or entry.get("filteredContent") or ""
-            if not content:
-                # Fallback to feedContent (HTML)
-                content = entry.get("feedContent") or ""
+            # Extract content (priority: fullContent > filteredContent > feedContent HTML)
+            content = next(
+                (entry[key] for key in _CONTENT_KEYS if entry.get(key)),
+                "",
+            )
 
             if not content:
                 workflow.logger.error("Entry has no content")
@@ -105,56 +115,73 @@ class DeepResearchWorkflow:
 
             workflow.logger.info("Entry content loaded", extra={"content_length": len(content)})
 
-            # Step 2: Reset session and add entry content
-            workflow.logger.info("Resetting and adding content to Graphiti session...")
-            await workflow.execute_activity(
-                reset_graph_rag_session,
-                ResetGraphRAGSessionInput(entry_id=input.entry_id),
+            # Skip rebuilding when the graph was built from this exact content
+            content_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+            state = await workflow.execute_activity(
+                get_graph_rag_session_state,
+                GetGraphRAGSessionStateInput(entry_id=input.entry_id),
                 start_to_close_timeout=timedelta(seconds=30),
                 retry_policy=retry_policy,
             )
 
-            add_result = await workflow.execute_activity(
-                add_to_graph_rag_session,
-                AddToGraphRAGSessionInput(
-                    entry_id=input.entry_id,
-                    content=content,
-                    source_type="entry",
-                ),
-                start_to_close_timeout=timedelta(minutes=5),
-                retry_policy=retry_policy,
-            )
-
-            if not add_result.success:
-                workflow.logger.error(
-                    f"Add content failed: {add_result.error}",
+            if not input.force_rebuild and state.content_hash == content_hash:
+                workflow.logger.info(
+                    "Graph already built from this content, skipping rebuild",
                     extra={"entry_id": input.entry_id},
                 )
-                return DeepResearchResult(
-                    status="error",
-                    error=add_result.error or "Failed to add content to session",
+            else:
+                # Step 2: Reset session and add entry content
+                workflow.logger.info("Resetting and adding content to Graphiti session...")
+                await workflow.execute_activity(
+                    reset_graph_rag_session,
+                    ResetGraphRAGSessionInput(entry_id=input.entry_id),
+                    start_to_close_timeout=timedelta(seconds=30),
+                    retry_policy=retry_policy,
                 )
 
-            # Step 3: Build knowledge graph (no-op for Graphiti)
-            workflow.logger.info("Building Graphiti knowledge graph...")
-            build_result = await workflow.execute_activity(
-                build_graph_rag_graph,
-                BuildGraphRAGGraphInput(entry_id=input.entry_id),
-                start_to_close_timeout=timedelta(minutes=10),
-                retry_policy=retry_policy,
-            )
-
-            if not build_result.success:
-                workflow.logger.error(
-                    f"Build graph failed: {build_result.error}",
-                    extra={"entry_id": input.entry_id},
+                add_result = await workflow.execute_activity(
+                    add_to_graph_rag_session,
+                    AddToGraphRAGSessionInput(
+                        entry_id=input.entry_id,
+                        content=content,
+                        source_type="entry",
+                    ),
+                    task_queue=get_config().heavy_task_queue,
+                    start_to_close_timeout=timedelta(minutes=5),
+                    retry_policy=retry_policy,
                 )
-                return DeepResearchResult(
-                    status="error",
-                    error=build_result.error or "Failed to build knowledge graph",
+
+                if not add_result.success:
+                    workflow.logger.error(
+                        f"Add content failed: {add_result.error}",
+                        extra={"entry_id": input.entry_id},
+                    )
+                    return DeepResearchResult(
+                        status="error",
+                        error=add_result.error or "Failed to add content to session",
+                    )
+
+                # Step 3: Build knowledge graph (no-op for Graphiti)
+                workflow.logger.info("Building Graphiti knowledge graph...")
+                build_result = await workflow.execute_activity(
+                    build_graph_rag_graph,
+                    BuildGraphRAGGraphInput(entry_id=input.entry_id, content_hash=content_hash),
+                    task_queue=get_config().heavy_task_queue,
+                    start_to_close_timeout=timedelta(minutes=10),
+                    retry_policy=retry_policy,
                 )
 
-            workflow.logger.info("Graph built", extra={"graph_name": build_result.graph_name})
+                if not build_result.success:
+                    workflow.logger.error(
+                        f"Build graph failed: {build_result.error}",
+                        extra={"entry_id": input.entry_id},
+                    )
+                    return DeepResearchResult(
+                        status="error",
+                        error=build_result.error or "Failed to build knowledge graph",
+                    )
+
+                workflow.logger.info("Graph built", extra={"graph_name": build_result.graph_name})
 
             # Step 4: Search the knowledge graph
             workflow.logger.info(
@@ -85,7 +85,8 @@ class DeleteEnrichmentWorkflow(ProgressNotificationMixin):
         await self._notify_update()
 
         try:
-            result: DeleteEnrichmentActivityOutput = await workflow.execute_activity(
+            # Single short HTTP DELETE: run as a local activity
+            result: DeleteEnrichmentActivityOutput = await workflow.execute_local_activity(
                 delete_enrichment,
                 DeleteEnrichmentActivityInput(
                     entry_id=entry_id,
@@ -6,6 +6,7 @@ Ensures a delay between requests to the same domain to avoid rate limits.
 Distillation is handled by ScheduleFetchWorkflow after all domains complete.
 """
 
+import logging
 from datetime import timedelta
 
 from temporalio import workflow
@@ -21,40 +22,131 @@ with workflow.unsafe.imports_passed_through():
         DomainFetchInput,
         DomainFetchOutput,
         DomainFetchProgress,
+        DomainFetchResult,
         EntryProgressState,
     )
     from buun_curator.utils.date import workflow_now_iso
     from buun_curator.workflows.progress_mixin import ProgressNotificationMixin
 
+# Adaptive delay (AIMD): halve after this many consecutive successes, down to
+# delay_seconds * ADAPTIVE_DELAY_MIN_FACTOR; double on throttling (429/5xx or
+# Retry-After), up to ADAPTIVE_DELAY_MAX_SECONDS
+ADAPTIVE_DELAY_SUCCESS_STREAK = 3
+ADAPTIVE_DELAY_MIN_FACTOR = 0.25
+ADAPTIVE_DELAY_MAX_SECONDS = 120.0
+
+
+def _adapt_delay(
+    current_delay: float,
+    base_delay: float,
+    success_streak: int,
+    fetch_result: FetchSingleContentOutput,
+) -> tuple[float, int]:
+    """
+    Compute the next inter-request delay from a fetch result.
+
+    Parameters
+    ----------
+    current_delay : float
+        Delay used before the fetch, in seconds.
+    base_delay : float
+        Configured delay for the domain, in seconds.
+    success_streak : int
+        Consecutive successful fetches before this one.
+    fetch_result : FetchSingleContentOutput
+        Result of the fetch.
+
+    Returns
+    -------
+    tuple[float, int]
+        Next delay in seconds and the updated success streak.
+    """
+    status_code = fetch_result.status_code
+    retry_after = fetch_result.retry_after_seconds
+    if retry_after is not None or (
+        status_code is not None and (status_code == 429 or status_code >= 500)
+    ):
+        backoff = max(current_delay * 2, retry_after or 0.0, base_delay)
+        return min(backoff, ADAPTIVE_DELAY_MAX_SECONDS), 0
+
+    if fetch_result.status != "success":
+        return current_delay, 0
+
+    success_streak += 1
+    if success_streak < ADAPTIVE_DELAY_SUCCESS_STREAK:
+        return current_delay, success_streak
+    return max(base_delay * ADAPTIVE_DELAY_MIN_FACTOR, current_delay * 0.5), 0
+
+
+def _sort_by_size_hint(entries: list[dict]) -> list[dict]:
+    """
+    Order entries so that pages expected to be small are fetched first.
+
+    Cheap pages finish early, so progress shows up sooner and slow pages do
+    not hold back the rest. Entries without a hint (missing or 0) go after
+    all hinted ones. The sort is stable, so entries with equal hints, and the
+    unhinted entries among themselves, keep their original order.
+
+    Parameters
+    ----------
+    entries : list[dict]
+        Entries with an optional content_size_hint.
+
+    Returns
+    -------
+    list[dict]
+        Hinted entries in ascending content_size_hint order, then unhinted ones.
+    """
+    return sorted(entries, key=lambda entry: entry.get("content_size_hint") or float("inf"))
+
 
 @workflow.defn
 class DomainFetchWorkflow(ProgressNotificationMixin):
     """
     Workflow for fetching entries from a single domain sequentially.
 
-    Ensures a configurable delay between requests to avoid rate limiting.
-    Each entry is fetched one at a time with proper spacing.
+    Ensures a delay between requests to avoid rate limiting. Each entry is
+    fetched one at a time; the delay starts at the configured value, shrinks
+    while the domain responds successfully and grows when it throttles.
     """
 
     def __init__(self) -> None:
         """Initialize workflow progress state."""
         self._progress = DomainFetchProgress()
+        # Max entries kept in entry_progress (None = all entries)
+        self._max_tracked: int | None = None
 
     @workflow.query
     def get_progress(self) -> DomainFetchProgress:
         """Return current workflow progress for Temporal Query."""
         return self._progress
 
-    def _update_entry_status(self, entry_id: str, status: str, error: str = "") -> None:
+    def _update_entry_status(self, state: EntryProgressState, status: str, error: str = "") -> None:
         """Update status for a specific entry."""
         now = workflow_now_iso()
-        if entry_id in self._progress.entry_progress:
-            self._progress.entry_progress[entry_id].status = status
-            self._progress.entry_progress[entry_id].changed_at = now
-            if error:
-                self._progress.entry_progress[entry_id].error = error
+        state.status = status
+        state.changed_at = now
+        if error:
+            state.error = error
         self._progress.updated_at = now
 
+    def _track_entry(self, entry_id: str, title: str) -> EntryProgressState:
+        """
+        Get the progress state for an entry about to be fetched.
+
+        When only recent entries are tracked, the state is created here and
+        the oldest tracked entries are dropped to stay within the limit.
+        """
+        entry_progress = self._progress.entry_progress
+        state = entry_progress.get(entry_id)
+        if state is None:
+            state = EntryProgressState(entry_id=entry_id, title=title)
+            entry_progress[entry_id] = state
+            if self._max_tracked is not None:
+                while len(entry_progress) > self._max_tracked:
+                    del entry_progress[next(iter(entry_progress))]
+        return state
+
     @workflow.run
     async def run(self, input: DomainFetchInput) -> DomainFetchOutput:
         """
@@ -71,6 +163,8 @@ class DomainFetchWorkflow(ProgressNotificationMixin):
             Results of fetching all entries for this domain.
         """
         wf_info = workflow.info()
+        if input.sort_by_size:
+            input = input.model_copy(update={"entries": _sort_by_size_hint(input.entries)})
         domain = input.domain
         entries = input.entries
         delay_seconds = input.delay_seconds
@@ -87,21 +181,20 @@ class DomainFetchWorkflow(ProgressNotificationMixin):
         self._progress.total_entries = len(entries)
         self._progress.message = f"Fetching {len(entries)} entries from {domain}"
 
-        # Initialize entry progress for all entries
-        for i, entry in enumerate(entries):
-            entry_id = entry["entry_id"]
-            title = entry.get("title", "")
-            self._progress.entry_progress[entry_id] = EntryProgressState(
-                entry_id=entry_id,
-                title=title,
-                status="pending",
-                changed_at=now,
-            )
-
-            # Yield control periodically to avoid deadlock detection
-            if (i + 1) % 100 == 0:
-                await workflow.sleep(timedelta(seconds=0))
-
+        # Initialize entry progress for all entries; very large domains only
+        # track the most recent entries to bound query and notification size
+        if len(entries) <= input.max_tracked_entries:
+            self._progress.entry_progress = {
+                entry["entry_id"]: EntryProgressState(
+                    entry_id=entry["entry_id"],
+                    title=entry.get("title", ""),
+                    status="pending",
+                    changed_at=now,
+                )
+                for entry in entries
+            }
+        else:
+            self._max_tracked = max(1, input.max_tracked_entries)
         await self._notify_update()
 
         workflow.logger.info(
@@ -121,9 +214,12 @@ class DomainFetchWorkflow(ProgressNotificationMixin):
             self._progress.status = "error"
             self._progress.error = error_msg
             self._progress.message = f"Domain fetch failed: {error_msg}"
-            for entry_id in self._progress.entry_progress:
-                self._update_entry_status(entry_id, "error", error=error_msg)
-            self._progress.updated_at = workflow_now_iso()
+            now = workflow_now_iso()
+            for state in self._progress.entry_progress.values():
+                state.status = "error"
+                state.changed_at = now
+                state.error = error_msg
+            self._progress.updated_at = now
             await self._notify_update()
             raise
 
@@ -137,43 +233,50 @@ class DomainFetchWorkflow(ProgressNotificationMixin):
         entries = input.entries
         delay_seconds = input.delay_seconds
 
-        results: list[dict] = []
+        results: list[DomainFetchResult] = []
         success_count = 0
         failed_count = 0
         fetched_entry_ids: list[str] = []
+        current_delay = delay_seconds
+        success_streak = 0
+        total = len(entries)
+        log_debug = workflow.logger.isEnabledFor(logging.DEBUG)
+        log_info = workflow.logger.isEnabledFor(logging.INFO)
 
         for i, entry in enumerate(entries):
             entry_id = entry["entry_id"]
             url = entry["url"]
             title = entry.get("title", "")
             extraction_rules = entry.get("extraction_rules")
+            state = self._track_entry(entry_id, title)
 
             # Update progress for current entry
             title_short = title[:30] if title else ""
             self._progress.current_entry_index = i + 1
             self._progress.current_entry_title = title_short
-            self._progress.current_step = "fetch"
-            self._progress.message = f"Fetching [{i + 1}/{len(entries)}] {title_short}"
-            self._update_entry_status(entry_id, "fetching")
-            await self._notify_update()
+            self._progress.message = f"Fetching [{i + 1}/{total}] {title_short}"
+            self._update_entry_status(state, "fetching")
+            await self._maybe_notify(background=True)
 
             # Apply delay before subsequent requests (not before first)
             if i > 0:
-                workflow.logger.debug(
-                    "Waiting before next request",
-                    extra={"delay_seconds": delay_seconds, "domain": domain},
+                if log_debug:
+                    workflow.logger.debug(
+                        "Waiting before next request",
+                        extra={"delay_seconds": current_delay, "domain": domain},
+                    )
+                await workflow.sleep(timedelta(seconds=current_delay))
+
+            if log_info:
+                workflow.logger.info(
+                    "Fetching entry",
+                    extra={
+                        "index": i + 1,
+                        "total": total,
+                        "title": title_short,
+                        "url": url,
+                    },
                 )
-                await workflow.sleep(timedelta(seconds=delay_seconds))
-
-            workflow.logger.info(
-                "Fetching entry",
-                extra={
-                    "index": i + 1,
-                    "total": len(entries),
-                    "title": title_short,
-                    "url": url,
-                },
-            )
 
             try:
                 # Pass entry_id to save content directly to DB
@@ -193,46 +296,50 @@ class DomainFetchWorkflow(ProgressNotificationMixin):
                         initial_interval=timedelta(seconds=5),
                     ),
                 )
+                current_delay, success_streak = _adapt_delay(
+                    current_delay, delay_seconds, success_streak, fetch_result
+                )
 
                 if fetch_result.status == "success":
                     results.append(
-                        {
-                            "entry_id": entry_id,
-                            "url": url,
-                            "title": title,
-                            "status": "success",
-                            "content_length": fetch_result.content_length,
-                        }
+                        DomainFetchResult(
+                            entry_id=entry_id,
+                            url=url,
+                            title=title,
+                            status="success",
+                            content_length=fetch_result.content_length,
+                        )
                     )
                     success_count += 1
                     fetched_entry_ids.append(entry_id)
-                    workflow.logger.info(
-                        "Fetched entry",
-                        extra={
-                            "entry_id": entry_id,
-                            "content_length": fetch_result.content_length,
-                        },
-                    )
+                    if log_info:
+                        workflow.logger.info(
+                            "Fetched entry",
+                            extra={
+                                "entry_id": entry_id,
+                                "content_length": fetch_result.content_length,
+                            },
+                        )
 
-                    self._update_entry_status(entry_id, "fetched")
+                    self._update_entry_status(state, "fetched")
 
                     # Update progress after fetch
                     self._progress.entries_fetched = success_count
-                    await self._notify_update()
+                    await self._maybe_notify(background=True)
                 else:
                     results.append(
-                        {
-                            "entry_id": entry_id,
-                            "url": url,
-                            "title": title,
-                            "status": fetch_result.status,
-                            "error": fetch_result.error or "No content returned",
-                        }
+                        DomainFetchResult(
+                            entry_id=entry_id,
+                            url=url,
+                            title=title,
+                            status=fetch_result.status,
+                            error=fetch_result.error or "No content returned",
+                        )
                     )
                     failed_count += 1
                     self._progress.entries_failed = failed_count
-                    self._update_entry_status(entry_id, "error", fetch_result.error or "No content")
-                    await self._notify_update()
+                    self._update_entry_status(state, "error", fetch_result.error or "No content")
+                    await self._maybe_notify(force=True, background=True)
                     workflow.logger.warning(
                         f"Fetch failed: {fetch_result.error or 'no content'}",
                         extra={"entry_id": entry_id},
@@ -241,18 +348,19 @@ class DomainFetchWorkflow(ProgressNotificationMixin):
             except Exception as e:
                 error_msg = str(e)
                 results.append(
-                    {
-                        "entry_id": entry_id,
-                        "url": url,
-                        "title": title,
-                        "status": "failed",
-                        "error": error_msg,
-                    }
+                    DomainFetchResult(
+                        entry_id=entry_id,
+                        url=url,
+                        title=title,
+                        status="failed",
+                        error=error_msg,
+                    )
                 )
                 failed_count += 1
+                success_streak = 0
                 self._progress.entries_failed = failed_count
-                self._update_entry_status(entry_id, "error", error_msg)
-                await self._notify_update()
+                self._update_entry_status(state, "error", error_msg)
+                await self._maybe_notify(force=True, background=True)
                 workflow.logger.error(
                     f"Failed to fetch entry: {error_msg}", extra={"entry_id": entry_id}
                 )
@@ -4,6 +4,7 @@ Embedding Backfill Workflow.
 Computes embeddings for entries that have content but no embedding.
 """
 
+import asyncio
 from datetime import timedelta
 
 from temporalio import workflow
@@ -14,6 +15,7 @@ with workflow.unsafe.imports_passed_through():
         compute_embeddings,
         get_entries_for_embedding,
     )
+    from buun_curator.config import get_config
     from buun_curator.models import (
         ComputeEmbeddingsInput,
         ComputeEmbeddingsOutput,
@@ -32,7 +34,8 @@ class EmbeddingBackfillWorkflow:
     Workflow for backfilling embeddings.
 
     Fetches entries that have content but no embedding,
-    computes embeddings in batches, and saves them.
+    computes embeddings in batches, and saves them. The next batch is
+    fetched while earlier batches are being embedded.
     """
 
     @workflow.run
@@ -63,11 +66,34 @@ class EmbeddingBackfillWorkflow:
         computed_count = 0
         saved_count = 0
         cursor: str | None = None
+        concurrency = max(1, input.concurrency)
+        # compute_embeddings activities still running; the next page is fetched
+        # while they run, and at most `concurrency` batches are embedded at once
+        in_flight: list[workflow.ActivityHandle[ComputeEmbeddingsOutput]] = []
+
+        def collect(done: list[workflow.ActivityHandle[ComputeEmbeddingsOutput]]) -> None:
+            nonlocal computed_count, saved_count
+            for handle in done:
+                embedding_result = handle.result()
+                computed_count += embedding_result.computed_count
+                saved_count += embedding_result.saved_count
+
+                workflow.logger.info(
+                    "Batch complete",
+                    extra={
+                        "computed": embedding_result.computed_count,
+                        "saved": embedding_result.saved_count,
+                    },
+                )
+
+                if embedding_result.error:
+                    workflow.logger.warning(f"Batch error: {embedding_result.error}")
 
         # Process entries in batches
         while True:
-            # 1. Get entries that need embeddings
-            get_result: GetEntriesForEmbeddingOutput = await workflow.execute_activity(
+            # 1. Get entries that need embeddings (keyset cursor on entry ID, so
+            # pages do not depend on embeddings saved by in-flight batches)
+            get_result: GetEntriesForEmbeddingOutput = await workflow.execute_local_activity(
                 get_entries_for_embedding,
                 GetEntriesForEmbeddingInput(
                     batch_size=input.batch_size,
@@ -93,32 +119,27 @@ class EmbeddingBackfillWorkflow:
                 },
             )
 
-            # 2. Compute embeddings for this batch
-            embedding_result: ComputeEmbeddingsOutput = await workflow.execute_activity(
-                compute_embeddings,
-                ComputeEmbeddingsInput(entry_ids=get_result.entry_ids),
-                start_to_close_timeout=timedelta(minutes=10),
-                heartbeat_timeout=timedelta(minutes=2),
-                retry_policy=RetryPolicy(
-                    maximum_attempts=2,
-                    initial_interval=timedelta(seconds=5),
-                ),
+            # 2. Wait for a free slot, then start embedding this batch
+            if len(in_flight) >= concurrency:
+                done, in_flight = await workflow.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                collect(done)
+
+            in_flight.append(
+                workflow.start_activity(
+                    compute_embeddings,
+                    ComputeEmbeddingsInput(entry_ids=get_result.entry_ids),
+                    task_queue=get_config().heavy_task_queue,
+                    start_to_close_timeout=timedelta(minutes=10),
+                    heartbeat_timeout=timedelta(minutes=2),
+                    retry_policy=RetryPolicy(
+                        maximum_attempts=2,
+                        initial_interval=timedelta(seconds=5),
+                    ),
+                )
             )
 
-            computed_count += embedding_result.computed_count
-            saved_count += embedding_result.saved_count
-
-            workflow.logger.info(
-                "Batch complete",
-                extra={
-                    "computed": embedding_result.computed_count,
-                    "saved": embedding_result.saved_count,
-                },
-            )
-
-            if embedding_result.error:
-                workflow.logger.warning(f"Batch error: {embedding_result.error}")
-
             # Check if there are more entries
             if not get_result.has_more:
                 workflow.logger.info("No more entries")
@@ -126,6 +147,10 @@ class EmbeddingBackfillWorkflow:
 
             cursor = get_result.end_cursor
 
+        if in_flight:
+            done, _ = await workflow.wait(in_flight)
+            collect(done)
+
         workflow.logger.info(
             "EmbeddingBackfillWorkflow end",
             extra={
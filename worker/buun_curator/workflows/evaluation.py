@@ -22,6 +22,7 @@ with workflow.unsafe.imports_passed_through():
         evaluate_ragas,
         evaluate_summarization,
     )
+    from buun_curator.config import get_config
     from buun_curator.models.workflow_io import (
         EvaluationInput,
         EvaluationResult,
@@ -74,6 +75,7 @@ class EvaluationWorkflow:
                 contexts=input.contexts,
                 answer=input.answer,
             ),
+            task_queue=get_config().heavy_task_queue,
             start_to_close_timeout=timedelta(minutes=5),
             retry_policy=RetryPolicy(
                 maximum_attempts=2,
@@ -152,6 +154,7 @@ class SummarizationEvaluationWorkflow:
                 items=activity_items,
                 max_samples=input.max_samples,
             ),
+            task_queue=get_config().heavy_task_queue,
             start_to_close_timeout=timedelta(minutes=10),
             retry_policy=RetryPolicy(
                 maximum_attempts=2,
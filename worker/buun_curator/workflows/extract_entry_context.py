@@ -17,6 +17,7 @@ with workflow.unsafe.imports_passed_through():
         add_to_graph_rag_session,
         reset_graph_rag_session,
     )
+    from buun_curator.config import get_config
     from buun_curator.models import (
         AddToGraphRAGSessionInput,
         ExtractEntryContextActivityInput,
@@ -88,7 +89,7 @@ class ExtractEntryContextWorkflow:
         )
 
         # Step 1: Fetch entry data
-        entry_result = await workflow.execute_activity(
+        entry_result = await workflow.execute_local_activity(
             get_entry,
             GetEntryInput(entry_id=input.entry_id),
             start_to_close_timeout=timedelta(seconds=30),
@@ -165,6 +166,7 @@ class ExtractEntryContextWorkflow:
                 content=content,
                 source_type="entry",
             ),
+            task_queue=get_config().heavy_task_queue,
             start_to_close_timeout=timedelta(seconds=120),
             retry_policy=retry_policy,
         )
@@ -17,6 +17,7 @@ with workflow.unsafe.imports_passed_through():
         get_entry,
         mark_entries_graph_added,
     )
+    from buun_curator.config import get_config
     from buun_curator.models import (
         AddToGlobalGraphBulkInput,
         AddToGlobalGraphBulkOutput,
@@ -106,7 +107,7 @@ class GlobalGraphUpdateWorkflow:
 
         for entry_id in entry_ids:
             try:
-                entry_result: GetEntryOutput = await workflow.execute_activity(
+                entry_result: GetEntryOutput = await workflow.execute_local_activity(
                     get_entry,
                     GetEntryInput(entry_id=entry_id),
                     start_to_close_timeout=timedelta(seconds=30),
@@ -145,6 +146,7 @@ class GlobalGraphUpdateWorkflow:
             bulk_result: AddToGlobalGraphBulkOutput = await workflow.execute_activity(
                 add_to_global_graph_bulk,
                 AddToGlobalGraphBulkInput(episodes=episodes),
+                task_queue=get_config().heavy_task_queue,
                 start_to_close_timeout=timedelta(minutes=10),
                 retry_policy=RetryPolicy(
                     maximum_attempts=2,
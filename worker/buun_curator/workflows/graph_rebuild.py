@@ -15,6 +15,7 @@ with workflow.unsafe.imports_passed_through():
         reset_global_graph,
     )
     from buun_curator.activities.search import get_entry_ids_for_indexing
+    from buun_curator.config import get_config
     from buun_curator.models import (
         FetchAndAddToGraphBulkInput,
         FetchAndAddToGraphBulkOutput,
@@ -134,6 +135,7 @@ class GraphRebuildWorkflow:
             bulk_result: FetchAndAddToGraphBulkOutput = await workflow.execute_activity(
                 fetch_and_add_to_graph_bulk,
                 FetchAndAddToGraphBulkInput(entry_ids=ids_result.entry_ids),
+                task_queue=get_config().heavy_task_queue,
                 start_to_close_timeout=timedelta(hours=2),
                 retry_policy=RetryPolicy(maximum_attempts=2),
             )
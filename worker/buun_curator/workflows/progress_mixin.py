@@ -6,24 +6,60 @@ Throttling is handled inside the notify_update activity (per workflow ID).
 """
 
 from datetime import timedelta
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from temporalio import workflow
+from temporalio.common import RetryPolicy
 
 if TYPE_CHECKING:
+    from temporalio.workflow import ActivityHandle
+
     from buun_curator.models import WorkflowProgress
 
 with workflow.unsafe.imports_passed_through():
     from buun_curator.activities import NotifyProgressInput, notify_progress
 
+# Progress updates coalesced into one notification by _maybe_notify
+NOTIFY_COALESCE_EVERY = 5
+
+_NOTIFY_TIMEOUT = timedelta(seconds=5)
+# Background notifications queue behind other activities on the activity
+# workers; give up on a snapshot that could not even start in time
+_NOTIFY_SCHEDULE_TO_CLOSE_TIMEOUT = timedelta(seconds=30)
+# Best-effort: never hold the workflow on a failing notification
+_NOTIFY_RETRY_POLICY = RetryPolicy(maximum_attempts=2)
+
+
+def _notify_input(progress: "WorkflowProgress") -> NotifyProgressInput:
+    """Build the notify_progress input for the current workflow."""
+    return NotifyProgressInput(
+        workflow_id=workflow.info().workflow_id,
+        progress=progress.model_dump(by_alias=True),
+    )
+
 
 class HasProgress(Protocol):
     """Protocol for workflows that have a get_progress method."""
 
+    _pending_notifications: int
+    _inflight_notification: "ActivityHandle[Any] | None"
+
     def get_progress(self) -> "WorkflowProgress":
         """Return current workflow progress."""
         ...
 
+    async def _drain_notification(self) -> None:
+        """Wait for the outstanding background notification, if any."""
+        ...
+
+    async def _notify_update(self) -> None:
+        """Send progress update notification."""
+        ...
+
+    async def _notify_update_nowait(self) -> None:
+        """Send progress update notification in the background."""
+        ...
+
 
 class ProgressNotificationMixin:
     """
@@ -33,12 +69,33 @@ class ProgressNotificationMixin:
     -----
     1. Inherit from this mixin: `class MyWorkflow(ProgressNotificationMixin):`
     2. Define `get_progress()` method decorated with `@workflow.query`
-    3. Call `await self._notify_update()` to send notifications
+    3. Call `await self._notify_update()` to send notifications, or
+       `await self._maybe_notify()` in loops that update progress often
+       (`background=True` sends it as a regular activity without waiting)
 
     Throttling is handled inside the notify_update activity to ensure
     deterministic workflow execution.
     """
 
+    _pending_notifications = 0
+    _inflight_notification: "ActivityHandle[Any] | None" = None
+
+    async def _drain_notification(self: "HasProgress") -> None:
+        """
+        Wait for the outstanding background notification, if any.
+
+        Called before a blocking notification so that an older progress
+        snapshot can never arrive after a newer one (e.g. the final status).
+        """
+        inflight = self._inflight_notification
+        if inflight is None:
+            return
+        self._inflight_notification = None
+        try:
+            await inflight
+        except Exception as e:
+            workflow.logger.warning(f"Failed to send progress notification: {e}")
+
     async def _notify_update(self: "HasProgress") -> None:
         """
         Send progress update notification via SSE (fire-and-forget).
@@ -48,15 +105,75 @@ class ProgressNotificationMixin:
 
         Throttling is handled inside the activity (per workflow ID).
         """
+        await self._drain_notification()
+        self._pending_notifications = 0
         try:
-            progress = self.get_progress()
             await workflow.execute_local_activity(
                 notify_progress,
-                NotifyProgressInput(
-                    workflow_id=workflow.info().workflow_id,
-                    progress=progress.model_dump(by_alias=True),
-                ),
-                start_to_close_timeout=timedelta(seconds=10),
+                _notify_input(self.get_progress()),
+                start_to_close_timeout=_NOTIFY_TIMEOUT,
+                retry_policy=_NOTIFY_RETRY_POLICY,
             )
         except Exception as e:
             workflow.logger.warning(f"Failed to send progress notification: {e}")
+
+    async def _notify_update_nowait(self: "HasProgress") -> None:
+        """
+        Send progress update notification as a regular activity, without waiting.
+
+        Unlike the local activity used by _notify_update(), a regular activity
+        does not hold the workflow task open, so the workflow's next commands
+        (timers, activities) are sent to the server right away. At most one
+        background notification is outstanding: while it is, newer snapshots
+        are skipped and the pending count is kept, so the next update retries.
+        """
+        inflight = self._inflight_notification
+        if inflight is not None:
+            if not inflight.done():
+                return
+            # Already resolved: collect the result without blocking
+            await self._drain_notification()
+
+        self._pending_notifications = 0
+        try:
+            self._inflight_notification = workflow.start_activity(
+                notify_progress,
+                _notify_input(self.get_progress()),
+                start_to_close_timeout=_NOTIFY_TIMEOUT,
+                schedule_to_close_timeout=_NOTIFY_SCHEDULE_TO_CLOSE_TIMEOUT,
+                retry_policy=_NOTIFY_RETRY_POLICY,
+            )
+        except Exception as e:
+            workflow.logger.warning(f"Failed to send progress notification: {e}")
+
+    async def _maybe_notify(
+        self: "HasProgress",
+        force: bool = False,
+        every: int = NOTIFY_COALESCE_EVERY,
+        background: bool = False,
+    ) -> None:
+        """
+        Send a progress notification for every Nth update (coalesced).
+
+        Each notification is a local activity recorded in workflow history,
+        so loops that update progress per item call this instead of
+        _notify_update() to keep history small. Any direct _notify_update()
+        call resets the count.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Send immediately regardless of the count (default: False).
+        every : int, optional
+            Number of updates coalesced into one notification
+            (default: NOTIFY_COALESCE_EVERY).
+        background : bool, optional
+            Send via _notify_update_nowait() instead of waiting for delivery
+            (default: False).
+        """
+        self._pending_notifications += 1
+        if force or self._pending_notifications >= every:
+            if background:
+                await self._notify_update_nowait()
+            else:
+                await self._notify_update()
@@ -11,6 +11,8 @@ sent to ContentDistillationWorkflow in configurable batch sizes (fire-and-forget
 
 import asyncio
 import hashlib
+import itertools
+import math
 from datetime import timedelta
 from urllib.parse import urlparse
 
@@ -18,6 +20,7 @@ from temporalio import workflow
 from temporalio.workflow import ParentClosePolicy
 
 with workflow.unsafe.imports_passed_through():
+    from buun_curator.config import get_config
     from buun_curator.models.workflow_io import (
         ContentDistillationInput,
         DomainFetchInput,
@@ -31,6 +34,15 @@ with workflow.unsafe.imports_passed_through():
     from buun_curator.workflows.domain_fetch import DomainFetchWorkflow
     from buun_curator.workflows.progress_mixin import ProgressNotificationMixin
 
+# Handle of a per-domain child workflow started by ScheduleFetchWorkflow
+_DomainHandle = workflow.ChildWorkflowHandle[DomainFetchWorkflow, DomainFetchOutput]
+
+# Execution timeout of each DomainFetchWorkflow child
+DOMAIN_FETCH_TIMEOUT = timedelta(minutes=30)
+
+# Extra time on top of the domain windows for grouping and starting distillation
+SCHEDULE_FETCH_TIMEOUT_MARGIN = timedelta(minutes=5)
+
 
 def _extract_domain(url: str) -> str:
     """
@@ -53,6 +65,29 @@ def _extract_domain(url: str) -> str:
         return "unknown"
 
 
+def schedule_fetch_timeout(entries: list[dict]) -> timedelta:
+    """
+    Compute an execution timeout for a ScheduleFetchWorkflow run.
+
+    At most DOMAIN_FETCH_CONCURRENCY domains are fetched at once, so the run
+    can take one DOMAIN_FETCH_TIMEOUT per window of domains in the worst case.
+
+    Parameters
+    ----------
+    entries : list[dict]
+        Entries passed to ScheduleFetchWorkflow (with url field).
+
+    Returns
+    -------
+    timedelta
+        Timeout covering every window of domain children plus a margin.
+    """
+    domain_count = len({_extract_domain(entry.get("url", "")) for entry in entries})
+    concurrency = max(1, get_config().domain_fetch_concurrency)
+    windows = max(1, math.ceil(domain_count / concurrency))
+    return DOMAIN_FETCH_TIMEOUT * windows + SCHEDULE_FETCH_TIMEOUT_MARGIN
+
+
 async def _group_entries_by_domain(entries: list[dict]) -> dict[str, list[dict]]:
     """
     Group entries by their URL domain.
@@ -108,8 +143,8 @@ class ScheduleFetchWorkflow(ProgressNotificationMixin):
     Workflow for scheduling content fetches with domain-based rate limiting.
 
     Groups entries by domain and processes each domain in parallel via child
-    workflows. Within each domain, requests are sequential with configurable
-    delays to avoid rate limiting.
+    workflows (bounded by domain_fetch_concurrency). Within each domain,
+    requests are sequential with configurable delays to avoid rate limiting.
 
     This approach ensures:
     - Different domains are fetched in parallel for efficiency
@@ -235,10 +270,15 @@ class ScheduleFetchWorkflow(ProgressNotificationMixin):
             },
         )
 
-        # Start child workflows for each domain (parallel)
-        child_handles: list[tuple[str, workflow.ChildWorkflowHandle]] = []
+        # Start child workflows for each domain (parallel, bounded so that the
+        # total request rate stays below concurrency / delay_seconds). Child
+        # handles are asyncio Tasks themselves, so they are waited on directly
+        # with workflow.wait, which returns completions in a deterministic order
+        pending_domains = iter(by_domain.items())
+        concurrency = max(1, get_config().domain_fetch_concurrency)
+        in_flight: dict[_DomainHandle, str] = {}
 
-        for i, (domain, domain_entries) in enumerate(by_domain.items()):
+        async def start_domain(domain: str, domain_entries: list[dict]) -> _DomainHandle:
             # Create unique child workflow ID
             hash_input = f"{wf_info.workflow_id}:{wf_info.run_id}:{domain}"
             unique_suffix = hashlib.sha1(hash_input.encode()).hexdigest()[:7]
@@ -253,7 +293,7 @@ class ScheduleFetchWorkflow(ProgressNotificationMixin):
                 },
             )
 
-            handle = await workflow.start_child_workflow(
+            return await workflow.start_child_workflow(
                 DomainFetchWorkflow.run,
                 DomainFetchInput(
                     domain=domain,
@@ -264,17 +304,24 @@ class ScheduleFetchWorkflow(ProgressNotificationMixin):
                     auto_distill=input.auto_distill,
                     target_language=input.target_language,
                     parent_workflow_id=wf_info.workflow_id,
+                    sort_by_size=input.sort_by_size,
                 ),
                 id=child_wf_id,
-                execution_timeout=timedelta(minutes=30),
+                execution_timeout=DOMAIN_FETCH_TIMEOUT,
             )
-            child_handles.append((domain, handle))
 
-            # Yield control periodically to avoid deadlock detection
-            if (i + 1) % 10 == 0:
-                await workflow.sleep(timedelta(seconds=0))
+        async def start_domains(count: int) -> None:
+            # Issue all start commands together so they complete in one
+            # workflow task instead of one round trip per child
+            batch = list(itertools.islice(pending_domains, count))
+            handles = await asyncio.gather(
+                *(start_domain(domain, domain_entries) for domain, domain_entries in batch)
+            )
+            for (domain, _), handle in zip(batch, handles, strict=True):
+                in_flight[handle] = domain
+
+        await start_domains(concurrency)
 
-        # Wait for child workflows using asyncio.wait with FIRST_COMPLETED
         # Start distillation as entries become available
         all_fetched_entry_ids: list[str] = []
         total_success = 0
@@ -282,31 +329,17 @@ class ScheduleFetchWorkflow(ProgressNotificationMixin):
         total_distilled = 0
         distill_workflow_count = 0
 
-        # Helper to wrap handle in awaitable coroutine for asyncio.wait
-        async def await_handle(h: workflow.ChildWorkflowHandle) -> DomainFetchOutput:  # type: ignore[type-arg]
-            return await h
-
-        # Map task -> domain for tracking
-        pending_tasks: dict[asyncio.Task[DomainFetchOutput], str] = {}
-        for domain, handle in child_handles:
-            # Wrap handle in a task for asyncio.wait compatibility
-            task = asyncio.create_task(await_handle(handle))
-            pending_tasks[task] = domain
-
         # Entries waiting to be distilled
         pending_entries: list[str] = []
 
-        while pending_tasks:
-            # Wait for at least one task to complete
-            done, _ = await asyncio.wait(
-                pending_tasks.keys(),
-                return_when=asyncio.FIRST_COMPLETED,
-            )
+        while in_flight:
+            # Wait for at least one domain to complete
+            done, _ = await workflow.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
 
-            for task in done:
-                domain = pending_tasks.pop(task)
+            for handle in done:
+                domain = in_flight.pop(handle)
                 try:
-                    result: DomainFetchOutput = task.result()
+                    result = handle.result()
                     workflow.logger.info(
                         "DomainFetchWorkflow completed",
                         extra={
@@ -343,6 +376,9 @@ class ScheduleFetchWorkflow(ProgressNotificationMixin):
                     self._progress.updated_at = workflow_now_iso()
                     await self._notify_update()
 
+            # Refill the window with as many domains as just finished
+            await start_domains(len(done))
+
             # Start distillation for batches of distillation_batch_size entries
             if input.auto_distill:
                 while len(pending_entries) >= input.distillation_batch_size:
@@ -15,6 +15,7 @@ with workflow.unsafe.imports_passed_through():
         get_entry_ids_for_indexing,
         index_entries_batch,
         init_search_index,
+        wait_for_search_task,
     )
     from buun_curator.models import (
         ClearSearchIndexInput,
@@ -25,6 +26,8 @@ with workflow.unsafe.imports_passed_through():
         IndexEntriesBatchOutput,
         InitSearchIndexInput,
         InitSearchIndexOutput,
+        WaitForSearchTaskInput,
+        WaitForSearchTaskOutput,
     )
     from buun_curator.models.workflow_io import (
         SearchReindexInput,
@@ -36,6 +39,36 @@ with workflow.unsafe.imports_passed_through():
 class SearchReindexWorkflow:
     """Workflow for rebuilding the Meilisearch index."""
 
+    async def _clear_task_error(self, task_uid: int | None) -> str | None:
+        """
+        Check the final status of the enqueued index deletion task.
+
+        Parameters
+        ----------
+        task_uid : int | None
+            UID of the deletion task, or None if the index was not cleared.
+
+        Returns
+        -------
+        str | None
+            Error message if the deletion task did not succeed, otherwise None.
+        """
+        if task_uid is None:
+            return None
+
+        wait_result: WaitForSearchTaskOutput = await workflow.execute_activity(
+            wait_for_search_task,
+            WaitForSearchTaskInput(task_uid=task_uid),
+            start_to_close_timeout=timedelta(minutes=6),
+            retry_policy=RetryPolicy(maximum_attempts=3),
+        )
+        if wait_result.success:
+            return None
+
+        error = f"Failed to clear index: {wait_result.error or 'deletion task failed'}"
+        workflow.logger.error(error, extra={"task_uid": task_uid})
+        return error
+
     @workflow.run
     async def run(self, input: SearchReindexInput) -> SearchReindexOutput:
         """
@@ -64,7 +97,10 @@ class SearchReindexWorkflow:
             },
         )
 
-        # 0. Optionally clear all documents first
+        # 0. Optionally clear all documents first. The deletion is only enqueued;
+        # Meilisearch runs an index's tasks in order, so its outcome is checked
+        # once before reporting completion.
+        clear_task_uid: int | None = None
         if input.clean:
             workflow.logger.info("Clearing all documents from index...")
             clear_result: ClearSearchIndexOutput = await workflow.execute_activity(
@@ -80,7 +116,8 @@ class SearchReindexWorkflow:
                     status="error",
                     error=clear_result.error or "Failed to clear index",
                 )
-            workflow.logger.info("Index cleared successfully")
+            clear_task_uid = clear_result.task_uid
+            workflow.logger.info("Index clear enqueued", extra={"task_uid": clear_task_uid})
 
         # 1. Initialize index settings
         workflow.logger.info("Initializing search index...")
@@ -112,6 +149,9 @@ class SearchReindexWorkflow:
 
         if total_count == 0:
             workflow.logger.info("No entries to index")
+            clear_error = await self._clear_task_error(clear_task_uid)
+            if clear_error:
+                return SearchReindexOutput(status="error", total_count=0, error=clear_error)
             return SearchReindexOutput(
                 status="completed",
                 indexed_count=0,
@@ -193,6 +233,15 @@ class SearchReindexWorkflow:
                 error=f"{error_count} batch(es) failed: {last_error}",
             )
 
+        clear_error = await self._clear_task_error(clear_task_uid)
+        if clear_error:
+            return SearchReindexOutput(
+                status="error",
+                indexed_count=indexed_count,
+                total_count=total_count,
+                error=clear_error,
+            )
+
         workflow.logger.info(
             "SearchReindexWorkflow end",
             extra={
@@ -41,7 +41,10 @@ with workflow.unsafe.imports_passed_through():
     from buun_curator.utils.date import workflow_now_iso
     from buun_curator.workflows.content_distillation import ContentDistillationWorkflow
     from buun_curator.workflows.progress_mixin import ProgressNotificationMixin
-    from buun_curator.workflows.schedule_fetch import ScheduleFetchWorkflow
+    from buun_curator.workflows.schedule_fetch import (
+        ScheduleFetchWorkflow,
+        schedule_fetch_timeout,
+    )
 
 
 @workflow.defn
@@ -118,7 +121,7 @@ class SingleFeedIngestionWorkflow(ProgressNotificationMixin):
 
         # 0. Fetch feed options from API (to get accurate fetch_limit)
         # This ensures we always use the correct fetch_limit from the database
-        feed_options: GetFeedOptionsOutput = await workflow.execute_activity(
+        feed_options: GetFeedOptionsOutput = await workflow.execute_local_activity(
             get_feed_options,
             GetFeedOptionsInput(feed_id=feed_id),
             start_to_close_timeout=timedelta(minutes=1),
@@ -216,7 +219,7 @@ class SingleFeedIngestionWorkflow(ProgressNotificationMixin):
         # Get target language from app settings if not provided (needed for distillation)
         target_language = input.target_language
         if input.auto_distill and not target_language:
-            settings_result: GetAppSettingsOutput = await workflow.execute_activity(
+            settings_result: GetAppSettingsOutput = await workflow.execute_local_activity(
                 get_app_settings,
                 GetAppSettingsInput(),
                 start_to_close_timeout=timedelta(minutes=1),
@@ -265,7 +268,7 @@ class SingleFeedIngestionWorkflow(ProgressNotificationMixin):
                     distillation_batch_size=input.distillation_batch_size,
                 ),
                 id=fetch_wf_id,
-                execution_timeout=timedelta(minutes=30),
+                execution_timeout=schedule_fetch_timeout(new_entries),
             )
             fetched_entry_ids = fetch_result.fetched_entry_ids
             contents_fetched = fetch_result.success_count
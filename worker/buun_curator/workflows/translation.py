@@ -140,7 +140,7 @@ class TranslationWorkflow(ProgressNotificationMixin):
         wf_info = workflow.info()
 
         # 0. Get app settings (target language)
-        settings_result: GetAppSettingsOutput = await workflow.execute_activity(
+        settings_result: GetAppSettingsOutput = await workflow.execute_local_activity(
             get_app_settings,
             GetAppSettingsInput(),
             start_to_close_timeout=timedelta(minutes=1),
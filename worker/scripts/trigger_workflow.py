@@ -650,6 +650,7 @@ async def run_deep_research(
     task_queue: str,
     entry_id: str,
     query: str,
+    force_rebuild: bool = False,
 ) -> None:
     """Run the deep research workflow."""
     workflow_id = f"deep-research-{entry_id}-{ULID()}"
@@ -660,7 +661,7 @@ async def run_deep_research(
 
     handle = await client.start_workflow(
         DeepResearchWorkflow.run,
-        DeepResearchInput(entry_id=entry_id, query=query),
+        DeepResearchInput(entry_id=entry_id, query=query, force_rebuild=force_rebuild),
         id=workflow_id,
         task_queue=task_queue,
     )
@@ -1088,6 +1089,11 @@ async def main() -> None:
         "query",
         help="Research query",
     )
+    deep_research_parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="Rebuild the graph even if it was built from the same content",
+    )
 
     # Graph rebuild command
     graph_rebuild_parser = subparsers.add_parser(
@@ -1234,6 +1240,7 @@ async def main() -> None:
             config.task_queue,
             entry_id=args.entry_id,
             query=args.query,
+            force_rebuild=args.force_rebuild,
         )
     elif args.command == "graph-rebuild":
         await run_graph_rebuild(
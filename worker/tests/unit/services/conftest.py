@@ -2,6 +2,8 @@
 Pytest fixtures for service tests.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -97,7 +99,7 @@ def mock_crawler_timeout() -> MagicMock:
 @pytest.fixture
 def patch_async_web_crawler() -> Any:
     """
-    Patch AsyncWebCrawler context manager with mock crawler.
+    Patch AsyncWebCrawler with mock crawler and reset the shared crawler.
 
     Returns a function that creates the patch with custom crawler.
     Usage:
@@ -105,14 +107,18 @@ def patch_async_web_crawler() -> Any:
             result = await fetcher.fetch(url)
     """
 
-    def create_patch(crawler_mock: MagicMock) -> Any:
-        async_cm = MagicMock()
-        async_cm.__aenter__ = AsyncMock(return_value=crawler_mock)
-        async_cm.__aexit__ = AsyncMock(return_value=None)
+    @contextmanager
+    def create_patch(crawler_mock: MagicMock) -> Iterator[MagicMock]:
+        crawler_mock.start = AsyncMock(return_value=crawler_mock)
+        crawler_mock.close = AsyncMock(return_value=None)
 
-        return patch(
-            "buun_curator.services.content.AsyncWebCrawler",
-            return_value=async_cm,
-        )
+        with (
+            patch(
+                "buun_curator.services.content.AsyncWebCrawler",
+                return_value=crawler_mock,
+            ) as crawler_class,
+            patch("buun_curator.services.content._crawler", None),
+        ):
+            yield crawler_class
 
     return create_patch
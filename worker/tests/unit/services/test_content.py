@@ -2,6 +2,7 @@
 Tests for content fetcher service.
 """
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -11,9 +12,31 @@ from buun_curator.services.content import (
     ContentFetcher,
     ImagePreservingFilter,
     _normalize_text,
+    _parse_retry_after,
     _post_process_content,
 )
 
+# =============================================================================
+# Tests for _parse_retry_after
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"retry-after": "30"}, 30.0),
+        ({"Retry-After": " 5 "}, 5.0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+        ({"Content-Type": "text/html"}, None),
+        (None, None),
+    ],
+)
+def test_parse_retry_after(headers: dict[str, str] | None, expected: float | None) -> None:
+    """Should parse delta-seconds and past HTTP dates, ignoring invalid values."""
+    assert _parse_retry_after(headers) == expected
+
+
 # =============================================================================
 # Tests for _normalize_text
 # =============================================================================
@@ -294,6 +317,71 @@ async def test_fetch_timeout(
     assert result.raw_html == ""
 
 
+@pytest.mark.asyncio
+async def test_fetch_reuses_shared_crawler(
+    mock_crawler: MagicMock,
+    patch_async_web_crawler: Any,
+) -> None:
+    """Should start one browser and reuse it across fetchers."""
+    with patch_async_web_crawler(mock_crawler) as crawler_class:
+        await ContentFetcher().fetch("https://example.com/a")
+        await ContentFetcher().fetch("https://example.com/b")
+
+    crawler_class.assert_called_once()
+    mock_crawler.start.assert_called_once()
+    assert mock_crawler.arun.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_discards_crawler_on_error(
+    mock_crawler: MagicMock,
+    patch_async_web_crawler: Any,
+) -> None:
+    """Should drop a crawler whose browser raised and start a new one next time."""
+    mock_crawler.arun.side_effect = [RuntimeError("browser closed"), mock_crawler.arun.return_value]
+
+    with patch_async_web_crawler(mock_crawler) as crawler_class:
+        failed = await ContentFetcher().fetch("https://example.com/a")
+        result = await ContentFetcher().fetch("https://example.com/a")
+
+    assert failed.full_content == ""
+    assert result.full_content != ""
+    mock_crawler.close.assert_called_once()
+    assert crawler_class.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_keeps_crawler_open_for_concurrent_fetches(
+    mock_crawler: MagicMock,
+    mock_crawl_result_success: MagicMock,
+    patch_async_web_crawler: Any,
+) -> None:
+    """Should close a failed crawler only after concurrent fetches stop using it."""
+    release = asyncio.Event()
+
+    async def arun(url: str, config: Any) -> list[MagicMock]:
+        if url.endswith("/broken"):
+            raise RuntimeError("browser closed")
+        await release.wait()
+        return [mock_crawl_result_success]
+
+    mock_crawler.arun = AsyncMock(side_effect=arun)
+
+    with patch_async_web_crawler(mock_crawler):
+        slow = asyncio.create_task(ContentFetcher().fetch("https://example.com/slow"))
+        await asyncio.sleep(0)
+        failed = await ContentFetcher().fetch("https://example.com/broken")
+
+        mock_crawler.close.assert_not_called()
+
+        release.set()
+        result = await slow
+
+    assert failed.full_content == ""
+    assert result.full_content != ""
+    mock_crawler.close.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_fetch_with_extraction_rules(
     mock_crawler: MagicMock,
@@ -0,0 +1,283 @@
+"""
+Tests for Meilisearch search service.
+"""
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from meilisearch.errors import MeilisearchApiError
+
+from buun_curator.services import search
+
+
+@pytest.fixture
+def mock_client() -> Iterator[MagicMock]:
+    """
+    Mock Meilisearch client returned by get_meilisearch_client.
+    """
+    client = MagicMock()
+    with patch.object(search, "get_meilisearch_client", return_value=client):
+        yield client
+
+
+def _entry(entry_id: str) -> dict:
+    return {"id": entry_id, "title": f"Entry {entry_id}", "feedId": "feed-1"}
+
+
+# =============================================================================
+# Tests for index_entries
+# =============================================================================
+
+
+def test_index_entries_splits_into_batches(mock_client: MagicMock) -> None:
+    """Should submit one add_documents call per batch."""
+    entries = [_entry(str(i)) for i in range(5)]
+
+    assert search.index_entries(entries, batch_size=2) is True
+
+    index = mock_client.index.return_value
+    sizes = [len(call.args[0]) for call in index.add_documents.call_args_list]
+    assert sizes == [2, 2, 1]
+    mock_client.wait_for_task.assert_not_called()
+
+
+def test_index_entries_returns_false_on_error(mock_client: MagicMock) -> None:
+    """Should return False when a batch fails."""
+    mock_client.index.return_value.add_documents.side_effect = RuntimeError("boom")
+
+    assert search.index_entries([_entry("1")]) is False
+
+
+# =============================================================================
+# Tests for remove_entries
+# =============================================================================
+
+
+def test_remove_entries_splits_into_batches(mock_client: MagicMock) -> None:
+    """Should submit one delete_documents call per batch without waiting."""
+    assert search.remove_entries(["a", "b", "c"], batch_size=2) is True
+
+    index = mock_client.index.return_value
+    batches = [call.args[0] for call in index.delete_documents.call_args_list]
+    assert batches == [["a", "b"], ["c"]]
+    mock_client.wait_for_task.assert_not_called()
+
+
+def test_remove_entries_waits_for_last_task(mock_client: MagicMock) -> None:
+    """Should wait only for the final task when wait=True."""
+    index = mock_client.index.return_value
+    index.delete_documents.side_effect = [MagicMock(task_uid=1), MagicMock(task_uid=2)]
+    mock_client.get_task.return_value = MagicMock(status="succeeded")
+
+    assert search.remove_entries(["a", "b", "c"], batch_size=2, wait=True) is True
+
+    mock_client.get_task.assert_called_once_with(2)
+
+
+# =============================================================================
+# Tests for delete_all_documents
+# =============================================================================
+
+
+def test_delete_all_documents_does_not_wait_by_default(mock_client: MagicMock) -> None:
+    """Should return the task UID without polling the task."""
+    index = mock_client.index.return_value
+    index.delete_all_documents.return_value = MagicMock(task_uid=7)
+
+    assert search.delete_all_documents() == (True, 7)
+
+    mock_client.get_task.assert_not_called()
+    mock_client.wait_for_task.assert_not_called()
+
+
+def test_delete_all_documents_wait_polls_until_done(mock_client: MagicMock) -> None:
+    """Should poll the task with backoff until it succeeds."""
+    index = mock_client.index.return_value
+    index.delete_all_documents.return_value = MagicMock(task_uid=7)
+    mock_client.get_task.side_effect = [
+        MagicMock(status="enqueued"),
+        MagicMock(status="processing"),
+        MagicMock(status="succeeded"),
+    ]
+
+    with patch.object(search.time, "sleep") as mock_sleep:
+        assert search.delete_all_documents(wait=True) == (True, 7)
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_delete_all_documents_wait_reports_failed_task(mock_client: MagicMock) -> None:
+    """Should return False when the deletion task fails."""
+    index = mock_client.index.return_value
+    index.delete_all_documents.return_value = MagicMock(task_uid=7)
+    mock_client.get_task.return_value = MagicMock(status="failed")
+
+    assert search.delete_all_documents(wait=True) == (False, None)
+
+
+def test_wait_for_task_reports_success(mock_client: MagicMock) -> None:
+    """Should return success once the task has succeeded."""
+    mock_client.get_task.return_value = MagicMock(status="succeeded")
+
+    assert search.wait_for_task(7) == (True, None)
+    mock_client.get_task.assert_called_once_with(7)
+
+
+def test_wait_for_task_reports_failure(mock_client: MagicMock) -> None:
+    """Should return the error when the task failed."""
+    mock_client.get_task.return_value = MagicMock(status="failed", error="disk full")
+
+    success, error = search.wait_for_task(7)
+
+    assert success is False
+    assert error is not None and "disk full" in error
+
+
+# =============================================================================
+# Tests for get_all_document_ids
+# =============================================================================
+
+
+def test_get_all_document_ids_uses_keyset_pagination(mock_client: MagicMock) -> None:
+    """Should page with an id filter seeded from the last seen id."""
+    index = mock_client.index.return_value
+    index.get_documents.side_effect = [
+        MagicMock(results=[{"id": "a"}, {"id": "b"}]),
+        MagicMock(results=[{"id": "c"}]),
+    ]
+
+    assert search.get_all_document_ids(batch_size=2) == ["a", "b", "c"]
+
+    params = [call.args[0] for call in index.get_documents.call_args_list]
+    assert [p["filter"] for p in params] == ['id > ""', 'id > "b"']
+    assert all(p["sort"] == ["id:asc"] for p in params)
+    assert all("offset" not in p for p in params)
+
+
+def test_get_all_document_ids_falls_back_to_offset(mock_client: MagicMock) -> None:
+    """Should use offset pagination when the server rejects the keyset request."""
+    response = MagicMock(status_code=400, text="")
+    index = mock_client.index.return_value
+    index.get_documents.side_effect = [
+        MeilisearchApiError("invalid_document_sort", response),
+        MagicMock(results=[{"id": "a"}, {"id": "b"}]),
+        MagicMock(results=[{"id": "c"}]),
+    ]
+
+    assert search.get_all_document_ids(batch_size=2) == ["a", "b", "c"]
+
+    params = [call.args[0] for call in index.get_documents.call_args_list[1:]]
+    assert [p["offset"] for p in params] == [0, 2]
+    assert all("filter" not in p for p in params)
+
+
+def test_get_all_document_ids_stops_without_progress(mock_client: MagicMock) -> None:
+    """Should stop instead of repeating a full page that has no usable ids."""
+    index = mock_client.index.return_value
+    index.get_documents.return_value = MagicMock(results=[{"id": ""}, {"name": "x"}])
+
+    assert search.get_all_document_ids(batch_size=2) == []
+
+    index.get_documents.assert_called_once()
+
+
+# =============================================================================
+# Tests for datetime_to_timestamp
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-02T03:04:05Z",
+        "2024-01-02T03:04:05.123456Z",
+        "2024-01-02T03:04:05+00:00",
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+    ],
+)
+def test_datetime_to_timestamp_utc(value: str | datetime) -> None:
+    """Should convert ISO strings (including trailing Z) and datetimes."""
+    assert search.datetime_to_timestamp(value) == 1704164645
+
+
+def test_datetime_to_timestamp_none() -> None:
+    """Should return None for None input."""
+    assert search.datetime_to_timestamp(None) is None
+
+
+# =============================================================================
+# Tests for initialize_index
+# =============================================================================
+
+
+@pytest.fixture
+def clear_verified_indexes() -> Iterator[None]:
+    """
+    Reset the per-process cache of verified index settings.
+    """
+    search._verified_indexes.clear()
+    yield
+    search._verified_indexes.clear()
+
+
+@pytest.mark.usefixtures("clear_verified_indexes")
+def test_initialize_index_skips_matching_settings(mock_client: MagicMock) -> None:
+    """Should only update settings that differ from the current ones."""
+    index = mock_client.index.return_value
+    current = dict(search._INDEX_SETTINGS)
+    current["filterableAttributes"] = list(reversed(current["filterableAttributes"]))
+    current["sortableAttributes"] = ["publishedAt", "createdAt"]
+    current["typoTolerance"] = {
+        "enabled": True,
+        "minWordSizeForTypos": {"oneTypo": 4, "twoTypos": 8},
+        "disableOnWords": [],
+    }
+    index.get_settings.return_value = current
+
+    assert search.initialize_index() is True
+
+    index.update_sortable_attributes.assert_called_once()
+    index.update_searchable_attributes.assert_not_called()
+    index.update_filterable_attributes.assert_not_called()
+    index.update_ranking_rules.assert_not_called()
+    index.update_typo_tolerance.assert_not_called()
+
+
+@pytest.mark.usefixtures("clear_verified_indexes")
+def test_initialize_index_verifies_once_per_process(mock_client: MagicMock) -> None:
+    """Should not query settings again after a successful initialization."""
+    index = mock_client.index.return_value
+    index.get_settings.return_value = {}
+
+    assert search.initialize_index() is True
+    assert search.initialize_index() is True
+
+    index.get_settings.assert_called_once()
+    index.update_searchable_attributes.assert_called_once()
+
+
+# =============================================================================
+# Tests for settings snapshot
+# =============================================================================
+
+
+def test_reload_settings_rereads_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Should read env once and pick up changes only after reload_settings."""
+    monkeypatch.setenv("MEILISEARCH_HOST", "meili:7700")
+    monkeypatch.setenv("MEILISEARCH_API_KEY", "key")
+    monkeypatch.setenv("MEILISEARCH_INDEX", "first")
+    search.reload_settings()
+    try:
+        assert search.is_meilisearch_enabled() is True
+        assert search.get_index_name() == "first"
+
+        monkeypatch.setenv("MEILISEARCH_INDEX", "second")
+        assert search.get_index_name() == "first"
+
+        search.reload_settings()
+        assert search.get_index_name() == "second"
+    finally:
+        monkeypatch.undo()
+        search.reload_settings()
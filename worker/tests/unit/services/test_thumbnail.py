@@ -0,0 +1,99 @@
+"""
+Tests for thumbnail service.
+"""
+
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from buun_curator.services import thumbnail
+from buun_curator.services.thumbnail import (
+    THUMBNAIL_HEIGHT,
+    THUMBNAIL_WIDTH,
+    ThumbnailService,
+)
+
+
+def _encode(mode: str, size: tuple[int, int], fmt: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+# =============================================================================
+# Tests for _process_screenshot
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    ("mode", "size", "fmt"),
+    [
+        ("RGBA", (1280, 4000), "PNG"),
+        ("RGB", (3000, 1000), "JPEG"),
+        ("P", (320, 200), "PNG"),
+    ],
+)
+def test_process_screenshot_returns_fixed_size_jpeg(
+    mode: str, size: tuple[int, int], fmt: str
+) -> None:
+    """Should always produce a JPEG of the configured thumbnail size."""
+    service = ThumbnailService(MagicMock())
+
+    result = service._process_screenshot(_encode(mode, size, fmt))
+
+    img = Image.open(io.BytesIO(result))
+    assert img.format == "JPEG"
+    assert img.size == (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+
+
+# =============================================================================
+# Tests for upload_thumbnails_batch
+# =============================================================================
+
+
+async def test_upload_thumbnails_batch_omits_failed_uploads() -> None:
+    """Should return URLs for successful uploads and skip failed ones."""
+    service = ThumbnailService(MagicMock())
+
+    async def fake_upload(entry_id: str, screenshot_data: bytes) -> str:
+        if entry_id == "bad":
+            raise RuntimeError("upload failed")
+        return f"https://cdn.example.com/{entry_id}.jpg"
+
+    service.upload_thumbnail = AsyncMock(side_effect=fake_upload)
+
+    result = await service.upload_thumbnails_batch(
+        [("a", b"png"), ("bad", b"png"), ("b", b"png")], max_concurrency=2
+    )
+
+    assert result == {
+        "a": "https://cdn.example.com/a.jpg",
+        "b": "https://cdn.example.com/b.jpg",
+    }
+
+
+# =============================================================================
+# Tests for shared S3 clients
+# =============================================================================
+
+
+async def test_get_client_is_shared_across_instances() -> None:
+    """Should create one S3 client for all services with the same settings."""
+    config = MagicMock(s3_region="us-east-1", s3_endpoint="http://minio:9000")
+    session = MagicMock()
+    session.create_client.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+    session.create_client.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    with patch.object(thumbnail, "get_session", return_value=session):
+        thumbnail._session = None
+        try:
+            first = await ThumbnailService(config)._get_client()
+            second = await ThumbnailService(config)._get_client()
+        finally:
+            await thumbnail.close_shared_clients()
+            thumbnail._session = None
+
+    assert first is second
+    session.create_client.assert_called_once()
@@ -108,6 +108,31 @@ class TestDistillationBatchSize:
             assert config.distillation_batch_size == value, f"Failed for value {value}"
 
 
+class TestHeavyTaskQueue:
+    """Tests for heavy_task_queue configuration."""
+
+    def test_defaults_to_task_queue_suffix(
+        self, monkeypatch: pytest.MonkeyPatch, required_env_vars: None
+    ) -> None:
+        """Test that heavy_task_queue is derived from TEMPORAL_TASK_QUEUE."""
+        monkeypatch.setenv("TEMPORAL_TASK_QUEUE", "curator")
+        monkeypatch.delenv("TEMPORAL_HEAVY_TASK_QUEUE", raising=False)
+
+        config = Config.from_env()
+
+        assert config.heavy_task_queue == "curator-heavy"
+
+    def test_from_env_reads_env_var(
+        self, monkeypatch: pytest.MonkeyPatch, required_env_vars: None
+    ) -> None:
+        """Test that TEMPORAL_HEAVY_TASK_QUEUE overrides the derived name."""
+        monkeypatch.setenv("TEMPORAL_HEAVY_TASK_QUEUE", "llm-queue")
+
+        config = Config.from_env()
+
+        assert config.heavy_task_queue == "llm-queue"
+
+
 class TestWorkflowInputDefaults:
     """Tests for workflow input model default values."""
 
@@ -0,0 +1,61 @@
+"""
+Tests for worker health checks.
+"""
+
+import socket
+import urllib.request
+from unittest.mock import AsyncMock, MagicMock
+
+from buun_curator.health import HealthServer, TaskActivityTracker
+
+# =============================================================================
+# Tests for TaskActivityTracker
+# =============================================================================
+
+
+def test_tracker_reports_no_task_initially() -> None:
+    """Should not report recent activity before any task arrives."""
+    assert TaskActivityTracker().seen_within(30.0) is False
+
+
+async def test_tracker_records_activity_execution() -> None:
+    """Should record task arrival when an activity executes."""
+    tracker = TaskActivityTracker()
+    next_inbound = MagicMock()
+    next_inbound.execute_activity = AsyncMock(return_value="done")
+
+    inbound = tracker.intercept_activity(next_inbound)
+    result = await inbound.execute_activity(MagicMock())
+
+    assert result == "done"
+    assert tracker.seen_within(30.0) is True
+    assert tracker.seen_within(0.0) is False
+
+
+# =============================================================================
+# Tests for HealthServer threading
+# =============================================================================
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_health_server_serves_from_own_thread() -> None:
+    """Should answer /health from a dedicated thread and stop cleanly."""
+    port = _free_port()
+
+    async def healthy() -> bool:
+        return True
+
+    server = HealthServer(port=port, health_check=healthy)
+    server.start_in_thread()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=5) as resp:
+            assert resp.status == 200
+    finally:
+        server.stop_thread()
+
+    assert server._thread is None
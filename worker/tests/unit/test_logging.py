@@ -0,0 +1,88 @@
+"""
+Tests for structured logging configuration.
+
+Verifies that the strip_temporal_context processor removes Temporal context
+dicts from log messages.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from buun_curator import logging as buun_logging
+from buun_curator.logging import strip_temporal_context
+
+
+def _strip(event: str, logger: str = "temporalio.workflow") -> str:
+    event_dict = strip_temporal_context(None, "info", {"event": event, "logger": logger})
+    return event_dict["event"]
+
+
+# =============================================================================
+# Tests for strip_temporal_context
+# =============================================================================
+
+
+def test_strips_single_quoted_dict_suffix() -> None:
+    """Should strip ({'key': 'value'}) suffix from messages."""
+    msg = "Completing activity as failed ({'activity_id': '5', 'activity_type': 'distill'})"
+    assert _strip(msg) == "Completing activity as failed"
+
+
+def test_strips_double_quoted_dict_suffix() -> None:
+    """Should strip ({"key": "value"}) suffix from messages."""
+    msg = 'Completing activity as failed ({"activity_id": "5", "activity_type": "distill"})'
+    assert _strip(msg) == "Completing activity as failed"
+
+
+@pytest.mark.parametrize(
+    "msg",
+    [
+        "Normal log message without context",
+        "Processing entry (total: 5)",
+        "",
+    ],
+)
+def test_preserves_message_without_dict_suffix(msg: str) -> None:
+    """Should leave messages without a context dict untouched."""
+    assert _strip(msg) == msg
+
+
+def test_handles_complex_nested_dict() -> None:
+    """Should strip context dicts that contain nested values."""
+    msg = "Activity failed ({'attempt': 2, 'namespace': 'buun-curator', 'workflow_id': 'test-123'})"
+    assert _strip(msg) == "Activity failed"
+
+
+def test_handles_message_with_multiple_parentheses() -> None:
+    """Should strip only the trailing dict, preserving other parentheses."""
+    msg = "Processing (step 1 of 3) completed ({'status': 'ok'})"
+    assert _strip(msg) == "Processing (step 1 of 3) completed"
+
+
+def test_real_temporal_activity_failed_message() -> None:
+    """Should handle a real Temporal SDK activity failure message."""
+    msg = (
+        "Completing activity as failed ({'activity_id': '5', "
+        "'activity_type': 'distill_entry_content', 'attempt': 2, "
+        "'namespace': 'buun-curator', 'task_queue': 'buun-curator', "
+        "'workflow_id': 'distill-reprocess-70ffafe', "
+        "'workflow_run_id': '019be071-60f9-7be9-b162-d5e9fbc490d5', "
+        "'workflow_type': 'ContentDistillationWorkflow'})"
+    )
+    assert _strip(msg, logger="temporalio.activity") == "Completing activity as failed"
+
+
+def test_ignores_non_temporal_loggers() -> None:
+    """Should only rewrite messages from temporalio loggers."""
+    msg = "Loaded settings ({'mode': 'fast'})"
+    assert _strip(msg, logger="buun_curator.services") == msg
+
+
+def test_skips_regex_without_context_marker() -> None:
+    """Should not run the regex for messages that cannot carry a context dict."""
+    with patch.object(buun_logging, "_TEMPORAL_CONTEXT_RE") as regex:
+        assert _strip("Processing entry (total: 5)") == "Processing entry (total: 5)"
+        assert _strip("Worker started") == "Worker started"
+
+    regex.match.assert_not_called()
@@ -0,0 +1,58 @@
+"""
+Tests for URL normalization utilities.
+"""
+
+import pytest
+from url_normalize import url_normalize
+
+from buun_curator.utils.url import normalize_url_for_dedup
+
+
+def _reference_normalize(url: str) -> str:
+    """Normalize using url-normalize only (previous behavior)."""
+    normalized = url_normalize(url, filter_params=True, param_allowlist=[])
+    assert normalized is not None
+    scheme, rest = normalized.split("://", 1)
+    netloc, _, path = rest.partition("/")
+    path = ("/" + path).split("#", 1)[0].split("?", 1)[0].rstrip("/") or "/"
+    return f"{scheme}://{netloc}{path}"
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("http://example.com", "http://example.com/"),
+        ("http://example.com/?foo=1", "http://example.com/"),
+        ("HTTP://EXAMPLE.COM/Path#sec", "http://example.com/Path"),
+        ("https://Example.com:443/a/b/", "https://example.com/a/b"),
+        ("http://example.com:8080/a", "http://example.com:8080/a"),
+    ],
+)
+def test_normalize_url_for_dedup(url: str, expected: str) -> None:
+    """Should normalize scheme, host, port, query, fragment and trailing slash."""
+    assert normalize_url_for_dedup(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/Owner/Repo/?tab=readme#install",
+        "http://EXAMPLE.com:80/a/../b/",
+        "https://例え.jp/パス?q=1",
+        "http://example.com/a%7eb",
+        "http://example.com/a b",
+        "http://User@Example.com/p/",
+        "http://[::1]:80/p",
+        "http://example.com/a;v=1/",
+        "https://Example.com./a",
+        "https://example.com//a//b",
+        "http://example.com:0080/x",
+        "http://example.com:/x",
+        "http://example.com:8080/x",
+        "https://example.com:443/x",
+        "http://example.com:443/x",
+    ],
+)
+def test_normalize_url_for_dedup_matches_url_normalize(url: str) -> None:
+    """Fast path and fallback should agree with url-normalize."""
+    assert normalize_url_for_dedup(url) == _reference_normalize(url)
@@ -0,0 +1,38 @@
+"""
+Tests for YouTube URL detection utilities.
+"""
+
+import pytest
+
+from buun_curator.utils.youtube import extract_youtube_video_id, is_youtube_url
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "http://youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://youtube.com/shorts/dQw4w9WgXcQ",
+        "youtu.be/dQw4w9WgXcQ",
+    ],
+)
+def test_extract_youtube_video_id_supported_formats(url: str) -> None:
+    """Should extract the video ID from all supported URL formats."""
+    assert extract_youtube_video_id(url) == "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/channel/UC1234567890",
+        "https://youtu.be/short",
+        "",
+    ],
+)
+def test_extract_youtube_video_id_returns_none(url: str) -> None:
+    """Should return None for non-video URLs."""
+    assert extract_youtube_video_id(url) is None
+    assert is_youtube_url(url) is False
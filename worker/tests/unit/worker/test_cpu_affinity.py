@@ -0,0 +1,87 @@
+"""
+Tests for worker CPU affinity.
+"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from buun_curator import worker
+from buun_curator.worker import apply_cpu_affinity, parse_cpulist
+
+# =============================================================================
+# Tests for parse_cpulist
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    ("cpulist", "expected"),
+    [
+        ("0", {0}),
+        ("0-3", {0, 1, 2, 3}),
+        ("0-1,4,6-7\n", {0, 1, 4, 6, 7}),
+    ],
+)
+def test_parse_cpulist(cpulist: str, expected: set[int]) -> None:
+    """Should expand single CPUs and inclusive ranges."""
+    assert parse_cpulist(cpulist) == expected
+
+
+def test_parse_cpulist_rejects_garbage() -> None:
+    """Should raise ValueError for invalid input."""
+    with pytest.raises(ValueError):
+        parse_cpulist("node0")
+
+
+# =============================================================================
+# Tests for apply_cpu_affinity
+# =============================================================================
+
+
+@pytest.fixture
+def affinity_calls() -> Iterator[list[set[int]]]:
+    """
+    Fake 8-CPU affinity syscalls, recording every sched_setaffinity call.
+    """
+    calls: list[set[int]] = []
+    with (
+        patch.object(os, "sched_getaffinity", return_value=set(range(8)), create=True),
+        patch.object(
+            os, "sched_setaffinity", side_effect=lambda _, c: calls.append(c), create=True
+        ),
+    ):
+        yield calls
+
+
+def test_apply_cpu_affinity_disabled(affinity_calls: list[set[int]]) -> None:
+    """Should leave affinity untouched when unset."""
+    assert apply_cpu_affinity("") is None
+    assert affinity_calls == []
+
+
+def test_apply_cpu_affinity_numa(tmp_path: Path, affinity_calls: list[set[int]]) -> None:
+    """Should pin to the CPUs of NUMA node 0."""
+    cpulist = tmp_path / "cpulist"
+    cpulist.write_text("0-3\n")
+
+    with patch.object(worker, "NUMA_NODE0_CPULIST", cpulist):
+        assert apply_cpu_affinity("numa") == {0, 1, 2, 3}
+
+    assert affinity_calls == [{0, 1, 2, 3}]
+
+
+def test_apply_cpu_affinity_numa_missing(tmp_path: Path, affinity_calls: list[set[int]]) -> None:
+    """Should skip pinning on hosts without NUMA topology."""
+    with patch.object(worker, "NUMA_NODE0_CPULIST", tmp_path / "missing"):
+        assert apply_cpu_affinity("numa") is None
+
+    assert affinity_calls == []
+
+
+def test_apply_cpu_affinity_limits_to_allowed(affinity_calls: list[set[int]]) -> None:
+    """Should drop CPUs outside the current allowed set."""
+    assert apply_cpu_affinity("6-11") == {6, 7}
+    assert affinity_calls == [{6, 7}]
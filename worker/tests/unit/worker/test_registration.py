@@ -0,0 +1,56 @@
+"""
+Tests for worker workflow/activity registration.
+"""
+
+import pytest
+
+from buun_curator.worker import (
+    _ACTIVITIES,
+    _HEAVY_ACTIVITIES,
+    _LOCAL_ACTIVITIES,
+    _WORKFLOWS,
+    registrations_for_role,
+)
+
+
+def test_activity_sets_are_disjoint() -> None:
+    """Should register each activity on exactly one task queue."""
+    assert not set(_ACTIVITIES) & set(_HEAVY_ACTIVITIES)
+
+
+def test_local_activities_are_main_queue_activities() -> None:
+    """Should register local activities with the main activity set."""
+    assert set(_LOCAL_ACTIVITIES) <= set(_ACTIVITIES)
+
+
+def test_registrations_have_no_duplicates() -> None:
+    """Should not list any workflow or activity twice."""
+    assert len(set(_WORKFLOWS)) == len(_WORKFLOWS)
+    assert len(set(_ACTIVITIES)) == len(_ACTIVITIES)
+    assert len(set(_HEAVY_ACTIVITIES)) == len(_HEAVY_ACTIVITIES)
+
+
+# =============================================================================
+# Tests for registrations_for_role
+# =============================================================================
+
+
+def test_role_both_registers_everything() -> None:
+    """Should register workflows and both activity sets."""
+    assert registrations_for_role("both") == (_WORKFLOWS, _ACTIVITIES, _HEAVY_ACTIVITIES)
+
+
+def test_role_workflow_registers_only_local_activities() -> None:
+    """Should register workflows plus the local activities they call."""
+    assert registrations_for_role("workflow") == (_WORKFLOWS, _LOCAL_ACTIVITIES, ())
+
+
+def test_role_activity_skips_workflows() -> None:
+    """Should register only activities for activity workers."""
+    assert registrations_for_role("activity") == ((), _ACTIVITIES, _HEAVY_ACTIVITIES)
+
+
+def test_invalid_role_raises() -> None:
+    """Should reject unknown roles."""
+    with pytest.raises(ValueError, match="WORKER_ROLE"):
+        registrations_for_role("poller")
@@ -0,0 +1,61 @@
+"""
+Tests for worker concurrency tuning.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from buun_curator.worker import (
+    build_worker_tuning,
+    default_activity_slots,
+    default_heavy_activity_slots,
+)
+
+
+def _config(activities: int = 0, workflow_tasks: int = 0, local_activities: int = 0) -> MagicMock:
+    return MagicMock(
+        max_concurrent_activities=activities,
+        max_concurrent_workflow_tasks=workflow_tasks,
+        max_concurrent_local_activities=local_activities,
+    )
+
+
+# =============================================================================
+# Tests for default slot counts
+# =============================================================================
+
+
+@pytest.mark.parametrize(("cpu_count", "expected"), [(1, 32), (4, 64), (64, 200)])
+def test_default_activity_slots_is_clamped(cpu_count: int, expected: int) -> None:
+    """Should scale with CPU count between 32 and 200 slots."""
+    assert default_activity_slots(cpu_count) == expected
+
+
+@pytest.mark.parametrize(("cpu_count", "expected"), [(1, 4), (16, 16)])
+def test_default_heavy_activity_slots(cpu_count: int, expected: int) -> None:
+    """Should use one slot per CPU with a minimum of four."""
+    assert default_heavy_activity_slots(cpu_count) == expected
+
+
+# =============================================================================
+# Tests for build_worker_tuning
+# =============================================================================
+
+
+def test_build_worker_tuning_uses_tuner_when_unset() -> None:
+    """Should return a resource-based tuner when no limits are configured."""
+    tuning = build_worker_tuning(_config(), cpu_count=4)
+
+    assert set(tuning) == {"tuner"}
+
+
+def test_build_worker_tuning_uses_fixed_limits_when_set() -> None:
+    """Should use fixed limits and fill the activity limit when only one is set."""
+    tuning = build_worker_tuning(_config(workflow_tasks=10), cpu_count=4)
+
+    assert tuning == {
+        "max_concurrent_activities": 64,
+        "max_concurrent_workflow_tasks": 10,
+        "max_concurrent_local_activities": None,
+    }
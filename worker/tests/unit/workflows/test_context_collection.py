@@ -0,0 +1,238 @@
+"""Tests for ContextCollectionWorkflow helper functions."""
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from buun_curator.models.context import (
+    ContentType,
+    EntityInfo,
+    EntityRole,
+    EntityType,
+    EntryContext,
+    ExtractedLink,
+    Relationship,
+    RelationType,
+    SubjectDomain,
+)
+from buun_curator.workflows import context_collection
+from buun_curator.workflows.context_collection import (
+    _analyze_contexts,
+    _canonicalize_entity_name,
+    _collect_enrichment_candidates,
+    _collect_entry_links,
+    _create_enrichment_candidates,
+    _execute_per_entry,
+    _extract_github_urls,
+)
+
+
+def _context(entity_names: list[str], urls: list[str]) -> EntryContext:
+    return EntryContext(
+        domain=SubjectDomain.SOFTWARE,
+        content_type=ContentType.NEWS,
+        language="en",
+        confidence=0.9,
+        entities=[EntityInfo(name=name, type=EntityType.SOFTWARE) for name in entity_names],
+        extracted_links=[ExtractedLink(text="link", url=url) for url in urls],
+    )
+
+
+# Tests for _extract_github_urls
+
+
+@pytest.mark.parametrize(
+    ("url", "repo_name"),
+    [
+        ("https://github.com/owner/repo", "repo"),
+        ("http://github.com/owner/Repo/", "repo"),
+        ("https://github.com/owner/repo.git", "repo"),
+        ("https://github.com/owner/repo/tree/main/src", "repo"),
+        ("https://github.com/owner/repo?tab=readme", "repo"),
+        ("https://github.com/owner/repo#install", "repo"),
+        ("https://github.com/owner/owner.github.io", "owner.github.io"),
+    ],
+)
+def test_extract_github_urls_repo_name(url: str, repo_name: str) -> None:
+    """Map the lowercased repo name (without .git) to the original URL."""
+    links = [ExtractedLink(text="link", url=url)]
+    assert _extract_github_urls(links) == {repo_name: url}
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://github.com/owner",
+        "https://github.com/owner/",
+        "https://gitlab.com/owner/repo",
+        "https://example.com/?u=https://github.com/owner/repo",
+    ],
+)
+def test_extract_github_urls_ignores_non_repo_urls(url: str) -> None:
+    """Ignore URLs that are not GitHub repository URLs."""
+    links = [ExtractedLink(text="link", url=url)]
+    assert _extract_github_urls(links) == {}
+
+
+# Tests for _create_enrichment_candidates
+
+
+def test_create_enrichment_candidates_prefers_exact_repo_match() -> None:
+    """Use the repo whose normalized name equals the entity name."""
+    context = _context(
+        ["Foo.js"],
+        ["https://github.com/acme/foojs-plugins", "https://github.com/acme/foo-js"],
+    )
+
+    candidates = _create_enrichment_candidates(context)
+
+    assert [c.github_url_hint for c in candidates] == ["https://github.com/acme/foo-js"]
+
+
+def test_create_enrichment_candidates_falls_back_to_substring_match() -> None:
+    """Use a repo containing the entity name when there is no exact match."""
+    context = _context(["Foo"], ["https://github.com/acme/foo-native"])
+
+    candidates = _create_enrichment_candidates(context)
+
+    assert [c.github_url_hint for c in candidates] == ["https://github.com/acme/foo-native"]
+
+
+def test_create_enrichment_candidates_uses_first_creator_as_owner_hint() -> None:
+    """Take the owner hint from the entity's first createdBy relationship."""
+    context = _context(["Foo"], [])
+    context.relationships = [
+        Relationship(source="Foo", relation=RelationType.CREATED_BY, target="Acme"),
+        Relationship(source="Foo", relation=RelationType.CREATED_BY, target="Other"),
+    ]
+
+    candidates = _create_enrichment_candidates(context)
+
+    assert [(c.entity_type, c.owner_hint) for c in candidates] == [("Software", "Acme")]
+
+
+def test_create_enrichment_candidates_filters_domain_and_role() -> None:
+    """Skip non-software domains and entities that are only mentioned."""
+    context = _context(["Foo", "Bar"], [])
+    context.entities[1].role = EntityRole.MENTIONED
+
+    assert [c.name for c in _create_enrichment_candidates(context)] == ["Foo"]
+
+    context.domain = SubjectDomain.POLITICS
+    assert _create_enrichment_candidates(context) == []
+
+
+def test_create_enrichment_candidates_skips_well_known_spelling_variants() -> None:
+    """Skip well-known software regardless of punctuation and spacing."""
+    context = _context(["Node.js", "NodeJS", "VS Code", "VSCode", "Foo"], [])
+
+    assert [c.name for c in _create_enrichment_candidates(context)] == ["Foo"]
+
+
+# Tests for _analyze_contexts
+
+
+def test_analyze_contexts_summarizes_all_contexts() -> None:
+    """Report distributions, common entities and suggestions."""
+    contexts = [_context(["Foo", "Bar"], []), _context(["Foo"], [])]
+
+    plan = _analyze_contexts(contexts)
+
+    assert plan == [
+        "Extracted 2 entry contexts",
+        "Domain distribution: {'software': 2}",
+        "Total entities extracted: 3",
+        "Entity type distribution: {'Software': 3}",
+        "Total relationships extracted: 0",
+        "Common entities across entries: ['Foo (2)']",
+        "--- Suggested Next Steps ---",
+        "SUGGEST: Build knowledge graph connections for common entities",
+        "SUGGEST: Enrich 3 entities without descriptions",
+    ]
+
+
+# Tests for _canonicalize_entity_name
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("PyTorch", "pytorch"),
+        ("  pytorch. ", "pytorch"),
+        ("@pytorch", "pytorch"),
+        ("#PyTorch!", "pytorch"),
+        ("Hugging   Face", "hugging face"),
+        ("Notepad++", "notepad++"),
+    ],
+)
+def test_canonicalize_entity_name(name: str, expected: str) -> None:
+    """Normalize case, handles, trailing punctuation and whitespace."""
+    assert _canonicalize_entity_name(name) == expected
+
+
+# Tests for _collect_enrichment_candidates
+
+
+def test_collect_enrichment_candidates_dedupes_spelling_variants() -> None:
+    """Keep one candidate per canonical name with its first spelling."""
+    contexts = [_context(["PyTorch"], []), _context(["@pytorch", "pytorch."], [])]
+
+    candidates = _collect_enrichment_candidates(contexts)
+
+    assert [c.name for c in candidates] == ["PyTorch"]
+
+
+# Tests for _collect_entry_links
+
+
+def test_collect_entry_links_keeps_shortest_title() -> None:
+    """Dedupe by normalized URL, preferring any title and then the shortest."""
+    context = _context([], [])
+    context.extracted_links = [
+        ExtractedLink(text="", url="https://example.com/a"),
+        ExtractedLink(text="A long title", url="https://example.com/a/"),
+        ExtractedLink(text="Short", url="https://EXAMPLE.com/a?ref=1"),
+        ExtractedLink(text="Longer again", url="https://example.com/a"),
+        ExtractedLink(text="B", url="https://example.com/b"),
+    ]
+
+    links = _collect_entry_links([context])
+
+    assert [(link.url, link.title) for link in links] == [
+        ("https://example.com/a", "Short"),
+        ("https://example.com/b", "B"),
+    ]
+
+
+def test_collect_entry_links_without_links() -> None:
+    """Return no links when no context has extracted links."""
+    assert _collect_entry_links([_context(["Foo"], []), _context([], [])]) == []
+
+
+# Tests for _execute_per_entry
+
+
+async def test_execute_per_entry_bounds_concurrency() -> None:
+    """Run at most `concurrency` activities at once, returning results in order."""
+    running = 0
+    peak = 0
+
+    async def fake_execute(activity_fn: Any, activity_input: int, **kwargs: Any) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if activity_input == 3:
+            raise RuntimeError("boom")
+        return activity_input * 10
+
+    with patch.object(context_collection.workflow, "execute_activity", fake_execute):
+        results = await _execute_per_entry(lambda: None, list(range(6)), concurrency=2)
+
+    assert peak == 2
+    assert results[:3] == [0, 10, 20]
+    assert isinstance(results[3], RuntimeError)
+    assert results[4:] == [40, 50]
@@ -0,0 +1,97 @@
+"""Tests for DomainFetchWorkflow helpers."""
+
+import pytest
+
+from buun_curator.models import EntryProgressState, FetchSingleContentOutput
+from buun_curator.workflows.domain_fetch import (
+    ADAPTIVE_DELAY_MAX_SECONDS,
+    DomainFetchWorkflow,
+    _adapt_delay,
+    _sort_by_size_hint,
+)
+
+
+def test_adapt_delay_halves_after_success_streak() -> None:
+    """Halve the delay after three successes, not below a quarter of the base."""
+    success = FetchSingleContentOutput(status="success", status_code=200)
+
+    delay, streak = 2.0, 0
+    delays = []
+    for _ in range(9):
+        delay, streak = _adapt_delay(delay, 2.0, streak, success)
+        delays.append(delay)
+
+    assert delays == [2.0, 2.0, 1.0, 1.0, 1.0, 0.5, 0.5, 0.5, 0.5]
+
+
+@pytest.mark.parametrize(
+    ("result", "expected"),
+    [
+        (FetchSingleContentOutput(status="failed", status_code=429), 4.0),
+        (FetchSingleContentOutput(status="failed", status_code=503), 4.0),
+        (FetchSingleContentOutput(status="success", retry_after_seconds=30.0), 30.0),
+        (
+            FetchSingleContentOutput(status="failed", retry_after_seconds=3600.0),
+            ADAPTIVE_DELAY_MAX_SECONDS,
+        ),
+    ],
+)
+def test_adapt_delay_backs_off_on_throttling(
+    result: FetchSingleContentOutput, expected: float
+) -> None:
+    """Double the delay on 429/5xx and honor Retry-After up to the cap."""
+    assert _adapt_delay(2.0, 1.0, 2, result) == (expected, 0)
+
+
+def test_adapt_delay_backoff_restores_base_delay() -> None:
+    """Throttling after speeding up returns at least to the configured delay."""
+    throttled = FetchSingleContentOutput(status="failed", status_code=429)
+
+    assert _adapt_delay(0.25, 1.0, 0, throttled) == (1.0, 0)
+
+
+def test_adapt_delay_other_failures_reset_streak() -> None:
+    """Keep the delay but reset the streak on non-throttling failures."""
+    missing = FetchSingleContentOutput(status="no_content", status_code=404)
+
+    assert _adapt_delay(1.5, 1.0, 2, missing) == (1.5, 0)
+
+
+# Tests for DomainFetchWorkflow._track_entry
+
+
+def test_track_entry_keeps_most_recent_entries() -> None:
+    """Drop the oldest entries once the tracking limit is reached."""
+    wf = DomainFetchWorkflow()
+    wf._max_tracked = 2
+
+    for entry_id in ("a", "b", "c"):
+        wf._track_entry(entry_id, f"Title {entry_id}")
+
+    assert list(wf._progress.entry_progress) == ["b", "c"]
+    assert wf._progress.entry_progress["c"].title == "Title c"
+
+
+def test_track_entry_reuses_initialized_state() -> None:
+    """Return the pre-built state when all entries are tracked."""
+    wf = DomainFetchWorkflow()
+    state = EntryProgressState(entry_id="a", title="A")
+    wf._progress.entry_progress = {"a": state}
+
+    assert wf._track_entry("a", "A") is state
+
+
+def test_sort_by_size_hint_puts_unhinted_entries_last() -> None:
+    """Order hinted entries by ascending hint, then unhinted ones, both stably."""
+    entries = [
+        {"entry_id": "a", "content_size_hint": 5000},
+        {"entry_id": "b"},
+        {"entry_id": "c", "content_size_hint": 100},
+        {"entry_id": "d", "content_size_hint": None},
+        {"entry_id": "e", "content_size_hint": 100},
+        {"entry_id": "f", "content_size_hint": 0},
+    ]
+
+    ordered = _sort_by_size_hint(entries)
+
+    assert [entry["entry_id"] for entry in ordered] == ["c", "e", "a", "b", "d", "f"]
@@ -0,0 +1,164 @@
+"""
+Tests for ProgressNotificationMixin notification coalescing.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from buun_curator.workflows import progress_mixin
+from buun_curator.workflows.progress_mixin import (
+    NOTIFY_COALESCE_EVERY,
+    ProgressNotificationMixin,
+)
+
+
+class _Workflow(ProgressNotificationMixin):
+    def get_progress(self) -> MagicMock:
+        return MagicMock()
+
+
+@pytest.fixture
+def execute_local_activity() -> Iterator[AsyncMock]:
+    """
+    Patch the workflow API used to send notifications.
+    """
+    with (
+        patch.object(progress_mixin.workflow, "execute_local_activity") as execute,
+        patch.object(progress_mixin.workflow, "info"),
+    ):
+        yield execute
+
+
+# =============================================================================
+# Tests for _maybe_notify
+# =============================================================================
+
+
+async def test_maybe_notify_sends_every_nth_update(execute_local_activity: AsyncMock) -> None:
+    """Should send one notification per NOTIFY_COALESCE_EVERY updates."""
+    wf = _Workflow()
+
+    for _ in range(NOTIFY_COALESCE_EVERY * 2 + 1):
+        await wf._maybe_notify()
+
+    assert execute_local_activity.await_count == 2
+
+
+async def test_maybe_notify_custom_interval(execute_local_activity: AsyncMock) -> None:
+    """Should coalesce the given number of updates per notification."""
+    wf = _Workflow()
+
+    for _ in range(25):
+        await wf._maybe_notify(every=10)
+
+    assert execute_local_activity.await_count == 2
+
+
+async def test_maybe_notify_force_sends_immediately(execute_local_activity: AsyncMock) -> None:
+    """Should send right away when forced."""
+    wf = _Workflow()
+
+    await wf._maybe_notify(force=True)
+
+    assert execute_local_activity.await_count == 1
+
+
+async def test_notify_update_resets_pending_count(execute_local_activity: AsyncMock) -> None:
+    """Should restart coalescing after a direct notification."""
+    wf = _Workflow()
+
+    for _ in range(NOTIFY_COALESCE_EVERY - 1):
+        await wf._maybe_notify()
+    await wf._notify_update()
+    await wf._maybe_notify()
+
+    assert execute_local_activity.await_count == 1
+
+
+# =============================================================================
+# Tests for background notifications
+# =============================================================================
+
+
+def _finished(exc: Exception | None = None) -> asyncio.Future[None]:
+    future = asyncio.get_running_loop().create_future()
+    if exc is None:
+        future.set_result(None)
+    else:
+        future.set_exception(exc)
+    return future
+
+
+def _pending() -> asyncio.Future[None]:
+    return asyncio.get_running_loop().create_future()
+
+
+@pytest.fixture
+def start_activity() -> Iterator[MagicMock]:
+    """
+    Patch the workflow API used to start background notifications.
+    """
+    with patch.object(progress_mixin.workflow, "start_activity") as start:
+        start.side_effect = lambda *args, **kwargs: _finished()
+        yield start
+
+
+@pytest.mark.usefixtures("execute_local_activity")
+async def test_maybe_notify_background_does_not_wait(start_activity: MagicMock) -> None:
+    """Should start a regular activity and leave it outstanding."""
+    wf = _Workflow()
+
+    await wf._maybe_notify(force=True, background=True)
+
+    start_activity.assert_called_once()
+    assert wf._inflight_notification is not None
+
+
+@pytest.mark.usefixtures("execute_local_activity")
+async def test_maybe_notify_background_skips_while_outstanding(
+    start_activity: MagicMock,
+) -> None:
+    """Should not start another notification until the previous one resolves."""
+    pending = _pending()
+    start_activity.side_effect = [pending, _finished()]
+    wf = _Workflow()
+
+    await wf._maybe_notify(force=True, background=True)
+    for _ in range(NOTIFY_COALESCE_EVERY):
+        await wf._maybe_notify(background=True)
+    assert start_activity.call_count == 1
+
+    pending.set_result(None)
+    await wf._maybe_notify(background=True)
+
+    assert start_activity.call_count == 2
+
+
+async def test_notify_update_drains_background_notification(
+    execute_local_activity: AsyncMock, start_activity: MagicMock
+) -> None:
+    """Should wait for the outstanding notification before sending a new one."""
+    wf = _Workflow()
+
+    await wf._maybe_notify(force=True, background=True)
+    await wf._notify_update()
+
+    assert wf._inflight_notification is None
+    assert execute_local_activity.await_count == 1
+
+
+@pytest.mark.usefixtures("execute_local_activity")
+async def test_background_notification_failure_is_ignored(start_activity: MagicMock) -> None:
+    """Should log and continue when a background notification fails."""
+    start_activity.side_effect = lambda *args, **kwargs: _finished(RuntimeError("boom"))
+    wf = _Workflow()
+
+    with patch.object(progress_mixin.workflow, "logger") as logger:
+        await wf._maybe_notify(force=True, background=True)
+        await wf._maybe_notify(force=True, background=True)
+
+    assert start_activity.call_count == 2
+    logger.warning.assert_called_once()
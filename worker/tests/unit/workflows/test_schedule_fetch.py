@@ -1,11 +1,15 @@
 """Tests for ScheduleFetchWorkflow helper functions."""
 
+from datetime import timedelta
+from unittest.mock import patch
+
 import pytest
 
 from buun_curator.workflows.schedule_fetch import (
     _extract_domain,
     _group_entries_by_domain,
     _is_youtube_url,
+    schedule_fetch_timeout,
 )
 
 # Tests for _extract_domain
@@ -190,3 +194,34 @@ def test_is_youtube_url_empty() -> None:
 def test_is_youtube_url_http() -> None:
     """Detect HTTP YouTube URLs (not just HTTPS)."""
     assert _is_youtube_url("http://www.youtube.com/watch?v=abc123") is True
+
+
+# Tests for schedule_fetch_timeout
+
+
+def test_schedule_fetch_timeout_single_window() -> None:
+    """Test that domains fitting in one window get one child timeout."""
+    entries = [{"url": "https://example.com/1"}, {"url": "https://other.com/2"}]
+    with patch("buun_curator.workflows.schedule_fetch.get_config") as mock_config:
+        mock_config.return_value.domain_fetch_concurrency = 2
+        assert schedule_fetch_timeout(entries) == timedelta(minutes=35)
+
+
+def test_schedule_fetch_timeout_empty() -> None:
+    """Test that no entries still get one window."""
+    with patch("buun_curator.workflows.schedule_fetch.get_config") as mock_config:
+        mock_config.return_value.domain_fetch_concurrency = 2
+        assert schedule_fetch_timeout([]) == timedelta(minutes=35)
+
+
+def test_schedule_fetch_timeout_scales_with_domain_windows() -> None:
+    """Test that the timeout grows by one child timeout per window of domains."""
+    entries = [
+        {"url": "https://a.com/1"},
+        {"url": "https://a.com/2"},
+        {"url": "https://b.com/1"},
+        {"url": "https://c.com/1"},
+    ]
+    with patch("buun_curator.workflows.schedule_fetch.get_config") as mock_config:
+        mock_config.return_value.domain_fetch_concurrency = 2
+        assert schedule_fetch_timeout(entries) == timedelta(minutes=65)
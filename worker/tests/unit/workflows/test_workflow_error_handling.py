@@ -18,6 +18,7 @@ from temporalio.worker.workflow_sandbox import (
 )
 
 from buun_curator.activities.notify import NotifyOutput, NotifyProgressInput
+from buun_curator.config import get_config
 from buun_curator.models import (
     ComputeEmbeddingsInput,
     ComputeEmbeddingsOutput,
@@ -133,10 +134,14 @@ async def test_distill_activity_failure_notifies_sse(
             activities=[
                 mock_get_app_settings,
                 mock_get_entries,
-                mock_distill_entry_content,
                 mock_notify,
             ],
         ),
+        Worker(
+            env.client,
+            task_queue=get_config().heavy_task_queue,
+            activities=[mock_distill_entry_content],
+        ),
     ):
         # Execute workflow and expect it to fail
         with pytest.raises(WorkflowFailureError) as exc_info:
@@ -266,12 +271,15 @@ async def test_workflow_completes_successfully_on_no_error(
             activities=[
                 mock_get_app_settings,
                 mock_get_entries,
-                mock_distill_entry_content,
                 mock_save_distilled,
-                mock_compute_embeddings,
                 mock_notify,
             ],
         ),
+        Worker(
+            env.client,
+            task_queue=get_config().heavy_task_queue,
+            activities=[mock_distill_entry_content, mock_compute_embeddings],
+        ),
     ):
         # Execute workflow - should complete successfully
         result = await env.client.execute_workflow(